@@ -2,6 +2,7 @@
 调试 initializer 类型
 """
 import sys
+import functools
 from pathlib import Path
 
 # 添加 src 目录到路径
@@ -9,6 +10,18 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from ast_parser import JavaASTParser
 
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> JavaASTParser:
+    return JavaASTParser()
+
+
+@functools.lru_cache(maxsize=128)
+def _parse(java_code: str) -> dict:
+    """解析 Java 代码, 相同源码直接返回缓存的结构"""
+    return _get_parser().get_full_structure(java_code)
+
+
 # Java 示例代码
 java_code = """
 public class Person {
@@ -18,8 +31,7 @@ public class Person {
 }
 """
 
-parser = JavaASTParser()
-java_structure = parser.get_full_structure(java_code)
+java_structure = _parse(java_code)
 
 print("Java structure:")
 for cls in java_structure.get('classes', []):
@@ -3,6 +3,8 @@
 展示传统模式和 Agent 模式
 """
 import sys
+import functools
+import threading
 from pathlib import Path
 
 # 设置控制台编码为 UTF-8 (Windows 兼容)
@@ -20,15 +22,86 @@ from migration_planner import MigrationPlanner
 from code_generater import PythonCodeGenerator
 from validator import MigrationValidator
 from agents import MigrationOrchestrator
+from demo_output import BAR70, emit, run_demos_parallel
 from logger import get_logger
+from thread_output import ThreadBufferedStream
 from visualizer import MigrationVisualizer
 
 
+# 解析器、规划器等在调用期间持有状态: 每个演示线程各用一套实例 (线程内复用), 并行演示之间无需加锁
+_tools = threading.local()
+
+
+def _thread_tool(name: str, factory):
+    """返回当前线程的工具实例, 首次使用时创建"""
+    tool = getattr(_tools, name, None)
+    if tool is None:
+        tool = factory()
+        setattr(_tools, name, tool)
+    return tool
+
+
+def _get_parser() -> JavaASTParser:
+    return _thread_tool('parser', JavaASTParser)
+
+
+def _get_mapper() -> SemanticMapper:
+    return _thread_tool('mapper', SemanticMapper)
+
+
+def _get_planner() -> MigrationPlanner:
+    return _thread_tool('planner', MigrationPlanner)
+
+
+def _get_generator() -> PythonCodeGenerator:
+    return _thread_tool('generator', PythonCodeGenerator)
+
+
+def _get_validator() -> MigrationValidator:
+    return _thread_tool('validator', MigrationValidator)
+
+
+def _get_visualizer() -> MigrationVisualizer:
+    return _thread_tool('visualizer', MigrationVisualizer)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse(java_code: str) -> dict:
+    """解析 Java 代码, 相同源码直接返回缓存的结构 (调用方不应修改返回值)"""
+    return _get_parser().get_full_structure(java_code)
+
+
+def _plan_and_map(java_structure: dict):
+    """
+    单次遍历类列表, 同时生成迁移计划和 Python 结构
+
+    等价于依次调用 planner.plan_migration 和 mapper.map_structure,
+    但通过 plan_migration 的 on_class 回调在规划每个类时一并映射, 每个类只访问一次
+
+    Returns:
+        (迁移计划, Python 代码结构)
+    """
+    planner = _get_planner()
+    mapper = _get_mapper()
+
+    python_classes = []
+    plan = planner.plan_migration(
+        java_structure,
+        on_class=lambda class_info: python_classes.append(mapper.map_class(class_info))
+    )
+
+    python_structure = {
+        'imports': mapper.map_imports(java_structure.get('imports', [])),
+        'classes': python_classes
+    }
+    mapper.mapped_structure = python_structure
+
+    return plan, python_structure
+
+
 def demo_traditional_mode():
     """演示传统模式的迁移流程"""
-    print("="*70)
-    print("模式 1: 传统迁移模式")
-    print("="*70)
+    emit(BAR70, "模式 1: 传统迁移模式", BAR70)
 
     # Java 示例代码
     java_code = """
@@ -65,17 +138,13 @@ def demo_traditional_mode():
     print(java_code)
 
     # 创建工具实例
-    parser = JavaASTParser()
-    mapper = SemanticMapper()
-    planner = MigrationPlanner()
-    generator = PythonCodeGenerator()
-    validator = MigrationValidator()
+    planner = _get_planner()
+    generator = _get_generator()
+    validator = _get_validator()
 
-    print("\n" + "="*70)
-    print("步骤 1: 解析 Java 代码")
-    print("="*70)
+    emit("\n" + BAR70, "步骤 1: 解析 Java 代码", BAR70)
 
-    java_structure = parser.get_full_structure(java_code)
+    java_structure = _parse(java_code)
     if java_structure:
         print(f"✓ 解析成功!")
         print(f"  - 包名: {java_structure['package'] or '(default)'}")
@@ -88,24 +157,18 @@ def demo_traditional_mode():
             print(f"    - 构造函数: {len(cls['constructors'])} 个")
             print(f"    - 方法: {len(cls['methods'])} 个")
 
-    print("\n" + "="*70)
-    print("步骤 2: 生成迁移计划")
-    print("="*70)
+    emit("\n" + BAR70, "步骤 2: 生成迁移计划", BAR70)
 
-    migration_plan = planner.plan_migration(java_structure)
+    # 规划与映射在同一次遍历中完成, 步骤 3 直接使用映射结果
+    migration_plan, python_structure = _plan_and_map(java_structure)
     planner.print_plan(migration_plan)
 
-    print("\n" + "="*70)
-    print("步骤 3: 语义映射")
-    print("="*70)
+    emit("\n" + BAR70, "步骤 3: 语义映射", BAR70)
 
-    python_structure = mapper.map_structure(java_structure)
     print(f"✓ 映射完成!")
     print(f"  - Python 类数: {len(python_structure['classes'])}")
 
-    print("\n" + "="*70)
-    print("步骤 4: 生成 Python 代码")
-    print("="*70)
+    emit("\n" + BAR70, "步骤 4: 生成 Python 代码", BAR70)
 
     python_code = generator.generate_code(python_structure)
     python_code = generator.format_code(python_code)
@@ -113,9 +176,7 @@ def demo_traditional_mode():
     print("\n【生成的 Python 代码】")
     print(python_code)
 
-    print("\n" + "="*70)
-    print("步骤 5: 验证生成的代码")
-    print("="*70)
+    emit("\n" + BAR70, "步骤 5: 验证生成的代码", BAR70)
 
     validation_report = validator.validate_migration(
         java_code,
@@ -129,21 +190,19 @@ def demo_traditional_mode():
     output_file = Path(__file__).parent / 'example' / 'Person.py'
     output_file.parent.mkdir(exist_ok=True)
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(python_code)
+    output_file.write_text(python_code, encoding='utf-8')
 
-    print(f"\n✓ Python 代码已保存到: {output_file}")
-    print("\n" + "="*70)
-    print("传统模式演示完成!")
-    print("="*70)
+    emit(
+        f"\n✓ Python 代码已保存到: {output_file}",
+        "\n" + BAR70,
+        "传统模式演示完成!",
+        BAR70
+    )
 
 
 def demo_agent_mode():
     """演示 Agent 编排模式"""
-    print("\n\n")
-    print("="*70)
-    print("模式 2: Agent 编排模式")
-    print("="*70)
+    emit("\n\n", BAR70, "模式 2: Agent 编排模式", BAR70)
 
     # Java 示例代码
     java_code = """
@@ -189,8 +248,7 @@ def demo_agent_mode():
         output_file = Path(__file__).parent / 'example' / 'Calculator.py'
         output_file.parent.mkdir(exist_ok=True)
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(results['python_code'])
+        output_file.write_text(results['python_code'], encoding='utf-8')
 
         logger.success(f"Python 代码已保存到: {output_file}")
     else:
@@ -198,17 +256,12 @@ def demo_agent_mode():
         for error in results['errors']:
             logger.error(f"  - {error}")
 
-    print("\n" + "="*70)
-    print("Agent 模式演示完成!")
-    print("="*70)
+    emit("\n" + BAR70, "Agent 模式演示完成!", BAR70)
 
 
 def demo_visualizer():
     """演示迁移计划可视化"""
-    print("\n\n")
-    print("="*70)
-    print("模式 3: 迁移计划可视化")
-    print("="*70)
+    emit("\n\n", BAR70, "模式 3: 迁移计划可视化", BAR70)
 
     java_code = """
     public class ComplexExample extends BaseClass implements Interface1, Interface2 {
@@ -231,11 +284,10 @@ def demo_visualizer():
     """
 
     # 解析和规划
-    parser = JavaASTParser()
-    planner = MigrationPlanner()
-    visualizer = MigrationVisualizer()
+    planner = _get_planner()
+    visualizer = _get_visualizer()
 
-    java_structure = parser.get_full_structure(java_code)
+    java_structure = _parse(java_code)
     plan = planner.plan_migration(java_structure)
 
     # 显示计划
@@ -248,23 +300,19 @@ def demo_visualizer():
     visualizer.export_plan_to_json(plan, str(json_file))
     visualizer.export_plan_to_markdown(plan, str(md_file))
 
-    print("\n" + "="*70)
-    print("可视化演示完成!")
-    print("="*70)
+    emit("\n" + BAR70, "可视化演示完成!", BAR70)
 
 
 if __name__ == "__main__":
+    # 先替换 stdout 再创建全局日志器, 使日志输出也按线程缓冲
+    sys.stdout = ThreadBufferedStream(sys.stdout)
+    get_logger()
+
     try:
-        # 运行所有演示
-        demo_traditional_mode()
-        demo_agent_mode()
-        demo_visualizer()
-
-        print("\n\n")
-        print("="*70)
-        print("所有演示完成!")
-        print("="*70)
-        print("\n提示: 查看 example/ 目录下的生成文件")
+        # 并行运行所有演示
+        run_demos_parallel(demo_traditional_mode, demo_agent_mode, demo_visualizer)
+
+        emit("\n\n", BAR70, "所有演示完成!", BAR70, "\n提示: 查看 example/ 目录下的生成文件")
 
     except Exception as e:
         print(f"\n错误: {str(e)}")
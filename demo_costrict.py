@@ -4,6 +4,7 @@ Costrict 风格智能 Agent 系统完整演示
 """
 import sys
 from pathlib import Path
+from typing import Dict, Any
 
 # 设置编码
 if sys.platform == 'win32':
@@ -14,17 +15,20 @@ if sys.platform == 'win32':
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from costrict_orchestrator import StrictModeOrchestrator
+from demo_output import BAR100, emit
 from llm_providers import create_llm_provider
 from logger import get_logger
 
 
 def demo_strict_mode():
     """演示严格模式 - 完整的 6 个阶段"""
-    print("="*100)
-    print("🔒 演示 1: Costrict 严格模式 (6 个阶段完整流程)")
-    print("="*100)
-    print("\n参考: https://github.com/zgsm-ai/costrict")
-    print("理念: 质量优先、严格流程、系统化分解\n")
+    emit(
+        BAR100,
+        "🔒 演示 1: Costrict 严格模式 (6 个阶段完整流程)",
+        BAR100,
+        "\n参考: https://github.com/zgsm-ai/costrict",
+        "理念: 质量优先、严格流程、系统化分解\n"
+    )
 
     java_code = """
     public class OrderProcessor {
@@ -101,10 +105,7 @@ def demo_strict_mode():
 
 def demo_fast_mode():
     """演示快速模式 - 仅核心阶段"""
-    print("\n\n")
-    print("="*100)
-    print("⚡ 演示 2: 快速模式 (3 个核心阶段)")
-    print("="*100)
+    emit("\n\n", BAR100, "⚡ 演示 2: 快速模式 (3 个核心阶段)", BAR100)
 
     java_code = """
     public class StringUtils {
@@ -140,14 +141,7 @@ def demo_fast_mode():
     return results
 
 
-def demo_comparison():
-    """对比严格模式和快速模式"""
-    print("\n\n")
-    print("="*100)
-    print("📊 严格模式 vs 快速模式对比")
-    print("="*100)
-
-    comparison_table = """
+_COMPARISON_TABLE = """
 ┌─────────────────────┬────────────────────────┬────────────────────────┐
 │ 维度                │ 严格模式 (Strict)      │ 快速模式 (Fast)        │
 ├─────────────────────┼────────────────────────┼────────────────────────┤
@@ -174,78 +168,91 @@ def demo_comparison():
   需求分析 → 代码生成 → 代码审查
   (快速迭代,适合简单场景)
 """
-    print(comparison_table)
 
 
-def print_phase_results(results: Dict):
+def demo_comparison():
+    """对比严格模式和快速模式"""
+    emit("\n\n", BAR100, "📊 严格模式 vs 快速模式对比", BAR100)
+
+    print(_COMPARISON_TABLE)
+
+
+def print_phase_results(results: Dict[str, Any]) -> None:
     """打印各阶段结果详情"""
-    print("\n" + "="*100)
-    print("📋 各阶段输出详情")
-    print("="*100)
+    parts = ["\n" + BAR100, "📋 各阶段输出详情", BAR100]
 
     # 1. 需求分析
     if results.get('requirements'):
-        print("\n【1️⃣ 需求分析阶段】")
+        parts.append("\n【1️⃣ 需求分析阶段】")
         req = results['requirements']
-        print(f"  业务领域: {req.get('business_domain', '未知')}")
-        print(f"  优先级: {req.get('priority', '未知')}")
+        parts.append(f"  业务领域: {req.get('business_domain', '未知')}")
+        parts.append(f"  优先级: {req.get('priority', '未知')}")
         if req.get('core_functions'):
-            print(f"  核心功能: {', '.join(req['core_functions'][:3])}")
+            parts.append(f"  核心功能: {', '.join(req['core_functions'][:3])}")
         if req.get('migration_challenges'):
-            print(f"  迁移挑战: {', '.join(req['migration_challenges'][:2])}")
+            parts.append(f"  迁移挑战: {', '.join(req['migration_challenges'][:2])}")
 
     # 2. 架构设计
     if results.get('architecture'):
-        print("\n【2️⃣ 架构设计阶段】")
+        parts.append("\n【2️⃣ 架构设计阶段】")
         arch = results['architecture']
         if arch.get('class_structure'):
             cs = arch['class_structure']
-            print(f"  类名: {cs.get('class_name', '未知')}")
+            parts.append(f"  类名: {cs.get('class_name', '未知')}")
             if cs.get('patterns'):
-                print(f"  设计模式: {', '.join(cs['patterns'])}")
+                parts.append(f"  设计模式: {', '.join(cs['patterns'])}")
 
     # 3. 任务规划
     if results.get('plan'):
-        print("\n【3️⃣ 任务规划阶段】")
+        parts.append("\n【3️⃣ 任务规划阶段】")
         plan = results['plan']
         steps = plan.get('implementation_steps', [])
-        print(f"  实现步骤: {len(steps)} 个")
+        parts.append(f"  实现步骤: {len(steps)} 个")
         if steps:
-            print(f"  第一步: {steps[0].get('description', '未知')}")
+            parts.append(f"  第一步: {steps[0].get('description', '未知')}")
 
     # 4. 代码生成
     if results.get('python_code'):
-        print("\n【4️⃣ 代码生成阶段】")
+        parts.append("\n【4️⃣ 代码生成阶段】")
         code = results['python_code']
-        lines = code.count('\n')
-        classes = code.count('class ')
-        methods = code.count('def ')
-        print(f"  代码行数: {lines}")
-        print(f"  类数量: {classes}")
-        print(f"  方法数量: {methods}")
+        struct = results.get('python_structure')
+        if struct:
+            lines = code.count('\n')
+            classes = len(struct['classes'])
+            methods = (sum(len(c['methods']) for c in struct['classes'])
+                       + len(struct.get('functions', ())))
+        else:
+            lines = code.count('\n')
+            classes = code.count('class ')
+            methods = code.count('def ')
+        parts.append(f"  代码行数: {lines}")
+        parts.append(f"  类数量: {classes}")
+        parts.append(f"  方法数量: {methods}")
 
     # 5. 测试生成
     if results.get('test_code'):
-        print("\n【5️⃣ 测试生成阶段】")
+        parts.append("\n【5️⃣ 测试生成阶段】")
         test = results['test_code']
         test_count = test.count('def test_')
-        print(f"  测试用例: {test_count} 个")
+        parts.append(f"  测试用例: {test_count} 个")
 
     # 6. 代码审查
     if results.get('review_report'):
-        print("\n【6️⃣ 代码审查阶段】")
+        parts.append("\n【6️⃣ 代码审查阶段】")
         review = results['review_report']
-        print(f"  总分: {review.get('overall_score', 0)}/100")
-        print(f"  审批状态: {review.get('approval_status', '未知')}")
+        parts.append(f"  总分: {review.get('overall_score', 0)}/100")
+        parts.append(f"  审批状态: {review.get('approval_status', '未知')}")
 
         # 详细评分
         if review.get('semantic_correctness'):
-            print(f"  语义正确性: {review['semantic_correctness'].get('score', 0)}/100")
+            parts.append(f"  语义正确性: {review['semantic_correctness'].get('score', 0)}/100")
         if review.get('code_quality'):
-            print(f"  代码质量: {review['code_quality'].get('score', 0)}/100")
+            parts.append(f"  代码质量: {review['code_quality'].get('score', 0)}/100")
+
+    emit(*parts)
 
 
-def save_results(results: Dict, mode: str):
+def save_results(results: Dict[str, Any], mode: str):
     """保存结果到文件"""
     output_dir = Path("output") / mode
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -263,22 +270,10 @@ def save_results(results: Dict, mode: str):
         print(f"✓ 测试代码已保存: {output_dir / 'test_generated.py'}")
 
     # 保存报告
-    from costrict_orchestrator import StrictModeOrchestrator
-    from llm_providers import create_llm_provider
+    StrictModeOrchestrator.export_report(results, str(output_dir / "report.json"))
 
-    provider = create_llm_provider("mock")  # 只用于导出
-    orch = StrictModeOrchestrator(provider)
-    orch.export_report(results, str(output_dir / "report.json"))
 
-
-def show_architecture():
-    """显示系统架构"""
-    print("\n\n")
-    print("="*100)
-    print("🏗️ Costrict 风格 Agent 系统架构")
-    print("="*100)
-
-    architecture = """
+_ARCHITECTURE = """
 ┌─────────────────────────────────────────────────────────────────────────────┐
 │                      StrictModeOrchestrator (编排器)                        │
 │                                                                              │
@@ -309,7 +304,13 @@ def show_architecture():
 │  • 完整的审查和质量检查                                                      │
 └─────────────────────────────────────────────────────────────────────────────┘
 """
-    print(architecture)
+
+
+def show_architecture():
+    """显示系统架构"""
+    emit("\n\n", BAR100, "🏗️ Costrict 风格 Agent 系统架构", BAR100)
+
+    print(_ARCHITECTURE)
 
 
 if __name__ == "__main__":
@@ -332,17 +333,19 @@ if __name__ == "__main__":
         # 对比分析
         demo_comparison()
 
-        print("\n\n")
-        print("="*100)
-        print("✅ 所有演示完成!")
-        print("="*100)
-        print("\n生成的文件:")
-        print("  📁 output/strict_mode/  - 严格模式输出")
-        print("  📁 output/fast_mode/    - 快速模式输出")
-        print("\n每个目录包含:")
-        print("  📄 generated.py        - 生成的 Python 代码")
-        print("  📄 test_generated.py   - 生成的测试代码")
-        print("  📄 report.json         - 详细的迁移报告")
+        emit(
+            "\n\n",
+            BAR100,
+            "✅ 所有演示完成!",
+            BAR100,
+            "\n生成的文件:",
+            "  📁 output/strict_mode/  - 严格模式输出",
+            "  📁 output/fast_mode/    - 快速模式输出",
+            "\n每个目录包含:",
+            "  📄 generated.py        - 生成的 Python 代码",
+            "  📄 test_generated.py   - 生成的测试代码",
+            "  📄 report.json         - 详细的迁移报告"
+        )
 
     except KeyboardInterrupt:
         print("\n\n用户中断")
@@ -14,16 +14,16 @@ if sys.platform == 'win32':
 # 添加 src 目录到路径
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
+from demo_output import BAR80, emit, run_demos_parallel
 from intelligent_migrator import IntelligentMigrator, MigrationMode
 from llm_providers import create_llm_provider
 from logger import get_logger
+from thread_output import ThreadBufferedStream
 
 
 def demo_simple_pojo():
     """演示 1: 简单 POJO - 使用规则映射"""
-    print("="*80)
-    print("演示 1: 简单 POJO 类迁移 (自动选择规则映射模式)")
-    print("="*80)
+    emit(BAR80, "演示 1: 简单 POJO 类迁移 (自动选择规则映射模式)", BAR80)
 
     java_code = """
     public class Product {
@@ -67,17 +67,12 @@ def demo_simple_pojo():
     results = migrator.migrate(java_code, validate=True)
     migrator.print_results(results)
 
-    print("\n" + "="*80)
-    print(f"✓ 模式选择: {results['mode_used']} (快速、免费)")
-    print("="*80)
+    emit("\n" + BAR80, f"✓ 模式选择: {results['mode_used']} (快速、免费)", BAR80)
 
 
 def demo_complex_service():
     """演示 2: 复杂业务服务 - 使用语义理解"""
-    print("\n\n")
-    print("="*80)
-    print("演示 2: 复杂业务服务迁移 (自动选择语义理解模式)")
-    print("="*80)
+    emit("\n\n", BAR80, "演示 2: 复杂业务服务迁移 (自动选择语义理解模式)", BAR80)
 
     java_code = """
     public class OrderService {
@@ -155,17 +150,12 @@ def demo_complex_service():
     results = migrator.migrate(java_code, validate=True, refactor=True)
     migrator.print_results(results)
 
-    print("\n" + "="*80)
-    print(f"✓ 模式选择: {results['mode_used']} (高质量、完整实现)")
-    print("="*80)
+    emit("\n" + BAR80, f"✓ 模式选择: {results['mode_used']} (高质量、完整实现)", BAR80)
 
 
 def demo_forced_semantic():
     """演示 3: 强制使用语义理解模式"""
-    print("\n\n")
-    print("="*80)
-    print("演示 3: 强制语义理解模式 - 简单类也使用 LLM")
-    print("="*80)
+    emit("\n\n", BAR80, "演示 3: 强制语义理解模式 - 简单类也使用 LLM", BAR80)
 
     java_code = """
     public class Calculator {
@@ -194,12 +184,14 @@ def demo_forced_semantic():
 
 def demo_with_real_llm():
     """演示 4: 使用真实的 LLM (需要 API key)"""
-    print("\n\n")
-    print("="*80)
-    print("演示 4: 使用真实 LLM 的高质量迁移")
-    print("="*80)
-    print("\n提示: 这需要设置 OPENAI_API_KEY 或 ANTHROPIC_API_KEY 环境变量")
-    print("如果没有 API key,请跳过此演示\n")
+    emit(
+        "\n\n",
+        BAR80,
+        "演示 4: 使用真实 LLM 的高质量迁移",
+        BAR80,
+        "\n提示: 这需要设置 OPENAI_API_KEY 或 ANTHROPIC_API_KEY 环境变量",
+        "如果没有 API key,请跳过此演示\n"
+    )
 
     import os
 
@@ -262,14 +254,7 @@ def demo_with_real_llm():
         print("请检查 API key 配置或 Ollama 服务状态")
 
 
-def show_comparison():
-    """显示三种模式的对比"""
-    print("\n\n")
-    print("="*80)
-    print("三种迁移模式对比总结")
-    print("="*80)
-
-    comparison = """
+_COMPARISON = """
 ┌────────────────┬────────────────┬────────────────┬────────────────┐
 │ 特性           │ 规则映射模式   │ 语义理解模式   │ 混合模式       │
 ├────────────────┼────────────────┼────────────────┼────────────────┤
@@ -287,37 +272,49 @@ def show_comparison():
 ✓ 简单数据类 -> 自动使用规则映射(快速、免费)
 ✓ 复杂业务逻辑 -> 自动使用语义理解(高质量)
     """
-    print(comparison)
+
+
+def show_comparison():
+    """显示三种模式的对比"""
+    emit("\n\n", BAR80, "三种迁移模式对比总结", BAR80)
+
+    print(_COMPARISON)
 
 
 if __name__ == "__main__":
+    # 先替换 stdout 再创建全局日志器, 使日志输出也按线程缓冲
+    sys.stdout = ThreadBufferedStream(sys.stdout)
+
     try:
         # 获取日志器
         logger = get_logger(verbose=False, use_color=True)
 
         print("🚀 Java to Python 智能迁移工具 - 完整演示\n")
 
-        # 运行演示
-        demo_simple_pojo()
-        demo_complex_service()
-        demo_forced_semantic()
+        # 并行运行演示
+        run_demos_parallel(demo_simple_pojo, demo_complex_service, demo_forced_semantic)
 
         # 显示对比
         show_comparison()
 
-        # 可选:真实 LLM 演示
-        response = input("\n是否尝试使用真实 LLM? (需要 API key) [y/N]: ")
+        # 可选:真实 LLM 演示 (非交互环境下直接跳过, 避免 input() 阻塞)
+        if sys.stdin is not None and sys.stdin.isatty():
+            response = input("\n是否尝试使用真实 LLM? (需要 API key) [y/N]: ")
+        else:
+            response = 'n'
         if response.lower() == 'y':
             demo_with_real_llm()
 
-        print("\n\n")
-        print("="*80)
-        print("✅ 所有演示完成!")
-        print("="*80)
-        print("\n下一步:")
-        print("  1. 配置真实的 LLM (OpenAI/Anthropic/Ollama)")
-        print("  2. 在 main.py 中集成智能迁移器")
-        print("  3. 使用: python src/main.py -i Example.java --intelligent")
+        emit(
+            "\n\n",
+            BAR80,
+            "✅ 所有演示完成!",
+            BAR80,
+            "\n下一步:",
+            "  1. 配置真实的 LLM (OpenAI/Anthropic/Ollama)",
+            "  2. 在 main.py 中集成智能迁移器",
+            "  3. 使用: python src/main.py -i Example.java --intelligent"
+        )
 
     except KeyboardInterrupt:
         print("\n\n用户中断")
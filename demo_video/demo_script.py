@@ -1,11 +1,16 @@
 """产品演示视频 - 自动化演示脚本"""
+import asyncio
 import sys
 import time
 from pathlib import Path
 
-if sys.platform == 'win32':
+# 仅在控制台不是 UTF-8 时重新包装; stdout 用块缓冲, 由演示在暂停前显式刷新
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() != 'utf-8':
+    import atexit
     import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace', line_buffering=True)
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace',
+                                  line_buffering=False, write_through=False)
+    atexit.register(sys.stdout.flush)
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace', line_buffering=True)
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
@@ -16,60 +21,80 @@ from logger import get_logger
 class DemoPresenter:
     """演示控制器"""
 
-    def __init__(self):
+    def __init__(self, speed=1.0):
+        """
+        Args:
+            speed: 暂停时长倍率, 0 表示不暂停 (用于 CI / 录制)
+        """
+        self.speed = speed
         self.logger = get_logger(verbose=True, use_color=True)
         self.project_root = Path(__file__).parent.parent
+        # 输出缓冲: 每个逻辑块在暂停前统一写出一次, 而不是逐行 print
+        self._buf = []
 
     def print_title(self, title, style="="):
         """打印标题"""
         width = 80
-        print("\n" + style * width)
-        print(title.center(width))
-        print(style * width + "\n")
-        time.sleep(1)
+        self._out("\n" + style * width)
+        self._out(title.center(width))
+        self._out(style * width + "\n")
+        self.pause(1)
 
     def print_section(self, text):
         """打印章节"""
-        print(f"\n{'─' * 80}")
-        print(f"📍 {text}")
-        print(f"{'─' * 80}\n")
-        time.sleep(0.5)
+        self._out(f"\n{'─' * 80}")
+        self._out(f"📍 {text}")
+        self._out(f"{'─' * 80}\n")
+        self.pause(0.5)
+
+    def _out(self, text="", end="\n"):
+        """追加一行到输出缓冲, 用法同单参数 print"""
+        self._buf.append(f"{text}{end}")
+
+    def _flush(self):
+        """一次写出缓冲内容并刷新 stdout"""
+        if self._buf:
+            sys.stdout.write(''.join(self._buf))
+            self._buf.clear()
+        sys.stdout.flush()
 
     def pause(self, seconds=2):
-        """暂停"""
-        time.sleep(seconds)
+        """暂停 (暂停前先输出已缓冲的内容)"""
+        self._flush()
+        if self.speed:
+            time.sleep(seconds * self.speed)
 
     def demo_part1_intro(self):
         """第一部分: 开场介绍"""
         self.print_title("Java to Python Migration Tool", "=")
-        print("智能化代码迁移解决方案\n")
+        self._out("智能化代码迁移解决方案\n")
         self.pause(2)
 
-        print("💡 在现代软件开发中，将遗留的 Java 代码迁移到 Python 是一个常见但耗时的任务。")
+        self._out("💡 在现代软件开发中，将遗留的 Java 代码迁移到 Python 是一个常见但耗时的任务。")
         self.pause(1)
-        print("⚡ 今天，我们展示一个创新的解决方案——")
-        print("   结合 AST 解析和 LLM 智能 Agent 的自动迁移工具。")
+        self._out("⚡ 今天，我们展示一个创新的解决方案——")
+        self._out("   结合 AST 解析和 LLM 智能 Agent 的自动迁移工具。")
         self.pause(2)
 
     def demo_part2_features(self):
         """第二部分: 核心功能展示"""
         self.print_section("核心功能介绍")
 
-        print("🔧 双引擎系统:\n")
-        print("1️⃣  传统引擎 (AST-based)")
-        print("    ├─ Java AST 解析")
-        print("    ├─ 语义映射")
-        print("    ├─ Python 代码生成")
-        print("    └─ 语法验证")
+        self._out("🔧 双引擎系统:\n")
+        self._out("1️⃣  传统引擎 (AST-based)")
+        self._out("    ├─ Java AST 解析")
+        self._out("    ├─ 语义映射")
+        self._out("    ├─ Python 代码生成")
+        self._out("    └─ 语法验证")
         self.pause(1.5)
 
-        print("\n2️⃣  智能 Agent 系统 (LLM-powered)")
-        print("    ├─ 需求分析 Agent")
-        print("    ├─ 架构设计 Agent")
-        print("    ├─ 任务规划 Agent")
-        print("    ├─ 代码生成 Agent")
-        print("    ├─ 测试生成 Agent")
-        print("    └─ 代码审查 Agent")
+        self._out("\n2️⃣  智能 Agent 系统 (LLM-powered)")
+        self._out("    ├─ 需求分析 Agent")
+        self._out("    ├─ 架构设计 Agent")
+        self._out("    ├─ 任务规划 Agent")
+        self._out("    ├─ 代码生成 Agent")
+        self._out("    ├─ 测试生成 Agent")
+        self._out("    └─ 代码审查 Agent")
         self.pause(2)
 
     def demo_part3_traditional(self):
@@ -93,19 +118,19 @@ class DemoPresenter:
         with open(demo_file, 'w') as f:
             f.write(java_code)
 
-        print("📄 示例 Java 代码:")
-        print("─" * 80)
-        print(java_code)
-        print("─" * 80)
+        self._out("📄 示例 Java 代码:")
+        self._out("─" * 80)
+        self._out(java_code)
+        self._out("─" * 80)
         self.pause(2)
 
-        print("\n⚙️  执行迁移...")
-        print("$ python src/main.py -i demo_video/Calculator.java -o demo_video/Calculator.py -f")
+        self._out("\n⚙️  执行迁移...")
+        self._out("$ python src/main.py -i demo_video/Calculator.java -o demo_video/Calculator.py -f")
         self.pause(1)
 
-        print("\n💡 提示: 请在另一个终端运行上述命令查看迁移过程")
-        print("    迁移完成后，生成的 Python 代码将保存在 demo_video/Calculator.py")
-        print("    使用 -f 参数强制覆盖已存在的文件")
+        self._out("\n💡 提示: 请在另一个终端运行上述命令查看迁移过程")
+        self._out("    迁移完成后，生成的 Python 代码将保存在 demo_video/Calculator.py")
+        self._out("    使用 -f 参数强制覆盖已存在的文件")
 
         self.pause(3)
 
@@ -113,7 +138,7 @@ class DemoPresenter:
         """第四部分: 智能 Agent 模式"""
         self.print_section("智能 Agent 模式 - 快速演示")
 
-        print("🤖 启动 Costrict 6 阶段工作流...\n")
+        self._out("🤖 启动 Costrict 6 阶段工作流...\n")
         self.pause(1)
 
         stages = [
@@ -125,46 +150,61 @@ class DemoPresenter:
             ("代码审查", "质量评分和改进建议", 1),
         ]
 
-        for i, (name, desc, duration) in enumerate(stages, 1):
-            print(f"\n[{i}/6] {name}")
-            print(f"{'─' * 80}")
-            print(f"📋 {desc}...")
-
-            for j in range(duration):
-                time.sleep(0.5)
-                print(".", end="", flush=True)
-
-            self.logger.success(f" ✅ 完成")
-            time.sleep(0.3)
+        asyncio.run(self._run_stages(stages))
 
         self.pause(1)
-        print("\n✅ 所有阶段执行完成!")
+        self._out("\n✅ 所有阶段执行完成!")
         self.pause(2)
 
+    async def _run_stages(self, stages):
+        """
+        依次执行各阶段: 等上一阶段完成后再开始下一阶段, 每个进度点用 await asyncio.sleep 计时
+        """
+        for i, (name, desc, duration) in enumerate(stages, 1):
+            self._out(f"\n[{i}/6] {name}")
+            self._out(f"{'─' * 80}")
+            self._out(f"📋 {desc}...")
+
+            if self.speed:
+                for _ in range(duration):
+                    self._flush()
+                    await asyncio.sleep(0.5 * self.speed)
+                    self._out(".", end="")
+            else:
+                # 不暂停时进度点一次输出即可
+                self._out("." * duration, end="")
+
+            # 日志直接写 stdout, 先输出缓冲内容以保持顺序
+            self._flush()
+            self.logger.success(f" ✅ 完成")
+            if self.speed:
+                await asyncio.sleep(0.3 * self.speed)
+
     def demo_part5_emoji_java(self):
         """第五部分: emoji-java 真实案例"""
         self.print_section("真实案例: emoji-java 项目迁移")
 
-        print("📦 项目信息:")
-        print("  ├─ 原项目: emoji-java (https://github.com/vdurmont/emoji-java)")
-        print("  ├─ 规模: 6 个核心 Java 文件")
-        print("  ├─ 复杂度: 枚举、数据模型、解析器、字典树")
-        print("  └─ 模式: 严格模式 (6 阶段)")
+        self._out("📦 项目信息:")
+        self._out("  ├─ 原项目: emoji-java (https://github.com/vdurmont/emoji-java)")
+        self._out("  ├─ 规模: 6 个核心 Java 文件")
+        self._out("  ├─ 复杂度: 枚举、数据模型、解析器、字典树")
+        self._out("  └─ 模式: 严格模式 (6 阶段)")
         self.pause(2)
 
-        print("\n📊 迁移结果:")
-        print("┌─────────────────┬──────────────┬────────────────┐")
-        print("│ 指标            │ 结果         │ 说明           │")
-        print("├─────────────────┼──────────────┼────────────────┤")
-        print("│ 迁移成功率      │ ✅ 100% (6/6)│ 全部成功       │")
-        print("│ 语法正确率      │ ✅ 100%      │ 验证通过       │")
-        print("│ 测试覆盖        │ ✅ 100%      │ 包含测试       │")
-        print("│ 平均质量分      │ 85/100       │ 高质量输出     │")
-        print("│ 总耗时          │ ~15 分钟     │ 严格模式       │")
-        print("└─────────────────┴──────────────┴────────────────┘")
+        self._out("""
+📊 迁移结果:
+┌─────────────────┬──────────────┬────────────────┐
+│ 指标            │ 结果         │ 说明           │
+├─────────────────┼──────────────┼────────────────┤
+│ 迁移成功率      │ ✅ 100% (6/6)│ 全部成功       │
+│ 语法正确率      │ ✅ 100%      │ 验证通过       │
+│ 测试覆盖        │ ✅ 100%      │ 包含测试       │
+│ 平均质量分      │ 85/100       │ 高质量输出     │
+│ 总耗时          │ ~15 分钟     │ 严格模式       │
+└─────────────────┴──────────────┴────────────────┘""")
         self.pause(3)
 
-        print("\n📈 代码质量详情:")
+        self._out("\n📈 代码质量详情:")
         files = [
             ("Emoji.py", 52, 1, 7, 7, 7),
             ("EmojiLoader.py", 42, 1, 3, 2, 2),
@@ -174,48 +214,54 @@ class DemoPresenter:
             ("Fitzpatrick.py", 53, 1, 3, 4, 3),
         ]
 
-        print("┌──────────────────┬─────┬───┬─────┬─────┬─────┐")
-        print("│ 文件             │ 行数│类 │方法 │文档 │注解 │")
-        print("├──────────────────┼─────┼───┼─────┼─────┼─────┤")
-        for name, lines, classes, methods, docs, annots in files:
-            print(f"│ {name:<16} │ {lines:>3} │ {classes} │ {methods:>3} │ {docs:>3} │ {annots:>3} │")
-        print("└──────────────────┴─────┴───┴─────┴─────┴─────┘")
+        # 整张表拼成一个字符串后一次追加
+        rows = [
+            "┌──────────────────┬─────┬───┬─────┬─────┬─────┐",
+            "│ 文件             │ 行数│类 │方法 │文档 │注解 │",
+            "├──────────────────┼─────┼───┼─────┼─────┼─────┤",
+        ]
+        rows.extend(
+            f"│ {name:<16} │ {lines:>3} │ {classes} │ {methods:>3} │ {docs:>3} │ {annots:>3} │"
+            for name, lines, classes, methods, docs, annots in files
+        )
+        rows.append("└──────────────────┴─────┴───┴─────┴─────┴─────┘")
+        self._out('\n'.join(rows))
         self.pause(3)
 
     def demo_part6_validation(self):
         """第六部分: 验证展示"""
         self.print_section("迁移结果验证")
 
-        print("🔍 验证工具:")
-        print("$ cd emoji_migration")
-        print("$ python validate_migration.py")
+        self._out("🔍 验证工具:")
+        self._out("$ cd emoji_migration")
+        self._out("$ python validate_migration.py")
         self.pause(1)
 
-        print("\n✅ 验证结果:")
-        print("  ├─ Python 语法检查: ✅ 6/6 通过")
-        print("  ├─ 代码质量分析: ✅ 完成")
-        print("  ├─ 测试完整性: ✅ 6/6 包含测试")
-        print("  └─ 验证报告: ✅ 已生成")
+        self._out("\n✅ 验证结果:")
+        self._out("  ├─ Python 语法检查: ✅ 6/6 通过")
+        self._out("  ├─ 代码质量分析: ✅ 完成")
+        self._out("  ├─ 测试完整性: ✅ 6/6 包含测试")
+        self._out("  └─ 验证报告: ✅ 已生成")
         self.pause(2)
 
-        print("\n📦 输出结构:")
-        print("emoji_migration/")
-        print("├── output/                    # 迁移输出")
-        print("│   ├── Emoji/")
-        print("│   ├── EmojiManager/")
-        print("│   └── ...")
-        print("└── emoji_python/              # Python 包")
-        print("    ├── __init__.py")
-        print("    ├── Emoji.py")
-        print("    ├── tests/")
-        print("    └── examples/")
+        self._out("\n📦 输出结构:")
+        self._out("emoji_migration/")
+        self._out("├── output/                    # 迁移输出")
+        self._out("│   ├── Emoji/")
+        self._out("│   ├── EmojiManager/")
+        self._out("│   └── ...")
+        self._out("└── emoji_python/              # Python 包")
+        self._out("    ├── __init__.py")
+        self._out("    ├── Emoji.py")
+        self._out("    ├── tests/")
+        self._out("    └── examples/")
         self.pause(2)
 
     def demo_part7_summary(self):
         """第七部分: 总结"""
         self.print_section("总结")
 
-        print("🌟 核心优势:\n")
+        self._out("🌟 核心优势:\n")
         advantages = [
             "✅ 双引擎系统 - 灵活适配不同场景",
             "✅ 智能化迁移 - LLM 驱动的 6 阶段流程",
@@ -225,15 +271,15 @@ class DemoPresenter:
         ]
 
         for adv in advantages:
-            print(f"  {adv}")
+            self._out(f"  {adv}")
             self.pause(0.5)
 
         self.pause(2)
 
-        print("\n📚 获取更多信息:")
-        print("  📘 GitHub: [项目链接]")
-        print("  📗 文档: emoji_migration/VALIDATION_GUIDE.md")
-        print("  📙 示例: demo_costrict.py")
+        self._out("\n📚 获取更多信息:")
+        self._out("  📘 GitHub: [项目链接]")
+        self._out("  📗 文档: emoji_migration/VALIDATION_GUIDE.md")
+        self._out("  📙 示例: demo_costrict.py")
         self.pause(2)
 
         self.print_title("立即尝试，让代码迁移变得简单！", "=")
@@ -249,12 +295,15 @@ class DemoPresenter:
             self.demo_part6_validation()
             self.demo_part7_summary()
 
-            print("\n\n🎉 演示完成!")
+            self._out("\n\n🎉 演示完成!")
+            self._flush()
 
         except KeyboardInterrupt:
-            print("\n\n⏸️  演示已暂停")
+            self._out("\n\n⏸️  演示已暂停")
+            self._flush()
         except Exception as e:
-            print(f"\n\n❌ 演示出错: {e}")
+            self._out(f"\n\n❌ 演示出错: {e}")
+            self._flush()
             import traceback
             traceback.print_exc()
 
@@ -270,10 +319,21 @@ def main():
         choices=[1, 2, 3, 4, 5, 6, 7],
         help='只运行指定部分 (1-7)'
     )
+    parser.add_argument(
+        '--speed',
+        type=float,
+        default=1.0,
+        help='暂停时长倍率 (默认 1.0, 越小越快)'
+    )
+    parser.add_argument(
+        '--no-pause',
+        action='store_true',
+        help='不暂停, 直接输出全部内容 (等同于 --speed 0)'
+    )
 
     args = parser.parse_args()
 
-    presenter = DemoPresenter()
+    presenter = DemoPresenter(speed=0 if args.no_pause else args.speed)
 
     if args.part:
         part_methods = {
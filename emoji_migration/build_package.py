@@ -2,15 +2,18 @@
 创建 emoji-python 包并进行集成测试
 整合所有生成的 Python 模块
 """
+import functools
+import io
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import shutil
 
-# 设置编码
-if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+# 设置编码 (仅在控制台不是 UTF-8 时), 原地重新配置 stdout/stderr; stdout 用块缓冲
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8', errors='strict', line_buffering=False)
+    sys.stderr.reconfigure(encoding='utf-8', errors='strict')
 
 # 添加 src 目录到路径
 project_root = Path(__file__).parent.parent
@@ -19,68 +22,44 @@ sys.path.insert(0, str(project_root / 'src'))
 from logger import get_logger
 
 
-class EmojiPackageBuilder:
-    """构建 emoji-python 包"""
-
-    def __init__(self):
-        self.logger = get_logger(verbose=True, use_color=True)
-        self.output_dir = Path(__file__).parent / 'output'
-        self.package_dir = Path(__file__).parent / 'emoji_python'
-
-    def build_package(self):
-        """构建 Python 包"""
-        self.logger.info("="*80)
-        self.logger.info("构建 emoji-python 包")
-        self.logger.info("="*80)
-
-        # 创建包目录
-        if self.package_dir.exists():
-            self.logger.warning(f"包目录已存在，将被覆盖: {self.package_dir}")
-            shutil.rmtree(self.package_dir)
-
-        self.package_dir.mkdir(parents=True)
-        self.logger.success(f"创建包目录: {self.package_dir}")
-
-        # 复制所有 Python 文件
-        modules = ['Emoji', 'EmojiLoader', 'EmojiManager', 'EmojiParser', 'EmojiTrie', 'Fitzpatrick']
-        copied_files = []
-
-        for module in modules:
-            src_file = self.output_dir / module / f"{module}.py"
-            dst_file = self.package_dir / f"{module}.py"
-
-            if src_file.exists():
-                shutil.copy2(src_file, dst_file)
-                self.logger.success(f"  ✓ 复制: {module}.py")
-                copied_files.append(module)
-            else:
-                self.logger.error(f"  ✗ 未找到: {module}.py")
-
-        # 创建 __init__.py
-        self.create_init_file(copied_files)
-
-        # 创建 README
-        self.create_readme()
-
-        # 创建 setup.py
-        self.create_setup()
-
-        # 创建示例代码
-        self.create_examples()
-
-        self.logger.info("\n" + "="*80)
-        self.logger.success("包构建完成!")
-        self.logger.info("="*80)
-        self.logger.info(f"\n包位置: {self.package_dir}")
-        self.logger.info(f"包含模块: {len(copied_files)} 个")
-        self.logger.info("\n下一步:")
-        self.logger.info("  1. cd emoji_python")
-        self.logger.info("  2. python -m pytest tests/  # 运行测试")
-        self.logger.info("  3. python examples/demo.py  # 运行示例")
-
-    def create_init_file(self, modules):
-        """创建 __init__.py"""
-        init_content = '''"""
+def _buffered_log(method):
+    """
+    在方法执行期间把日志输出缓冲到内存, 结束时一次写出
+
+    构建过程主要是很快的本地文件操作, 逐条日志写终端的开销反而占了大头.
+    嵌套调用时内层缓冲写入外层缓冲, 最终只在最外层方法结束时写一次.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        handlers = [h for h in self.logger.logger.handlers
+                    if isinstance(h, logging.StreamHandler)]
+        buffers = [io.StringIO() for _ in handlers]
+        streams = [h.setStream(buf) for h, buf in zip(handlers, buffers)]
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            for handler, buf, stream in zip(handlers, buffers, streams):
+                handler.setStream(stream)
+                handler.stream.write(buf.getvalue())
+                handler.flush()
+    return wrapper
+
+
+def _copy_files(pairs):
+    """
+    并行复制一批 (源, 目标) 文件
+
+    只复制内容 (shutil.copyfile 在支持的平台上走 sendfile 等内核快速路径),
+    不保留元数据; 各文件互不依赖, 用线程池重叠阻塞 IO.
+    """
+    if not pairs:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as executor:
+        list(executor.map(lambda pair: shutil.copyfile(*pair), pairs))
+
+
+# 生成文件的模板, 导入时构造一次
+_INIT_TEMPLATE = '''"""
 emoji-python: Python port of emoji-java library
 A lightweight Python library for working with emojis.
 """
@@ -89,28 +68,12 @@ __version__ = '0.1.0'
 __author__ = 'Auto-generated from emoji-java'
 
 # Import main classes
-'''
-
-        for module in modules:
-            init_content += f"from .{module} import *\n"
-
-        init_content += '''
+{imports}
 __all__ = [
+{names}]
 '''
-        for module in modules:
-            init_content += f"    '{module}',\n"
-        init_content += ''']
-'''
-
-        init_file = self.package_dir / '__init__.py'
-        with open(init_file, 'w', encoding='utf-8') as f:
-            f.write(init_content)
 
-        self.logger.success(f"  ✓ 创建: __init__.py")
-
-    def create_readme(self):
-        """创建 README"""
-        readme_content = '''# emoji-python
+_README_CONTENT = '''# emoji-python
 
 Python 版本的 emoji-java 库，由 Java 自动迁移而来。
 
@@ -150,15 +113,21 @@ skin_tone = Fitzpatrick.TYPE_3
 基于 [emoji-java](https://github.com/vdurmont/emoji-java)
 '''
 
-        readme_file = self.package_dir / 'README.md'
-        with open(readme_file, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+_SETUP_CONTENT = '''import os
 
-        self.logger.success(f"  ✓ 创建: README.md")
+from setuptools import Extension, setup, find_packages
 
-    def create_setup(self):
-        """创建 setup.py"""
-        setup_content = '''from setuptools import setup, find_packages
+# Cython is optional: without it (or without the .pyx source) EmojiTrie falls back to its pure-Python walk
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+_PYX = '_emoji_trie.pyx'
+if cythonize is not None and os.path.exists(os.path.join(os.path.dirname(os.path.abspath(__file__)), _PYX)):
+    ext_modules = cythonize([Extension('_emoji_trie', [_PYX])])
+else:
+    ext_modules = []
 
 setup(
     name='emoji-python',
@@ -166,10 +135,21 @@ setup(
     description='Python port of emoji-java library',
     author='Auto-generated',
     packages=find_packages(),
+    ext_modules=ext_modules,
     python_requires='>=3.7',
     install_requires=[
         # Add dependencies here
     ],
+    extras_require={
+        # Incremental JSON parsing in EmojiLoader.load_emojis
+        'stream': ['ijson'],
+        # C++-backed exact lookups in EmojiTrie
+        'trie': ['marisa-trie'],
+        # Single-pass EmojiTrie.find_all
+        'scan': ['pyahocorasick'],
+        # JIT-compiled EmojiTrie lookup and find_all kernels
+        'jit': ['numba', 'numpy'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
@@ -181,18 +161,10 @@ setup(
 )
 '''
 
-        setup_file = self.package_dir / 'setup.py'
-        with open(setup_file, 'w', encoding='utf-8') as f:
-            f.write(setup_content)
-
-        self.logger.success(f"  ✓ 创建: setup.py")
-
-    def create_examples(self):
-        """创建示例代码"""
-        examples_dir = self.package_dir / 'examples'
-        examples_dir.mkdir(exist_ok=True)
+# 与迁移生成的模块一起放入包中的手写源文件 (包目录每次重建, 源文件放在本脚本旁)
+_NATIVE_SOURCES = ('_emoji_trie.pyx',)
 
-        demo_content = '''"""
+_EXAMPLE_DEMO_CONTENT = '''"""
 emoji-python 使用示例
 """
 import sys
@@ -236,12 +208,119 @@ if __name__ == '__main__':
         traceback.print_exc()
 '''
 
+
+class EmojiPackageBuilder:
+    """构建 emoji-python 包"""
+
+    def __init__(self):
+        self.logger = get_logger(verbose=True, use_color=True)
+        self.output_dir = Path(__file__).parent / 'output'
+        self.package_dir = Path(__file__).parent / 'emoji_python'
+
+    @_buffered_log
+    def build_package(self):
+        """构建 Python 包"""
+        self.logger.info("="*80)
+        self.logger.info("构建 emoji-python 包")
+        self.logger.info("="*80)
+
+        # 创建包目录
+        if self.package_dir.exists():
+            self.logger.warning(f"包目录已存在，将被覆盖: {self.package_dir}")
+            shutil.rmtree(self.package_dir)
+
+        self.package_dir.mkdir(parents=True)
+        self.logger.success(f"创建包目录: {self.package_dir}")
+
+        # 复制所有 Python 文件
+        modules = ['Emoji', 'EmojiLoader', 'EmojiManager', 'EmojiParser', 'EmojiTrie', 'Fitzpatrick']
+        copied_files = []
+        pairs = []
+
+        for module in modules:
+            src_file = self.output_dir / module / f"{module}.py"
+            dst_file = self.package_dir / f"{module}.py"
+
+            if src_file.exists():
+                pairs.append((src_file, dst_file))
+                copied_files.append(module)
+
+        # Cython 扩展的源码, setup.py 据此构建可选的 _emoji_trie
+        native_dir = Path(__file__).parent
+        pairs.extend((native_dir / name, self.package_dir / name) for name in _NATIVE_SOURCES)
+
+        _copy_files(pairs)
+        for module in modules:
+            if module in copied_files:
+                self.logger.success(f"  ✓ 复制: {module}.py")
+            else:
+                self.logger.error(f"  ✗ 未找到: {module}.py")
+        for name in _NATIVE_SOURCES:
+            self.logger.success(f"  ✓ 复制: {name}")
+
+        # 创建 __init__.py
+        self.create_init_file(copied_files)
+
+        # 创建 README
+        self.create_readme()
+
+        # 创建 setup.py
+        self.create_setup()
+
+        # 创建示例代码
+        self.create_examples()
+
+        self.logger.info("\n" + "="*80)
+        self.logger.success("包构建完成!")
+        self.logger.info("="*80)
+        self.logger.info(f"\n包位置: {self.package_dir}")
+        self.logger.info(f"包含模块: {len(copied_files)} 个")
+        self.logger.info("\n下一步:")
+        self.logger.info("  1. cd emoji_python")
+        self.logger.info("  2. python -m pytest tests/  # 运行测试")
+        self.logger.info("  3. python examples/demo.py  # 运行示例")
+
+    @_buffered_log
+    def create_init_file(self, modules):
+        """创建 __init__.py"""
+        init_content = _INIT_TEMPLATE.format(
+            imports=''.join(f"from .{module} import *\n" for module in modules),
+            names=''.join(f"    '{module}',\n" for module in modules),
+        )
+
+        init_file = self.package_dir / '__init__.py'
+        init_file.write_text(init_content, encoding='utf-8')
+
+        self.logger.success(f"  ✓ 创建: __init__.py")
+
+    @_buffered_log
+    def create_readme(self):
+        """创建 README"""
+        readme_file = self.package_dir / 'README.md'
+        readme_file.write_text(_README_CONTENT, encoding='utf-8')
+
+        self.logger.success(f"  ✓ 创建: README.md")
+
+    @_buffered_log
+    def create_setup(self):
+        """创建 setup.py"""
+        setup_file = self.package_dir / 'setup.py'
+        setup_file.write_text(_SETUP_CONTENT, encoding='utf-8')
+
+        self.logger.success(f"  ✓ 创建: setup.py")
+
+    @_buffered_log
+    def create_examples(self):
+        """创建示例代码"""
+        examples_dir = self.package_dir / 'examples'
+        examples_dir.mkdir(exist_ok=True)
+
         demo_file = examples_dir / 'demo.py'
-        with open(demo_file, 'w', encoding='utf-8') as f:
-            f.write(demo_content)
+        demo_file.write_text(_EXAMPLE_DEMO_CONTENT, encoding='utf-8')
 
         self.logger.success(f"  ✓ 创建: examples/demo.py")
 
+    @_buffered_log
     def create_tests_directory(self):
         """创建测试目录并复制测试文件"""
         tests_dir = self.package_dir / 'tests'
@@ -253,13 +332,17 @@ if __name__ == '__main__':
         # 复制测试文件
         modules = ['Emoji', 'EmojiLoader', 'EmojiManager', 'EmojiParser', 'EmojiTrie', 'Fitzpatrick']
 
+        pairs = []
         for module in modules:
             test_src = self.output_dir / module / f"test_{module}.py"
             test_dst = tests_dir / f"test_{module}.py"
 
             if test_src.exists():
-                shutil.copy2(test_src, test_dst)
-                self.logger.success(f"  ✓ 复制测试: test_{module}.py")
+                pairs.append((test_src, test_dst))
+
+        _copy_files(pairs)
+        for _, test_dst in pairs:
+            self.logger.success(f"  ✓ 复制测试: {test_dst.name}")
 
         self.logger.success(f"  ✓ 创建: tests/")
 
@@ -1,6 +1,19 @@
 # coding=utf-8
 import typing
 
+# 码点 -> HTML 实体的翻译表, 按需填充并在所有 Emoji 之间共享
+_DEC_CACHE: typing.Dict[int, str] = {}
+_HEX_CACHE: typing.Dict[int, str] = {}
+
+
+def _cache_codepoints(text: str) -> None:
+    """Registers the HTML entities of every codepoint in text that is not cached yet."""
+    for cp in map(ord, set(text)):
+        if cp not in _DEC_CACHE:
+            _DEC_CACHE[cp] = f'&#{cp};'
+            _HEX_CACHE[cp] = f'&#x{cp:04X};'
+
+
 class Emoji:
     """
     This class represents an emoji.
@@ -15,17 +28,40 @@ class Emoji:
         html_hexadecimal: The HTML hexadecimal representation of the emoji.
     """
 
-    def __init__(self, description: str, supports_fitzpatrick: bool, aliases: typing.List[str], tags: typing.List[str], bytes: bytes) -> None:
+    __slots__ = ('description', 'supports_fitzpatrick', 'aliases', 'tags', 'unicode',
+                 '_html_decimal', '_html_hexadecimal', '_str_cache')
+
+    def __init__(self, description: str, supports_fitzpatrick: bool, aliases: typing.List[str], tags: typing.List[str], unicode: str) -> None:
         self.description = description
         self.supports_fitzpatrick = supports_fitzpatrick
         self.aliases = aliases
         self.tags = tags
-        try:
-            self.unicode = bytes.decode('utf-8')
-        except UnicodeDecodeError as e:
-            raise ValueError('Invalid unicode bytes') from e
-        self.html_decimal = ''.join(f'&#{ord(c)};' for c in self.unicode)
-        self.html_hexadecimal = ''.join(f'&#x{ord(c):04X};' for c in self.unicode)
+        self.unicode = unicode
+        # HTML forms are built on first access; trie matching never needs them
+        self._html_decimal = None
+        self._html_hexadecimal = None
+        self._str_cache = None
+
+    @classmethod
+    def from_bytes(cls, description: str, supports_fitzpatrick: bool, aliases: typing.List[str], tags: typing.List[str], unicode: bytes) -> 'Emoji':
+        """Builds an emoji whose unicode representation is still UTF-8 encoded bytes."""
+        return cls(description, supports_fitzpatrick, aliases, tags, unicode.decode('utf-8'))
+
+    @property
+    def html_decimal(self) -> str:
+        """The HTML decimal representation of the emoji, computed once on first access."""
+        if self._html_decimal is None:
+            _cache_codepoints(self.unicode)
+            self._html_decimal = self.unicode.translate(_DEC_CACHE)
+        return self._html_decimal
+
+    @property
+    def html_hexadecimal(self) -> str:
+        """The HTML hexadecimal representation of the emoji, computed once on first access."""
+        if self._html_hexadecimal is None:
+            _cache_codepoints(self.unicode)
+            self._html_hexadecimal = self.unicode.translate(_HEX_CACHE)
+        return self._html_hexadecimal
 
     def get_description(self) -> str:
         """Returns the description of the emoji."""
@@ -48,5 +84,7 @@ class Emoji:
         return self.html_hexadecimal
 
     def __str__(self) -> str:
-        """Returns a string representation of this object."""
-        return f'Emoji {{ description="{self.description}", supports_fitzpatrick={self.supports_fitzpatrick}, aliases={self.aliases}, tags={self.tags}, unicode="{self.unicode}", html_decimal="{self.html_decimal}", html_hexadecimal="{self.html_hexadecimal}" }}'
\ No newline at end of file
+        """Returns a string representation of this object (built once, emojis are not modified after loading)."""
+        if self._str_cache is None:
+            self._str_cache = f'Emoji {{ description="{self.description}", supports_fitzpatrick={self.supports_fitzpatrick}, aliases={self.aliases}, tags={self.tags}, unicode="{self.unicode}", html_decimal="{self.html_decimal}", html_hexadecimal="{self.html_hexadecimal}" }}'
+        return self._str_cache
@@ -1,5 +1,18 @@
+import json
 import typing
 
+try:
+    from .Emoji import Emoji
+except ImportError:
+    from Emoji import Emoji
+
+# ijson is optional: when installed, emojis are parsed incrementally from the stream
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
 class EmojiLoader:
     """
     Loads the emojis from a JSON database.
@@ -16,11 +29,12 @@ class EmojiLoader:
         self.data = []
 
     def load_emojis(self, stream: typing.IO) -> typing.List[Emoji]:
-        emojis_json = json.loads(stream.read())
-        for emoji in emojis_json:
-            emoji_obj = self.build_emoji_from_json(emoji)
-            if emoji_obj is not None:
-                self.data.append(emoji_obj)
+        if ijson is not None:
+            emojis_json = ijson.items(stream, 'item')
+        else:
+            emojis_json = json.load(stream)
+        built = (self.build_emoji_from_json(emoji) for emoji in emojis_json)
+        self.data.extend(emoji for emoji in built if emoji is not None)
         return self.data
 
     def build_emoji_from_json(self, json: typing.Any) -> typing.Optional[Emoji]:
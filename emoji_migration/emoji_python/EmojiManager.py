@@ -1,24 +1,50 @@
 import typing
+from types import MappingProxyType
 
 class EmojiManager:
     """
     Holds the loaded emojis and provides search functions.
     
     Attributes:
-        EMOJIS_BY_ALIAS (dict): A map of alias to emojis
-        EMOJIS_BY_TAG (dict): A map of tags to emojis
+        EMOJIS_BY_ALIAS (Mapping): A read-only map of alias to emojis
+        EMOJIS_BY_TAG (Mapping): A read-only map of tags to emojis
         ALL_EMOJIS (list): A list of all loaded emojis
         EMOJI_TRIE (EmojiTrie): An EmojiTrie object containing the loaded emojis
     """
     
-    def __init__(self) -> None:
+    def __init__(self, emojis: typing.Iterable[Emoji] = ()) -> None:
         """
         Initializes the EmojiManager with the given resources.
+        
+        Args:
+            emojis (Iterable): The emojis to load, typically from EmojiLoader
+        """
+        self.loadEmojis(emojis)
+    
+    def loadEmojis(self, emojis: typing.Iterable[Emoji]) -> None:
         """
-        self.EMOJIS_BY_ALIAS = {}
-        self.EMOJIS_BY_TAG = {}
-        self.ALL_EMOJIS = []
-        self.EMOJI_TRIE = EmojiTrie(self.ALL_EMOJIS)
+        Replaces the loaded emojis and rebuilds the alias/tag maps and the trie.
+        
+        The maps are only written here, so once loading finishes they are
+        exposed as read-only views instead of mutable dicts.
+        
+        Args:
+            emojis (Iterable): The emojis to load
+        """
+        all_emojis = list(emojis)
+        by_alias = {}
+        by_tag = {}
+        for emoji in all_emojis:
+            for tag in emoji.tags:
+                by_tag.setdefault(tag, set()).add(emoji)
+            for alias in emoji.aliases:
+                by_alias[alias] = emoji
+        self.EMOJIS_BY_ALIAS = MappingProxyType(by_alias)
+        self.EMOJIS_BY_TAG = MappingProxyType(by_tag)
+        # Tags only change here, so getAllTags can hand out one snapshot
+        self._all_tags = tuple(by_tag)
+        self.ALL_EMOJIS = all_emojis
+        self.EMOJI_TRIE = EmojiTrie(all_emojis)
     
     def getForTag(self, tag: str) -> typing.Set[Emoji]:
         """
@@ -70,17 +96,23 @@ class EmojiManager:
         return self.ALL_EMOJIS
     
     @staticmethod
-    def isEmoji(string: str) -> bool:
+    def isEmoji(string: typing.Union[str, typing.Sequence[str]]) -> bool:
         """
         Tests if a given String is an emoji.
         
+        Also accepts a sequence of chars, covering the Java isEmoji(char[]) overload
+        that is available on instances as isEmojiSequence.
+        
         Args:
-            string (str): The string to test
+            string (str): The string (or sequence of chars) to test
             
         Returns:
             bool: True if the string is an emoji, False otherwise
         """
-        return EmojiParser.getNextUnicodeCandidate(string.toCharArray(), 0) != None and EmojiParser.getNextUnicodeCandidate(string.toCharArray(), 0).emojiStartIndex == 0 and EmojiParser.getNextUnicodeCandidate(string.toCharArray(), 0).fitzpatrickEndIndex == len(string)
+        if not isinstance(string, str):
+            string = ''.join(string)
+        candidate = EmojiParser.getNextUnicodeCandidate(list(string), 0)
+        return candidate is not None and candidate.emojiStartIndex == 0 and candidate.fitzpatrickEndIndex == len(string)
     
     @staticmethod
     def containsEmoji(string: str) -> bool:
@@ -93,7 +125,7 @@ class EmojiManager:
         Returns:
             bool: True if the string contains an emoji, False otherwise
         """
-        return EmojiParser.getNextUnicodeCandidate(string.toCharArray(), 0) != None
+        return EmojiParser.getNextUnicodeCandidate(list(string), 0) is not None
     
     @staticmethod
     def isOnlyEmojis(string: str) -> bool:
@@ -106,30 +138,29 @@ class EmojiManager:
         Returns:
             bool: True if the string only contains emojis, False otherwise
         """
-        return string != None and EmojiParser.removeAllEmojis(string) == ""
+        return string is not None and EmojiParser.removeAllEmojis(string) == ""
     
-    @staticmethod
-    def isEmoji(sequence: typing.Sequence[typing.Any]) -> "EmojiTrie.Matches":
+    def isEmojiSequence(self, sequence: typing.Sequence[str]) -> bool:
         """
-        Checks if sequence of chars contain an emoji.
+        Checks if sequence of chars is exactly one of the loaded emojis.
+
+        Named apart from isEmoji(string) so that it no longer replaces it
+        (Python has no overloading by parameter type); isEmoji also accepts
+        a sequence of chars.
         
         Args:
-            sequence (Sequence): Sequence of char that may contain emoji in full or partially.
+            sequence (Sequence): Sequence of char that may be an emoji.
             
         Returns:
-            EmojiTrie.Matches: 
-                Matches.EXACTLY if char sequence in its entirety is an emoji
-                Matches.POSSIBLY if char sequence matches prefix of an emoji
-                Matches.IMPOSSIBLE if char sequence matches no emoji or prefix of an emoji
+            bool: True if the char sequence in its entirety is a loaded emoji
         """
-        return self.EMOJI_TRIE.isEmoji(sequence)
+        return self.EMOJI_TRIE.is_emoji(sequence)
     
-    @staticmethod
-    def getAllTags() -> typing.List[str]:
+    def getAllTags(self) -> typing.Tuple[str, ...]:
         """
         Returns all the tags in the database
         
         Returns:
-            list: A list of all tags
+            tuple: All tags, computed once per load; copy it if you need a list
         """
-        return list(self.EMOJIS_BY_TAG.keys())
\ No newline at end of file
+        return self._all_tags
\ No newline at end of file
@@ -1,6 +1,12 @@
 import re
 from typing import List
 
+# Shared across instances. _BRACE_RE is the public, non-capturing pattern exposed as .regex;
+# _BRACE_TEXT_RE captures the text without the brackets for findall
+_BRACE_RE = re.compile(r"\{.*?\}")
+_BRACE_TEXT_RE = re.compile(r"\{(.*?)\}")
+
+
 class BusinessParser:
     """
     This class is responsible for parsing the business needs from a given string.
@@ -9,95 +15,25 @@ class BusinessParser:
     """
 
     def __init__(self):
-        self.regex = re.compile(r"\{.*?\}")
-
-    def parse_business_domain(self, business_needs: str) -> List[str]:
-        """
-        Extracts the business domain from a given string. The domain is considered to be any text between curly brackets {}.
-
-        Args:
-            business_needs (str): A string containing the business needs.
-
-        Returns:
-            List[str]: A list of strings representing the different business domains found in the input string.
-        """
-        matches = self.regex.findall(business_needs)
-        return [match[1:-1] for match in matches]
-
-    def parse_core_functions(self, business_needs: str) -> List[str]:
-        """
-        Extracts the core functions from a given string. The core functions are considered to be any text between curly brackets {}.
-
-        Args:
-            business_needs (str): A string containing the business needs.
-
-        Returns:
-            List[str]: A list of strings representing the different core functions found in the input string.
-        """
-        matches = self.regex.findall(business_needs)
-        return [match[1:-1] for match in matches]
-
-    def parse_data_structures(self, business_needs: str) -> List[str]:
-        """
-        Extracts the data structures from a given string. The data structures are considered to be any text between curly brackets {}.
-
-        Args:
-            business_needs (str): A string containing the business needs.
-
-        Returns:
-            List[str]: A list of strings representing the different data structures found in the input string.
-        """
-        matches = self.regex.findall(business_needs)
-        return [match[1:-1] for match in matches]
+        self.regex = _BRACE_RE
 
-    def parse_technical_requirements(self, business_needs: str) -> List[str]:
+    def _extract(self, business_needs: str) -> List[str]:
         """
-        Extracts the technical requirements from a given string. The technical requirements are considered to be any text between curly brackets {}.
+        Extracts every piece of text between curly brackets {} from a given string.
 
         Args:
             business_needs (str): A string containing the business needs.
 
         Returns:
-            List[str]: A list of strings representing the different technical requirements found in the input string.
-        """
-        matches = self.regex.findall(business_needs)
-        return [match[1:-1] for match in matches]
-
-    def parse_external_dependencies(self, business_needs: str) -> List[str]:
-        """
-        Extracts the external dependencies from a given string. The external dependencies are considered to be any text between curly brackets {}.
-
-        Args:
-            business_needs (str): A string containing the business needs.
-
-        Returns:
-            List[str]: A list of strings representing the different external dependencies found in the input string.
-        """
-        matches = self.regex.findall(business_needs)
-        return [match[1:-1] for match in matches]
-
-    def parse_quality_requirements(self, business_needs: str) -> List[str]:
-        """
-        Extracts the quality requirements from a given string. The quality requirements are considered to be any text between curly brackets {}.
-
-        Args:
-            business_needs (str): A string containing the business needs.
-
-        Returns:
-            List[str]: A list of strings representing the different quality requirements found in the input string.
-        """
-        matches = self.regex.findall(business_needs)
-        return [match[1:-1] for match in matches]
-
-    def parse_migration_challenges(self, business_needs: str) -> List[str]:
-        """
-        Extracts the migration challenges from a given string. The migration challenges are considered to be any text between curly brackets {}.
-
-        Args:
-            business_needs (str): A string containing the business needs.
-
-        Returns:
-            List[str]: A list of strings representing the different migration challenges found in the input string.
-        """
-        matches = self.regex.findall(business_needs)
-        return [match[1:-1] for match in matches]
\ No newline at end of file
+            List[str]: A list of strings found between curly brackets in the input string.
+        """
+        return _BRACE_TEXT_RE.findall(business_needs)
+
+    # All sections share the same extraction rule
+    parse_business_domain = _extract
+    parse_core_functions = _extract
+    parse_data_structures = _extract
+    parse_technical_requirements = _extract
+    parse_external_dependencies = _extract
+    parse_quality_requirements = _extract
+    parse_migration_challenges = _extract
@@ -1,11 +1,99 @@
+import functools
+import json
+import sys
 import typing
-from typing import List, Optional
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import List, Optional, Tuple
+
+# Numba is optional: when installed, lookups run in a JIT-compiled kernel over the CSR arrays
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+# The Cython extension is optional: when built, the array walk runs as compiled code
+try:
+    from ._emoji_trie import trie_lookup as _c_trie_lookup
+except ImportError:
+    try:
+        from _emoji_trie import trie_lookup as _c_trie_lookup
+    except ImportError:
+        _c_trie_lookup = None
+
+# marisa-trie is optional: when installed, exact lookups are a single call into its C++ trie
+try:
+    import marisa_trie
+except ImportError:
+    marisa_trie = None
+
+# pyahocorasick is optional: when installed, find_all scans text in a single C pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Version of the JSON layout written by EmojiTrie.save
+_SAVE_FORMAT = 1
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _trie_lookup(codepoints, child_start, emoji_ref, text):
+        """Follows the codepoints of text from the root; returns the reached emoji_ref, or -1."""
+        node = 0
+        for k in range(text.shape[0]):
+            cp = text[k]
+            lo = child_start[node]
+            end = child_start[node + 1]
+            hi = end
+            while lo < hi:
+                mid = (lo + hi) >> 1
+                if codepoints[mid] < cp:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo == end or codepoints[lo] != cp:
+                return -1
+            node = lo + 1
+        return emoji_ref[node]
+
+    @njit(cache=True)
+    def _trie_find_all(codepoints, child_start, emoji_ref, text, max_depth):
+        """Walks text from every position; returns (start, end, emoji_ref) for each match."""
+        matches = [(0, 0, 0) for _ in range(0)]
+        size = text.shape[0]
+        for start in range(size):
+            node = 0
+            for k in range(start, min(size, start + max_depth)):
+                cp = text[k]
+                lo = child_start[node]
+                end = child_start[node + 1]
+                hi = end
+                while lo < hi:
+                    mid = (lo + hi) >> 1
+                    if codepoints[mid] < cp:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                if lo == end or codepoints[lo] != cp:
+                    break
+                node = lo + 1
+                if emoji_ref[node] >= 0:
+                    matches.append((start, k + 1, emoji_ref[node]))
+        return matches
+
 
 class Emoji:
     def __init__(self, unicode: str) -> None:
         self.unicode = unicode
 
 class Node:
+    # A trie has one Node per distinct prefix, so drop the per-instance __dict__
+    __slots__ = ('children', 'emoji')
+
     def __init__(self) -> None:
         self.children = {}  # type: Dict[str, Node]
         self.emoji = None  # type: Optional[Emoji]
@@ -22,44 +110,283 @@ class Node:
     def add_child(self, child: str) -> None:
         self.children[child] = Node()
 
-    def get_child(self, child: str) -> Optional[Node]:
-        if child in self.children:
-            return self.children[child]
-        else:
-            return None
+    def get_child(self, child: str) -> Optional['Node']:
+        return self.children.get(child)
 
     def is_end_of_emoji(self) -> bool:
         return self.emoji is not None
 
 class EmojiTrie:
     def __init__(self, emojis: List[Emoji]) -> None:
-        self.root = Node()
+        # The Node tree only exists while building; lookups read the frozen arrays
+        root = Node()
         self.max_depth = 0
+        # Inserting in codepoint order creates every node's children already sorted, so
+        # _freeze can lay them out without sorting (sorted() is stable: duplicates keep last-wins)
+        emojis = sorted(emojis, key=lambda emoji: emoji.unicode)
+        self.min_depth = min((len(emoji.unicode) for emoji in emojis), default=0)
         for emoji in emojis:
-            tree = self.root
-            chars = list(emoji.unicode)
-            self.max_depth = max(self.max_depth, len(chars))
-            for c in chars:
-                if not tree.has_child(c):
-                    tree.add_child(c)
-                tree = tree.get_child(c)
+            tree = root
+            self.max_depth = max(self.max_depth, len(emoji.unicode))
+            for c in map(sys.intern, emoji.unicode):
+                # One probe per char; a Node is only allocated when the edge is new
+                child = tree.children.get(c)
+                if child is None:
+                    child = tree.children[c] = Node()
+                tree = child
             tree.set_emoji(emoji)
+        # Cheap first cut: most non-emoji input is rejected on its length or first char
+        self._first_chars = frozenset(root.children)
+        self._freeze(root)
+
+    def _freeze(self, root: Node) -> None:
+        """
+        Lays the built trie out as flat CSR-style arrays used by the lookups.
+
+        Nodes are numbered breadth-first. The children of node n occupy
+        positions child_start[n]:child_start[n + 1] of codepoints, sorted by
+        codepoint (children are inserted in that order by __init__), and the
+        child reached through position k is node k + 1.
+        emoji_ref[n] indexes into _emojis, or is -1 when node n ends no emoji.
+        When every edge fits in 16 bits (BMP characters and the surrogate
+        halves used by Fitzpatrick) codepoints is stored as uint16.
+        """
+        self._codepoints = array('i')
+        self._child_start = array('i', [0])
+        self._emoji_ref = array('i')
+        self._emojis = []  # type: List[Emoji]
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            if node.emoji is None:
+                self._emoji_ref.append(-1)
+            else:
+                self._emoji_ref.append(len(self._emojis))
+                self._emojis.append(node.emoji)
+            for c in node.children:
+                self._codepoints.append(ord(c))
+                queue.append(node.children[c])
+            self._child_start.append(len(self._codepoints))
+        if not self._codepoints or max(self._codepoints) <= 0xFFFF:
+            self._codepoints = array('H', self._codepoints)
+        self._attach()
+
+    def _attach(self) -> None:
+        """Sets up the optional lookup backends and the cache from the frozen arrays."""
+        if njit is not None:
+            # Zero-copy views handed to the compiled kernel
+            self._np_codepoints = np.frombuffer(
+                self._codepoints, dtype=np.uint16 if self._codepoints.typecode == 'H' else np.int32)
+            self._np_child_start = np.frombuffer(self._child_start, dtype=np.int32)
+            self._np_emoji_ref = np.frombuffer(self._emoji_ref, dtype=np.int32)
+        if marisa_trie is not None:
+            # Keys are UTF-8 with surrogatepass because the Fitzpatrick modifiers are lone surrogates
+            keys = [emoji.unicode.encode('utf-8', 'surrogatepass') for emoji in self._emojis]
+            self._marisa = marisa_trie.BinaryTrie(keys)
+            # marisa assigns its own key ids; map them back to indexes in _emojis
+            self._marisa_ref = array('i', bytes(4 * len(keys)))
+            for i, key in enumerate(keys):
+                self._marisa_ref[self._marisa[key]] = i
+        self._automaton = None
+        if ahocorasick is not None and self.max_depth > 0:
+            self._automaton = ahocorasick.Automaton()
+            for i, emoji in enumerate(self._emojis):
+                if emoji.unicode:
+                    self._automaton.add_word(emoji.unicode, i)
+            self._automaton.make_automaton()
+        # Lookups are pure for a given trie, so repeated texts reuse earlier results
+        self._get_emoji_cached = functools.lru_cache(maxsize=4096)(self._raw_get_emoji)
+
+    def save(self, path: str) -> None:
+        """
+        Writes the frozen arrays to path as JSON so EmojiTrie.load can skip the build.
+
+        Only plain numbers are stored (no pickled objects), so loading a file never executes
+        code from it. Emojis are written as their codepoints: JSON would merge the surrogate
+        pairs of the Fitzpatrick modifiers into single characters.
+        """
+        state = {
+            'format': _SAVE_FORMAT,
+            'max_depth': self.max_depth,
+            'min_depth': self.min_depth,
+            'codepoints': self._codepoints.tolist(),
+            'child_start': self._child_start.tolist(),
+            'emoji_ref': self._emoji_ref.tolist(),
+            'emojis': [[ord(c) for c in emoji.unicode] for emoji in self._emojis],
+        }
+        with open(path, 'w', encoding='ascii') as f:
+            json.dump(state, f)
+
+    @classmethod
+    def load(cls, path: str, emojis: List[Emoji]) -> 'EmojiTrie':
+        """
+        Restores a trie written by save without re-inserting every emoji.
+
+        Args:
+            path: A file written by save
+            emojis: The emojis the trie was built from; the saved trie refers to them by unicode
+
+        Raises:
+            ValueError: If the file has another format or names an emoji missing from emojis
+        """
+        with open(path, 'r', encoding='ascii') as f:
+            state = json.load(f)
+        if state.get('format') != _SAVE_FORMAT:
+            raise ValueError(f"Unsupported EmojiTrie file format: {state.get('format')!r}")
+        by_unicode = {emoji.unicode: emoji for emoji in emojis}
+        try:
+            saved_emojis = [by_unicode[''.join(map(chr, unicode))] for unicode in state['emojis']]
+        except KeyError as e:
+            raise ValueError(f"Saved trie refers to an unknown emoji: {e.args[0]!r}") from None
+        trie = cls.__new__(cls)
+        trie.max_depth = state['max_depth']
+        trie.min_depth = state['min_depth']
+        codepoints = state['codepoints']
+        trie._codepoints = array('H' if not codepoints or max(codepoints) <= 0xFFFF else 'i', codepoints)
+        trie._child_start = array('i', state['child_start'])
+        trie._emoji_ref = array('i', state['emoji_ref'])
+        trie._emojis = saved_emojis
+        # The root's children are the first char of every emoji
+        trie._first_chars = frozenset(map(chr, codepoints[trie._child_start[0]:trie._child_start[1]]))
+        trie._attach()
+        return trie
+
+    def cache_clear(self) -> None:
+        """Drops memoized get_emoji results (needed only if the trie is rebuilt in place)."""
+        self._get_emoji_cached.cache_clear()
+
+    def _walk(self, sequence: typing.Iterable[str]) -> int:
+        """Returns the node reached by following sequence from the root, or -1."""
+        codepoints = self._codepoints
+        child_start = self._child_start
+        node = 0
+        for c in sequence:
+            cp = ord(c)
+            hi = child_start[node + 1]
+            i = bisect_left(codepoints, cp, child_start[node], hi)
+            if i == hi or codepoints[i] != cp:
+                return -1
+            node = i + 1
+        return node
+
+    def _lookup(self, sequence: typing.Iterable[str]) -> int:
+        """Returns the index in _emojis of the emoji spelled by sequence, or -1."""
+        if not isinstance(sequence, str):
+            sequence = ''.join(sequence)
+        n = len(sequence)
+        if n < self.min_depth or n > self.max_depth or (n and sequence[0] not in self._first_chars):
+            return -1
+        if marisa_trie is not None:
+            key_id = self._marisa.get(sequence.encode('utf-8', 'surrogatepass'), -1)
+            return self._marisa_ref[key_id] if key_id >= 0 else -1
+        if _c_trie_lookup is not None:
+            return _c_trie_lookup(self._codepoints, self._child_start, self._emoji_ref, sequence)
+        if njit is not None:
+            text = np.frombuffer(sequence.encode('utf-32-le', 'surrogatepass'), dtype=np.int32)
+            return _trie_lookup(self._np_codepoints, self._np_child_start, self._np_emoji_ref, text)
+        node = self._walk(sequence)
+        return self._emoji_ref[node] if node >= 0 else -1
 
     def is_emoji(self, sequence: List[str]) -> bool:
         """Checks if a sequence of chars contains an emoji."""
-        tree = self.root
-        for c in sequence:
-            if not tree.has_child(c):
-                return False
-            tree = tree.get_child(c)
-        return tree.is_end_of_emoji()
+        if not sequence:
+            return False
+        return self._lookup(sequence) >= 0
+
+    def _raw_get_emoji(self, unicode: str) -> Optional[Emoji]:
+        ref = self._lookup(unicode)
+        return self._emojis[ref] if ref >= 0 else None
 
     def get_emoji(self, unicode: str) -> Optional[Emoji]:
         """Finds an emoji instance from a given Unicode string."""
-        chars = list(unicode)
-        tree = self.root
-        for c in chars:
-            if not tree.has_child(c):
-                return None
-            tree = tree.get_child(c)
-        return tree.get_emoji()
\ No newline at end of file
+        if not unicode:
+            return None
+        return self._get_emoji_cached(unicode)
+
+    def scan(self, text: str, pos: int = 0) -> Optional[Tuple[int, Emoji]]:
+        """
+        Finds the longest emoji starting at text[pos] in a single forward walk.
+
+        Returns:
+            (end, emoji) with end exclusive, or None when no emoji starts at pos.
+        """
+        if pos >= len(text) or text[pos] not in self._first_chars:
+            return None
+        codepoints = self._codepoints
+        child_start = self._child_start
+        emoji_ref = self._emoji_ref
+        node = 0
+        match = None
+        for end in range(pos, min(len(text), pos + self.max_depth)):
+            cp = ord(text[end])
+            hi = child_start[node + 1]
+            i = bisect_left(codepoints, cp, child_start[node], hi)
+            if i == hi or codepoints[i] != cp:
+                break
+            node = i + 1
+            if emoji_ref[node] >= 0:
+                match = (end + 1, self._emojis[emoji_ref[node]])
+        return match
+
+    def find_longest(self, text: str) -> List[Tuple[int, int, Emoji]]:
+        """
+        Splits the emojis out of text left to right, taking the longest emoji at each match.
+
+        Returns:
+            Non-overlapping (start, end, emoji) tuples with end exclusive, in text order.
+        """
+        # find_all runs in C (pyahocorasick) or numba when available and orders matches by
+        # start then end, so the last match seen for a start is the longest one
+        longest = {}
+        for start, end, emoji in self.find_all(text):
+            longest[start] = (end, emoji)
+        matches = []
+        pos = 0
+        for start, (end, emoji) in longest.items():
+            if start >= pos:
+                matches.append((start, end, emoji))
+                pos = end
+        return matches
+
+    def find_all(self, text: str) -> List[Tuple[int, int, Emoji]]:
+        """
+        Finds every emoji occurring in text, overlapping matches included.
+
+        Returns:
+            (start, end, emoji) tuples with end exclusive, ordered by start then end.
+        """
+        emojis = self._emojis
+        if self._automaton is not None:
+            matches = [(end + 1 - len(emojis[i].unicode), end + 1, emojis[i])
+                       for end, i in self._automaton.iter(text)]
+            matches.sort(key=lambda match: (match[0], match[1]))
+            return matches
+        if njit is not None:
+            found = _trie_find_all(self._np_codepoints, self._np_child_start, self._np_emoji_ref,
+                                   np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.int32),
+                                   self.max_depth)
+            return [(start, end, emojis[ref]) for start, end, ref in found]
+        codepoints = self._codepoints
+        child_start = self._child_start
+        emoji_ref = self._emoji_ref
+        first_chars = self._first_chars
+        size = len(text)
+        matches = []
+        for start in range(size):
+            if text[start] not in first_chars:
+                continue
+            node = 0
+            for end in range(start, min(size, start + self.max_depth)):
+                cp = ord(text[end])
+                hi = child_start[node + 1]
+                i = bisect_left(codepoints, cp, child_start[node], hi)
+                if i == hi or codepoints[i] != cp:
+                    break
+                node = i + 1
+                if emoji_ref[node] >= 0:
+                    matches.append((start, end + 1, emojis[emoji_ref[node]]))
+        return matches
+
+
+class FrozenEmojiTrie(EmojiTrie):
+    """Kept for compatibility: every EmojiTrie now drops its Node tree once the arrays are built."""
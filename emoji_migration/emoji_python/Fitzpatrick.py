@@ -1,4 +1,5 @@
 import enum
+from types import MappingProxyType
 
 class Fitzpatrick(enum.Enum):
     """
@@ -18,8 +19,10 @@ class Fitzpatrick(enum.Enum):
     TYPE_5 = "\uD83C\uDFFE"
     TYPE_6 = "\uD83C\uDFFF"
     
-    def __init__(self, unicode: str):
-        self.unicode = unicode
+    @property
+    def unicode(self) -> str:
+        """The Unicode representation of the modifier (the member value)."""
+        return self.value
     
     @classmethod
     def fitzpatrick_from_unicode(cls, unicode: str) -> "Fitzpatrick":
@@ -32,10 +35,7 @@ class Fitzpatrick(enum.Enum):
         Returns:
             Fitzpatrick: The corresponding Fitzpatrick modifier, or None if it is not found.
         """
-        for v in cls:
-            if v.unicode == unicode:
-                return v
-        return None
+        return cls._BY_UNICODE.get(unicode)
     
     @classmethod
     def fitzpatrick_from_type(cls, type: str) -> "Fitzpatrick":
@@ -48,7 +48,13 @@ class Fitzpatrick(enum.Enum):
         Returns:
             Fitzpatrick: The corresponding Fitzpatrick modifier, or None if it is not found.
         """
-        try:
-            return cls(type)
-        except ValueError:
-            return None
\ No newline at end of file
+        return cls._BY_UNICODE.get(type)
+
+
+# Built once after the enum body so lookups by unicode are a single dict.get
+Fitzpatrick._BY_UNICODE = {m.value: m for m in Fitzpatrick}
+
+# Read-only plain-string views for hot paths that only need the unicode <-> name mapping
+# and would otherwise pay for enum member access
+FITZPATRICK_BY_UNICODE = MappingProxyType({m.value: m.name for m in Fitzpatrick})
+FITZPATRICK_BY_NAME = MappingProxyType({m.name: m.value for m in Fitzpatrick})
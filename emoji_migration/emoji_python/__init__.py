@@ -20,5 +20,8 @@ __all__ = [
     'EmojiManager',
     'EmojiParser',
     'EmojiTrie',
+    'FrozenEmojiTrie',
     'Fitzpatrick',
+    'FITZPATRICK_BY_UNICODE',
+    'FITZPATRICK_BY_NAME',
 ]
@@ -0,0 +1,27 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled walk over the frozen EmojiTrie arrays, used when the extension is built."""
+
+ctypedef fused edge_t:
+    unsigned short
+    int
+
+
+def trie_lookup(const edge_t[:] codepoints, const int[:] child_start, const int[:] emoji_ref, str text):
+    """Follows the codepoints of text from the root; returns the reached emoji_ref, or -1."""
+    cdef Py_ssize_t node = 0
+    cdef Py_ssize_t lo, hi, mid, end
+    cdef Py_UCS4 c
+    for c in text:
+        lo = child_start[node]
+        end = child_start[node + 1]
+        hi = end
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if <Py_UCS4>codepoints[mid] < c:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == end or <Py_UCS4>codepoints[lo] != c:
+            return -1
+        node = lo + 1
+    return emoji_ref[node]
@@ -1,4 +1,18 @@
-from setuptools import setup, find_packages
+import os
+
+from setuptools import Extension, setup, find_packages
+
+# Cython is optional: without it (or without the .pyx source) EmojiTrie falls back to its pure-Python walk
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+_PYX = '_emoji_trie.pyx'
+if cythonize is not None and os.path.exists(os.path.join(os.path.dirname(os.path.abspath(__file__)), _PYX)):
+    ext_modules = cythonize([Extension('_emoji_trie', [_PYX])])
+else:
+    ext_modules = []
 
 setup(
     name='emoji-python',
@@ -6,10 +20,21 @@ setup(
     description='Python port of emoji-java library',
     author='Auto-generated',
     packages=find_packages(),
+    ext_modules=ext_modules,
     python_requires='>=3.7',
     install_requires=[
         # Add dependencies here
     ],
+    extras_require={
+        # Incremental JSON parsing in EmojiLoader.load_emojis
+        'stream': ['ijson'],
+        # C++-backed exact lookups in EmojiTrie
+        'trie': ['marisa-trie'],
+        # Single-pass EmojiTrie.find_all
+        'scan': ['pyahocorasick'],
+        # JIT-compiled EmojiTrie lookup and find_all kernels
+        'jit': ['numba', 'numpy'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
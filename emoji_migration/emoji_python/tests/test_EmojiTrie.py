@@ -70,4 +70,4 @@ def test_get_emoji_invalid(emojis):
     assert emoji_trie.get_emoji("😩") == None
     assert emoji_trie.get_emoji("😪") == None
     assert emoji_trie.get_emoji("😫") == None
-    assert emoji_trie.get_emoji("😬") == None
\ No newline at end of file
+    assert emoji_trie.get_emoji("😬") == None
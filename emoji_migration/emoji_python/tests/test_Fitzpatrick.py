@@ -32,10 +32,7 @@ class Fitzpatrick(NamedTuple):
         Returns:
             typing.Optional[Fitzpatrick]: The Fitzpatrick modifier if found, else None.
         """
-        for v in cls:
-            if v.unicode == unicode:
-                return v
-        return None
+        return cls._UNICODE_INDEX.get(unicode)
 
     @classmethod
     def fitzpatrick_from_type(cls, type: str) -> Optional[Fitzpatrick]:
@@ -48,7 +45,9 @@ class Fitzpatrick(NamedTuple):
         Returns:
             typing.Optional[Fitzpatrick]: The Fitzpatrick modifier if found, else None.
         """
-        try:
-            return cls(type.upper())
-        except ValueError:
-            return None
\ No newline at end of file
+        # cls(value) looked the member up by its unicode value, so this is the same index
+        return cls._UNICODE_INDEX.get(type.upper())
+
+
+# The modifiers never change, so the lookup index is built once after the class
+Fitzpatrick._UNICODE_INDEX = {v.unicode: v for v in Fitzpatrick}
@@ -3,6 +3,10 @@ emoji-java 项目迁移脚本
 将 emoji-java 项目的 Java 代码迁移为 Python 代码
 """
 import sys
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # 设置编码
@@ -18,7 +22,19 @@ sys.path.insert(0, str(project_root / 'src'))
 from costrict_orchestrator import StrictModeOrchestrator
 from llm_providers import create_llm_provider
 from logger import get_logger
-import json
+from report_io import read_text, write_json
+from thread_output import ThreadBufferedStream
+
+
+def _normalize_for_json(obj):
+    """把结果递归转换为 JSON 原生类型, 其余值转为 str() (与 default=str 的输出一致)"""
+    if obj is None or isinstance(obj, (str, int, float)):
+        return obj
+    if isinstance(obj, dict):
+        return {key: _normalize_for_json(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_normalize_for_json(value) for value in obj]
+    return str(obj)
 
 
 class EmojiJavaMigrator:
@@ -41,19 +57,51 @@ class EmojiJavaMigrator:
             'src/main/java/com/vdurmont/emoji/EmojiTrie.java',
             'src/main/java/com/vdurmont/emoji/Fitzpatrick.java',
         ]
+        # 源文件的完整路径只拼接一次
+        self._java_file_paths = {f: self.emoji_java_dir / f for f in self.java_files}
+        # 编排器按线程创建 (见 orchestrator)
+        self._local = threading.local()
+
+    @functools.cached_property
+    def provider(self):
+        """LLM 提供者, 首次使用时创建, 之后所有文件共用"""
+        try:
+            self.logger.info("尝试连接 Ollama...")
+            provider = create_llm_provider("ollama", model="codellama")
+            self.logger.success("使用 Ollama (codellama)")
+        except Exception as e:
+            self.logger.warning(f"Ollama 连接失败: {e}")
+            self.logger.info("使用 Mock 模式")
+            provider = create_llm_provider("mock")
+        return provider
+
+    @property
+    def orchestrator(self):
+        """
+        当前线程的编排器, 每个线程首次使用时创建, 之后复用
+
+        编排器与其智能体在一次迁移中保存运行状态 (上下文、阶段结果), 不能被并行的文件共用;
+        因此每个线程各有一个实例, 串行迁移和 --file 只有主线程的这一个实例. LLM 提供者则所有线程共用.
+        """
+        orchestrator = getattr(self._local, 'orchestrator', None)
+        if orchestrator is None:
+            orchestrator = StrictModeOrchestrator(
+                self.provider,
+                enable_all_phases=self.use_strict_mode
+            )
+            self._local.orchestrator = orchestrator
+        return orchestrator
 
     def read_java_file(self, relative_path):
         """读取 Java 文件内容"""
-        file_path = self.emoji_java_dir / relative_path
-        if not file_path.exists():
-            self.logger.error(f"文件不存在: {file_path}")
-            return None
-
+        file_path = self._java_file_paths.get(relative_path) or self.emoji_java_dir / relative_path
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = read_text(file_path)
             self.logger.info(f"读取文件: {relative_path}")
             return content
+        except FileNotFoundError:
+            self.logger.error(f"文件不存在: {file_path}")
+            return None
         except Exception as e:
             self.logger.error(f"读取文件失败 {relative_path}: {e}")
             return None
@@ -95,23 +143,28 @@ class EmojiJavaMigrator:
         # 保存 Python 代码
         if results.get('python_code'):
             python_file = output_file_dir / f"{output_name}.py"
-            with open(python_file, 'w', encoding='utf-8') as f:
-                f.write(results['python_code'])
+            python_file.write_bytes(results['python_code'].encode('utf-8'))
             self.logger.success(f"Python 代码已保存: {python_file}")
 
         # 保存测试代码
         if results.get('test_code'):
             test_file = output_file_dir / f"test_{output_name}.py"
-            with open(test_file, 'w', encoding='utf-8') as f:
-                f.write(results['test_code'])
+            test_file.write_bytes(results['test_code'].encode('utf-8'))
             self.logger.success(f"测试代码已保存: {test_file}")
 
         # 保存详细报告
         report_file = output_file_dir / "migration_report.json"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+        # 预先转换为原生类型, 编码器全程走快速路径, 不再回调 default
+        write_json(report_file, _normalize_for_json(results))
         self.logger.success(f"迁移报告已保存: {report_file}")
 
+        # 验证只需要质量评分, 另存一份小摘要, 免得再解析完整报告
+        review = results.get('review_report')
+        write_json(output_file_dir / "summary.json", {
+            'name': output_name,
+            'overall_score': review.get('overall_score', 0) if review else None
+        })
+
     def migrate_all(self):
         """迁移所有文件"""
         self.logger.info("="*80)
@@ -124,20 +177,7 @@ class EmojiJavaMigrator:
         self.logger.info("")
 
         # 创建 LLM Provider
-        try:
-            self.logger.info("尝试连接 Ollama...")
-            provider = create_llm_provider("ollama", model="codellama")
-            self.logger.success("使用 Ollama (codellama)")
-        except Exception as e:
-            self.logger.warning(f"Ollama 连接失败: {e}")
-            self.logger.info("使用 Mock 模式")
-            provider = create_llm_provider("mock")
-
-        # 创建编排器
-        orchestrator = StrictModeOrchestrator(
-            provider,
-            enable_all_phases=self.use_strict_mode
-        )
+        provider = self.provider
 
         # 迁移统计
         total = len(self.java_files)
@@ -145,11 +185,33 @@ class EmojiJavaMigrator:
         failed = 0
         results_list = []
 
-        # 逐个迁移文件
-        for i, java_file in enumerate(self.java_files, 1):
-            self.logger.info(f"\n进度: [{i}/{total}]")
+        # 各文件相互独立且耗时主要在 LLM 请求上, 并行迁移
+        def migrate_one(java_file):
+            return self.migrate_file(java_file, provider, self.orchestrator)
 
-            result = self.migrate_file(java_file, provider, orchestrator)
+        # 日志与 print 按线程缓冲, 再按文件顺序整体输出
+        stdout = sys.stdout
+        stream = ThreadBufferedStream(stdout)
+        handlers = [h for h in self.logger.logger.handlers if isinstance(h, logging.StreamHandler)]
+        previous = [h.setStream(stream) for h in handlers]
+        sys.stdout = stream
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(6, total))) as executor:
+                futures = [executor.submit(stream.capture, migrate_one, f) for f in self.java_files]
+                outcomes = []
+                for i, future in enumerate(futures, 1):
+                    output, result, error = future.result()
+                    self.logger.info(f"\n进度: [{i}/{total}]")
+                    stream.write(output)
+                    if error is not None:
+                        raise error
+                    outcomes.append(result)
+        finally:
+            sys.stdout = stdout
+            for handler, old in zip(handlers, previous):
+                handler.setStream(old)
+
+        for java_file, result in zip(self.java_files, outcomes):
             if result:
                 success += 1
                 results_list.append({
@@ -206,8 +268,7 @@ class EmojiJavaMigrator:
         }
 
         report_file = self.output_dir / 'project_migration_report.json'
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        write_json(report_file, report)
 
         self.logger.success(f"项目报告已生成: {report_file}")
 
@@ -236,18 +297,7 @@ def main():
 
     # 如果指定了单个文件
     if args.file:
-        # 创建 provider 和 orchestrator
-        try:
-            provider = create_llm_provider("ollama", model="codellama")
-        except:
-            provider = create_llm_provider("mock")
-
-        orchestrator = StrictModeOrchestrator(
-            provider,
-            enable_all_phases=migrator.use_strict_mode
-        )
-
-        migrator.migrate_file(args.file, provider, orchestrator)
+        migrator.migrate_file(args.file, migrator.provider, migrator.orchestrator)
     else:
         # 迁移所有文件
         migrator.migrate_all()
@@ -0,0 +1,54 @@
+"""
+emoji-java 迁移脚本共用的文件读写工具
+migrate_emoji_java.py 与 validate_migration.py 读写同一批 JSON 报告和源文件, 读写方式保持一致
+"""
+import functools
+import json
+import os
+from pathlib import Path
+
+# orjson 可选: 安装后报告的序列化/解析走 C 实现, 否则使用标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=256)
+def _read_cached(path: str, mtime_ns: int) -> str:
+    """按 (路径, 修改时间) 缓存文件内容, 文件改动后自动失效"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def read_text(path: Path) -> str:
+    """读取 UTF-8 文本文件, 同一文件未改动时只读取一次 (文件不存在时抛出 FileNotFoundError)"""
+    return _read_cached(str(path), os.stat(path).st_mtime_ns)
+
+
+def read_json(path: Path):
+    """读取 JSON 报告"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(path: Path, obj, default=None) -> None:
+    """以 2 空格缩进写出 JSON 报告 (UTF-8, 非 ASCII 字符不转义)
+
+    先写入同目录下的临时文件再原子替换, 中途失败不会留下写了一半的报告
+    """
+    tmp_path = Path(f"{path}.tmp")
+    try:
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            tmp_path.write_bytes(orjson.dumps(obj, default=default, option=option))
+        else:
+            # json.dump 经 iterencode 逐块写出, 配合大缓冲区, 不会先拼出整份报告字符串
+            with open(tmp_path, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+                json.dump(obj, f, indent=2, ensure_ascii=False, default=default)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
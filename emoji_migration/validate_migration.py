@@ -3,8 +3,9 @@ emoji-java 迁移结果验证工具
 验证生成的 Python 代码的正确性和质量
 """
 import sys
+import os
+import re
 from pathlib import Path
-import json
 import ast
 import subprocess
 
@@ -19,14 +20,41 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / 'src'))
 
 from logger import get_logger
+from report_io import read_json, read_text, write_json
+
+# pytest -rA 简要汇总行, 如 "PASSED Foo/test_Foo.py::test_x" / "ERROR Foo/test_Foo.py - ..."
+_SUMMARY_LINE = re.compile(r'^(PASSED|FAILED|ERROR|XPASS|XFAIL) ([^\s:]+)')
+
+
+def _count_definitions(body: list, metrics: dict, in_class: bool = False):
+    """统计模块级与类体内的定义, 只遍历定义所在的语句层级, 不进入函数体和表达式"""
+    for node in body:
+        if isinstance(node, ast.ClassDef):
+            metrics['classes'] += 1
+            if ast.get_docstring(node):
+                metrics['docstrings'] += 1
+            _count_definitions(node.body, metrics, in_class=True)
+        elif isinstance(node, ast.FunctionDef):
+            if in_class:
+                metrics['methods'] += 1
+            else:
+                metrics['functions'] += 1
+
+            if ast.get_docstring(node):
+                metrics['docstrings'] += 1
+
+            # 检查类型注解
+            if node.returns or any(arg.annotation for arg in node.args.args):
+                metrics['type_hints'] += 1
 
 
 class MigrationValidator:
     """迁移结果验证器"""
 
-    def __init__(self):
+    def __init__(self, execute_tests: bool = False):
         self.logger = get_logger(verbose=True, use_color=True)
         self.output_dir = Path(__file__).parent / 'output'
+        self.execute_tests = execute_tests
         self.validation_results = {
             'files': [],
             'summary': {
@@ -51,8 +79,7 @@ class MigrationValidator:
             self.logger.error("未找到项目迁移报告")
             return
 
-        with open(project_report_file, 'r', encoding='utf-8') as f:
-            project_report = json.load(f)
+        project_report = read_json(project_report_file)
 
         self.logger.info(f"\n项目: {project_report['project']}")
         self.logger.info(f"模式: {project_report['mode']}")
@@ -61,22 +88,30 @@ class MigrationValidator:
         if project_report['failed'] > 0:
             self.logger.error(f"失败: {project_report['failed']}")
 
-        # 获取所有输出目录
-        output_dirs = [d for d in self.output_dir.iterdir()
-                      if d.is_dir() and d.name != 'quick_start']
+        # 获取所有输出目录 (scandir 的目录项自带类型, 无需逐个 stat)
+        # 按名称排序目录项, 只为要处理的目录构造 Path
+        with os.scandir(self.output_dir) as entries:
+            output_dirs = [Path(entry.path) for entry in sorted(
+                (entry for entry in entries if entry.is_dir() and entry.name != 'quick_start'),
+                key=lambda entry: entry.name)]
+        count = len(output_dirs)
 
-        self.logger.info(f"\n找到 {len(output_dirs)} 个迁移结果目录")
+        self.logger.info(f"\n找到 {count} 个迁移结果目录")
         self.logger.info("")
 
         # 验证每个文件
-        for i, output_dir in enumerate(sorted(output_dirs), 1):
+        for i, output_dir in enumerate(output_dirs, 1):
             self.logger.info(f"\n{'='*80}")
-            self.logger.info(f"[{i}/{len(output_dirs)}] 验证: {output_dir.name}")
+            self.logger.info(f"[{i}/{count}] 验证: {output_dir.name}")
             self.logger.info(f"{'='*80}")
 
             result = self.validate_single(output_dir)
             self.validation_results['files'].append(result)
 
+        # 所有测试文件只启动一次 pytest, 解释器启动和收集开销只付一次
+        if self.execute_tests:
+            self.run_collected_tests()
+
         # 打印总结
         self.print_summary()
 
@@ -98,9 +133,13 @@ class MigrationValidator:
             'metrics': {}
         }
 
+        # 一次列出目录内容, 代替对各个文件分别 exists()
+        with os.scandir(output_dir) as entries:
+            present = {entry.name for entry in entries}
+
         # 1. 查找 Python 文件
         python_file = output_dir / f"{output_dir.name}.py"
-        if not python_file.exists():
+        if python_file.name not in present:
             self.logger.error(f"  ✗ Python 文件不存在: {python_file.name}")
             return result
 
@@ -108,7 +147,7 @@ class MigrationValidator:
         self.logger.info(f"  ✓ 找到 Python 文件: {python_file.name}")
 
         # 2. 验证语法
-        syntax_valid, syntax_errors = self.validate_syntax(python_file)
+        syntax_valid, syntax_errors, tree = self.validate_syntax(python_file)
         result['syntax_valid'] = syntax_valid
         result['syntax_errors'] = syntax_errors
 
@@ -122,65 +161,67 @@ class MigrationValidator:
             self.validation_results['summary']['syntax_invalid'] += 1
 
         # 3. 分析代码质量
-        metrics = self.analyze_code_quality(python_file)
+        metrics = self.analyze_code_quality(python_file, tree)
         result['metrics'] = metrics
         self.print_metrics(metrics)
 
         # 4. 查找测试文件
         test_file = output_dir / f"test_{output_dir.name}.py"
-        if test_file.exists():
+        if test_file.name in present:
             result['test_file'] = str(test_file)
             result['test_exists'] = True
             self.logger.info(f"  ✓ 找到测试文件: {test_file.name}")
             self.validation_results['summary']['has_tests'] += 1
 
             # 验证测试语法
-            test_syntax_valid, test_errors = self.validate_syntax(test_file)
+            test_syntax_valid, test_errors, _ = self.validate_syntax(test_file)
             result['test_valid'] = test_syntax_valid
 
             if test_syntax_valid:
                 self.logger.success(f"  ✓ 测试文件语法验证通过")
 
-                # 尝试运行测试（可选）
-                # test_results = self.run_tests(test_file)
-                # result['test_results'] = test_results
+                # 测试在 validate_all 中统一批量运行（可选, 见 execute_tests）
             else:
                 self.logger.error(f"  ✗ 测试文件语法验证失败")
 
         else:
             self.logger.warning(f"  ! 未找到测试文件")
 
-        # 5. 读取迁移报告
-        report_file = output_dir / 'migration_report.json'
-        if report_file.exists():
-            with open(report_file, 'r', encoding='utf-8') as f:
-                migration_report = json.load(f)
-
+        # 5. 读取质量评分: 优先用迁移时写出的小摘要, 旧的输出目录回退到完整报告
+        score = None
+        if 'summary.json' in present:
+            score = read_json(output_dir / 'summary.json').get('overall_score')
+        elif 'migration_report.json' in present:
+            migration_report = read_json(output_dir / 'migration_report.json')
             if migration_report.get('review_report'):
-                review = migration_report['review_report']
-                score = review.get('overall_score', 0)
-                result['quality_score'] = score
-                self.logger.info(f"  质量评分: {score}/100")
+                score = migration_report['review_report'].get('overall_score', 0)
+
+        if score is not None:
+            result['quality_score'] = score
+            self.logger.info(f"  质量评分: {score}/100")
 
         self.validation_results['summary']['total'] += 1
         return result
 
     def validate_syntax(self, file_path: Path) -> tuple:
-        """验证 Python 文件语法"""
+        """验证 Python 文件语法, 返回 (是否通过, 错误列表, 语法树)"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                code = f.read()
+            code = read_text(file_path)
 
-            # 使用 ast.parse 验证语法
-            ast.parse(code)
-            return True, []
+            # 使用 ast.parse 验证语法, 语法树交给 analyze_code_quality 复用
+            tree = ast.parse(code)
+            return True, [], tree
         except SyntaxError as e:
-            return False, [f"第 {e.lineno} 行: {e.msg}"]
+            return False, [f"第 {e.lineno} 行: {e.msg}"], None
         except Exception as e:
-            return False, [str(e)]
+            return False, [str(e)], None
 
-    def analyze_code_quality(self, file_path: Path) -> dict:
-        """分析代码质量指标"""
+    def analyze_code_quality(self, file_path: Path, tree: ast.AST = None) -> dict:
+        """
+        分析代码质量指标 (tree 为 validate_syntax 已解析的语法树时不再重复解析)
+
+        functions 只计模块级函数, methods 计直接定义在类体中的方法, 嵌套函数不计入
+        """
         metrics = {
             'lines': 0,
             'classes': 0,
@@ -192,36 +233,17 @@ class MigrationValidator:
         }
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                code = f.read()
+            code = read_text(file_path)
 
-            # 基本统计
+            # 基本统计: 同一次逐行遍历中统计总行数和注释行
             lines = code.split('\n')
             metrics['lines'] = len(lines)
+            metrics['comments'] = sum(1 for line in lines if line.lstrip().startswith('#'))
 
             # 使用 AST 分析
-            tree = ast.parse(code)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    metrics['classes'] += 1
-                    if ast.get_docstring(node):
-                        metrics['docstrings'] += 1
-                elif isinstance(node, ast.FunctionDef):
-                    if hasattr(node, 'parent') and isinstance(node.parent, ast.ClassDef):
-                        metrics['methods'] += 1
-                    else:
-                        metrics['functions'] += 1
-
-                    if ast.get_docstring(node):
-                        metrics['docstrings'] += 1
-
-                    # 检查类型注解
-                    if node.returns or any(arg.annotation for arg in node.args.args):
-                        metrics['type_hints'] += 1
-
-            # 统计注释
-            metrics['comments'] = sum(1 for line in lines if line.strip().startswith('#'))
+            if tree is None:
+                tree = ast.parse(code)
+            _count_definitions(tree.body, metrics)
 
         except Exception as e:
             self.logger.warning(f"  代码分析失败: {e}")
@@ -242,7 +264,7 @@ class MigrationValidator:
         """运行测试用例（使用 pytest）"""
         try:
             result = subprocess.run(
-                ['python', '-m', 'pytest', str(test_file), '-v', '--tb=short'],
+                [sys.executable, '-m', 'pytest', str(test_file), '-v', '--tb=short'],
                 capture_output=True,
                 text=True,
                 timeout=30
@@ -269,6 +291,78 @@ class MigrationValidator:
                 'errors': str(e)
             }
 
+    def run_tests_batch(self, test_files: list) -> tuple:
+        """
+        用一次 pytest 运行所有测试文件
+
+        Returns:
+            ({测试文件路径: 结果}, 本次运行的结果); 完整输出只记录在后者中,
+            各文件的 output 仅包含属于该文件的汇总行
+        """
+        try:
+            result = subprocess.run(
+                [sys.executable, '-m', 'pytest', *(str(Path(f).resolve()) for f in test_files),
+                 '-v', '--tb=short', '-rA', '--continue-on-collection-errors', '-p', 'no:cacheprovider'],
+                cwd=self.output_dir,
+                capture_output=True,
+                text=True,
+                timeout=30 * len(test_files)
+            )
+        except subprocess.TimeoutExpired:
+            return self._failed_batch(test_files, 'Timeout')
+        except Exception as e:
+            return self._failed_batch(test_files, str(e))
+
+        # 根据汇总行把通过/失败归属到各个文件 (路径相对于运行目录 output_dir)
+        lines_by_path, failed = {}, set()
+        for line in result.stdout.splitlines():
+            match = _SUMMARY_LINE.match(line)
+            if match:
+                path = (self.output_dir / match.group(2)).resolve()
+                lines_by_path.setdefault(path, []).append(line)
+                if match.group(1) in ('FAILED', 'ERROR'):
+                    failed.add(path)
+
+        outcomes = {}
+        for test_file in test_files:
+            path = Path(test_file).resolve()
+            outcomes[str(test_file)] = {
+                'exit_code': result.returncode,
+                'passed': path in lines_by_path and path not in failed,
+                'output': '\n'.join(lines_by_path.get(path, ())),
+                'errors': ''
+            }
+        run = {'exit_code': result.returncode, 'output': result.stdout, 'errors': result.stderr}
+        return outcomes, run
+
+    @staticmethod
+    def _failed_batch(test_files: list, error: str) -> tuple:
+        """pytest 未能运行完时, 所有文件记为失败"""
+        outcomes = {str(f): {'exit_code': -1, 'passed': False, 'output': '', 'errors': error}
+                    for f in test_files}
+        return outcomes, {'exit_code': -1, 'output': '', 'errors': error}
+
+    def run_collected_tests(self):
+        """批量运行所有语法有效的测试文件, 并把结果写回各文件的验证结果"""
+        files = [r for r in self.validation_results['files'] if r['test_valid']]
+        if not files:
+            return
+
+        self.logger.info(f"\n运行 {len(files)} 个测试文件...")
+        outcomes, run = self.run_tests_batch([r['test_file'] for r in files])
+        summary = self.validation_results['summary']
+        # 所有文件共用同一次 pytest 的完整输出, 只在总结中保存一份
+        summary['test_run'] = run
+        for file_result in files:
+            test_results = outcomes[file_result['test_file']]
+            file_result['test_results'] = test_results
+            if test_results['passed']:
+                summary['tests_passed'] += 1
+                self.logger.success(f"  ✓ 测试通过: {file_result['name']}")
+            else:
+                summary['tests_failed'] += 1
+                self.logger.error(f"  ✗ 测试失败: {file_result['name']}")
+
     def print_summary(self):
         """打印验证总结"""
         summary = self.validation_results['summary']
@@ -287,6 +381,10 @@ class MigrationValidator:
 
         self.logger.info(f"\n【测试文件】")
         self.logger.info(f"  包含测试: {summary['has_tests']}/{summary['total']}")
+        if self.execute_tests:
+            self.logger.success(f"  测试通过: {summary['tests_passed']}")
+            if summary['tests_failed'] > 0:
+                self.logger.error(f"  测试失败: {summary['tests_failed']}")
 
         # 计算成功率
         if summary['total'] > 0:
@@ -303,15 +401,14 @@ class MigrationValidator:
     def save_report(self):
         """保存验证报告"""
         report_file = self.output_dir / 'validation_report.json'
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(self.validation_results, f, indent=2, ensure_ascii=False)
+        write_json(report_file, self.validation_results)
 
         self.logger.success(f"\n验证报告已保存: {report_file}")
 
 
 def main():
     """主函数"""
-    validator = MigrationValidator()
+    validator = MigrationValidator(execute_tests='--run-tests' in sys.argv[1:])
     validator.validate_all()
 
 
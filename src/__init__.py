@@ -6,11 +6,21 @@ Java to Python Migration Tool
 __version__ = "1.0.0"
 __author__ = "Migration Tool Team"
 
-from .ast_parser import JavaASTParser, parse_java_code
-from .semantic_mapper import SemanticMapper, map_java_to_python
-from .migration_planner import MigrationPlanner, plan_migration
-from .code_generater import PythonCodeGenerator, generate_python_code
-from .validator import MigrationValidator, validate_migration
+import importlib
+
+# 公开名称 -> 所在子模块; 首次访问时才导入 (PEP 562), 启动开销只与实际用到的模块相关
+_LAZY = {
+    'JavaASTParser': 'ast_parser',
+    'parse_java_code': 'ast_parser',
+    'SemanticMapper': 'semantic_mapper',
+    'map_java_to_python': 'semantic_mapper',
+    'MigrationPlanner': 'migration_planner',
+    'plan_migration': 'migration_planner',
+    'PythonCodeGenerator': 'code_generater',
+    'generate_python_code': 'code_generater',
+    'MigrationValidator': 'validator',
+    'validate_migration': 'validator',
+}
 
 __all__ = [
     'JavaASTParser',
@@ -24,3 +34,16 @@ __all__ = [
     'generate_python_code',
     'validate_migration',
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module('.' + _LAZY[name], __name__), name)
+    # 缓存到模块命名空间, 之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -2,30 +2,56 @@
 Agent 架构设计
 定义各个迁移 Agent 的接口和协调机制
 """
+import os
+from functools import cached_property
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
 
-class AgentStatus(Enum):
-    """Agent 状态"""
-    IDLE = "idle"
-    RUNNING = "running"
-    SUCCESS = "success"
-    FAILED = "failed"
-    PAUSED = "paused"
+# 各 Agent 输入字典必须包含的键, 用一次子集判断代替逐个 in 检查
+_STRUCTURE_REQUIRED = frozenset({'classes'})
+_VALIDATOR_REQUIRED = frozenset({'java_code', 'python_code'})
 
 
-@dataclass
+class AgentStatus(IntEnum):
+    """Agent 状态 (IntEnum, 状态比较即整数比较; 对外显示用小写成员名)"""
+    IDLE = 0
+    RUNNING = 1
+    SUCCESS = 2
+    FAILED = 3
+    PAUSED = 4
+
+
+# Enum 成员的类属性访问要经过元类, 热路径上改用模块级别名
+_IDLE = AgentStatus.IDLE
+_RUNNING = AgentStatus.RUNNING
+_SUCCESS = AgentStatus.SUCCESS
+_FAILED = AgentStatus.FAILED
+
+
+@dataclass(frozen=True)
 class AgentResult:
-    """Agent 执行结果"""
+    """Agent 执行结果 (不可变, errors/warnings 为返回时的快照)"""
+    # 每个文件每个阶段都会产生一个结果对象, 用 __slots__ 省掉实例字典
+    __slots__ = ('status', 'output', 'errors', 'warnings', 'metadata')
     status: AgentStatus
     output: Any
-    errors: List[str]
-    warnings: List[str]
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
     metadata: Dict[str, Any]
 
+    # frozen 的 __setattr__ 会拒绝按槽恢复状态, pickle/copy 需经 object.__setattr__ 写回
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 class BaseAgent(ABC):
     """迁移 Agent 基类"""
@@ -33,7 +59,7 @@ class BaseAgent(ABC):
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         self.name = name
         self.config = config or {}
-        self.status = AgentStatus.IDLE
+        self.status = _IDLE
         self.errors = []
         self.warnings = []
         self.logger = None
@@ -91,8 +117,10 @@ class ParserAgent(BaseAgent):
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__("ParserAgent", config)
-        from ast_parser import JavaASTParser
-        self.parser = JavaASTParser()
+        from ast_parser import JavaASTParser, default_cache_dir
+        self.parser = JavaASTParser(
+            cache_dir=default_cache_dir() if self.config.get('ast_cache') else None
+        )
 
     def validate_input(self, input_data: Any) -> bool:
         """验证输入是否为有效的 Java 代码字符串"""
@@ -108,17 +136,17 @@ class ParserAgent(BaseAgent):
         Returns:
             包含解析结构的 AgentResult
         """
-        self.status = AgentStatus.RUNNING
+        self.status = _RUNNING
         self.log_info("开始解析 Java 代码")
 
         if not self.validate_input(input_data):
             self.log_error("无效的输入数据")
-            self.status = AgentStatus.FAILED
+            self.status = _FAILED
             return AgentResult(
-                status=AgentStatus.FAILED,
+                status=_FAILED,
                 output=None,
-                errors=self.errors,
-                warnings=self.warnings,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 metadata={}
             )
 
@@ -127,23 +155,23 @@ class ParserAgent(BaseAgent):
 
             if not java_structure:
                 self.log_error("Java 代码解析失败")
-                self.status = AgentStatus.FAILED
+                self.status = _FAILED
                 return AgentResult(
-                    status=AgentStatus.FAILED,
+                    status=_FAILED,
                     output=None,
-                    errors=self.errors,
-                    warnings=self.warnings,
+                    errors=tuple(self.errors),
+                    warnings=tuple(self.warnings),
                     metadata={}
                 )
 
             self.log_info(f"解析成功: 找到 {len(java_structure.get('classes', []))} 个类")
-            self.status = AgentStatus.SUCCESS
+            self.status = _SUCCESS
 
             return AgentResult(
-                status=AgentStatus.SUCCESS,
+                status=_SUCCESS,
                 output=java_structure,
-                errors=self.errors,
-                warnings=self.warnings,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 metadata={
                     'num_classes': len(java_structure.get('classes', [])),
                     'num_imports': len(java_structure.get('imports', []))
@@ -152,12 +180,12 @@ class ParserAgent(BaseAgent):
 
         except Exception as e:
             self.log_error(f"解析过程中发生异常: {str(e)}")
-            self.status = AgentStatus.FAILED
+            self.status = _FAILED
             return AgentResult(
-                status=AgentStatus.FAILED,
+                status=_FAILED,
                 output=None,
-                errors=self.errors,
-                warnings=self.warnings,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 metadata={}
             )
 
@@ -172,7 +200,7 @@ class MapperAgent(BaseAgent):
 
     def validate_input(self, input_data: Any) -> bool:
         """验证输入是否为有效的 Java 结构"""
-        return isinstance(input_data, dict) and 'classes' in input_data
+        return isinstance(input_data, dict) and input_data.keys() >= _STRUCTURE_REQUIRED
 
     def execute(self, input_data: Dict[str, Any]) -> AgentResult:
         """
@@ -184,17 +212,17 @@ class MapperAgent(BaseAgent):
         Returns:
             包含 Python 结构的 AgentResult
         """
-        self.status = AgentStatus.RUNNING
+        self.status = _RUNNING
         self.log_info("开始语义映射")
 
         if not self.validate_input(input_data):
             self.log_error("无效的 Java 结构")
-            self.status = AgentStatus.FAILED
+            self.status = _FAILED
             return AgentResult(
-                status=AgentStatus.FAILED,
+                status=_FAILED,
                 output=None,
-                errors=self.errors,
-                warnings=self.warnings,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 metadata={}
             )
 
@@ -202,13 +230,13 @@ class MapperAgent(BaseAgent):
             python_structure = self.mapper.map_structure(input_data)
 
             self.log_info(f"映射完成: {len(python_structure.get('classes', []))} 个类")
-            self.status = AgentStatus.SUCCESS
+            self.status = _SUCCESS
 
             return AgentResult(
-                status=AgentStatus.SUCCESS,
+                status=_SUCCESS,
                 output=python_structure,
-                errors=self.errors,
-                warnings=self.warnings,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 metadata={
                     'num_classes': len(python_structure.get('classes', []))
                 }
@@ -216,12 +244,12 @@ class MapperAgent(BaseAgent):
 
         except Exception as e:
             self.log_error(f"映射过程中发生异常: {str(e)}")
-            self.status = AgentStatus.FAILED
+            self.status = _FAILED
             return AgentResult(
-                status=AgentStatus.FAILED,
+                status=_FAILED,
                 output=None,
-                errors=self.errors,
-                warnings=self.warnings,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 metadata={}
             )
 
@@ -236,7 +264,7 @@ class GeneratorAgent(BaseAgent):
 
     def validate_input(self, input_data: Any) -> bool:
         """验证输入是否为有效的 Python 结构"""
-        return isinstance(input_data, dict) and 'classes' in input_data
+        return isinstance(input_data, dict) and input_data.keys() >= _STRUCTURE_REQUIRED
 
     def execute(self, input_data: Dict[str, Any]) -> AgentResult:
         """
@@ -248,32 +276,31 @@ class GeneratorAgent(BaseAgent):
         Returns:
             包含生成代码的 AgentResult
         """
-        self.status = AgentStatus.RUNNING
+        self.status = _RUNNING
         self.log_info("开始生成 Python 代码")
 
         if not self.validate_input(input_data):
             self.log_error("无效的 Python 结构")
-            self.status = AgentStatus.FAILED
+            self.status = _FAILED
             return AgentResult(
-                status=AgentStatus.FAILED,
+                status=_FAILED,
                 output=None,
-                errors=self.errors,
-                warnings=self.warnings,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 metadata={}
             )
 
         try:
             python_code = self.generator.generate_code(input_data)
-            python_code = self.generator.format_code(python_code)
 
             self.log_info("代码生成完成")
-            self.status = AgentStatus.SUCCESS
+            self.status = _SUCCESS
 
             return AgentResult(
-                status=AgentStatus.SUCCESS,
+                status=_SUCCESS,
                 output=python_code,
-                errors=self.errors,
-                warnings=self.warnings,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 metadata={
                     'code_length': len(python_code),
                     'num_lines': python_code.count('\n')
@@ -282,12 +309,12 @@ class GeneratorAgent(BaseAgent):
 
         except Exception as e:
             self.log_error(f"代码生成过程中发生异常: {str(e)}")
-            self.status = AgentStatus.FAILED
+            self.status = _FAILED
             return AgentResult(
-                status=AgentStatus.FAILED,
+                status=_FAILED,
                 output=None,
-                errors=self.errors,
-                warnings=self.warnings,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 metadata={}
             )
 
@@ -302,9 +329,7 @@ class ValidatorAgent(BaseAgent):
 
     def validate_input(self, input_data: Any) -> bool:
         """验证输入"""
-        if not isinstance(input_data, dict):
-            return False
-        return 'java_code' in input_data and 'python_code' in input_data
+        return isinstance(input_data, dict) and input_data.keys() >= _VALIDATOR_REQUIRED
 
     def execute(self, input_data: Dict[str, Any]) -> AgentResult:
         """
@@ -316,17 +341,17 @@ class ValidatorAgent(BaseAgent):
         Returns:
             包含验证报告的 AgentResult
         """
-        self.status = AgentStatus.RUNNING
+        self.status = _RUNNING
         self.log_info("开始验证代码")
 
         if not self.validate_input(input_data):
             self.log_error("无效的输入数据")
-            self.status = AgentStatus.FAILED
+            self.status = _FAILED
             return AgentResult(
-                status=AgentStatus.FAILED,
+                status=_FAILED,
                 output=None,
-                errors=self.errors,
-                warnings=self.warnings,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 metadata={}
             )
 
@@ -339,16 +364,16 @@ class ValidatorAgent(BaseAgent):
 
             if report['overall_status'] == 'failed':
                 self.log_warning("验证发现问题")
-                self.status = AgentStatus.SUCCESS  # 验证本身成功,但发现了问题
+                self.status = _SUCCESS  # 验证本身成功,但发现了问题
             else:
                 self.log_info(f"验证完成: {report['overall_status']}")
-                self.status = AgentStatus.SUCCESS
+                self.status = _SUCCESS
 
             return AgentResult(
-                status=AgentStatus.SUCCESS,
+                status=_SUCCESS,
                 output=report,
-                errors=self.errors,
-                warnings=self.warnings,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 metadata={
                     'validation_status': report['overall_status']
                 }
@@ -356,12 +381,12 @@ class ValidatorAgent(BaseAgent):
 
         except Exception as e:
             self.log_error(f"验证过程中发生异常: {str(e)}")
-            self.status = AgentStatus.FAILED
+            self.status = _FAILED
             return AgentResult(
-                status=AgentStatus.FAILED,
+                status=_FAILED,
                 output=None,
-                errors=self.errors,
-                warnings=self.warnings,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 metadata={}
             )
 
@@ -372,22 +397,40 @@ class MigrationOrchestrator:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.logger = None
+        self.results = {}
 
-        # 创建各个 Agent
-        self.parser_agent = ParserAgent(config)
-        self.mapper_agent = MapperAgent(config)
-        self.generator_agent = GeneratorAgent(config)
-        self.validator_agent = ValidatorAgent(config)
+    # 各 Agent 在首次使用时才创建, 只解析不验证时不会加载验证器的依赖
+    _AGENT_NAMES = ('parser_agent', 'mapper_agent', 'generator_agent', 'validator_agent')
 
-        self.results = {}
+    def _init_agent(self, agent: BaseAgent) -> BaseAgent:
+        """为新建的 Agent 应用已设置的日志器"""
+        if self.logger:
+            agent.set_logger(self.logger)
+        return agent
+
+    @cached_property
+    def parser_agent(self) -> ParserAgent:
+        return self._init_agent(ParserAgent(self.config))
+
+    @cached_property
+    def mapper_agent(self) -> MapperAgent:
+        return self._init_agent(MapperAgent(self.config))
+
+    @cached_property
+    def generator_agent(self) -> GeneratorAgent:
+        return self._init_agent(GeneratorAgent(self.config))
+
+    @cached_property
+    def validator_agent(self) -> ValidatorAgent:
+        return self._init_agent(ValidatorAgent(self.config))
 
     def set_logger(self, logger):
-        """设置所有 Agent 的日志器"""
+        """设置所有 Agent 的日志器 (尚未创建的 Agent 在创建时应用)"""
         self.logger = logger
-        self.parser_agent.set_logger(logger)
-        self.mapper_agent.set_logger(logger)
-        self.generator_agent.set_logger(logger)
-        self.validator_agent.set_logger(logger)
+        for name in self._AGENT_NAMES:
+            agent = self.__dict__.get(name)
+            if agent is not None:
+                agent.set_logger(logger)
 
     def orchestrate_migration(self, java_code: str,
                              validate: bool = True) -> Dict[str, Any]:
@@ -408,21 +451,21 @@ class MigrationOrchestrator:
         parser_result = self.parser_agent.execute(java_code)
         self.results['parser'] = parser_result
 
-        if parser_result.status != AgentStatus.SUCCESS:
+        if parser_result.status != _SUCCESS:
             return self._build_failure_response("解析失败")
 
         # 步骤 2: 映射
         mapper_result = self.mapper_agent.execute(parser_result.output)
         self.results['mapper'] = mapper_result
 
-        if mapper_result.status != AgentStatus.SUCCESS:
+        if mapper_result.status != _SUCCESS:
             return self._build_failure_response("映射失败")
 
         # 步骤 3: 生成
         generator_result = self.generator_agent.execute(mapper_result.output)
         self.results['generator'] = generator_result
 
-        if generator_result.status != AgentStatus.SUCCESS:
+        if generator_result.status != _SUCCESS:
             return self._build_failure_response("代码生成失败")
 
         # 步骤 4: 验证 (可选)
@@ -437,6 +480,33 @@ class MigrationOrchestrator:
 
         return self._build_success_response()
 
+    def orchestrate_migration_batch(self, java_codes: List[str], validate: bool = True,
+                                    workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        并行迁移多个 Java 文件
+
+        各文件相互独立, 每个文件在子进程中用新的编排器跑完整流程
+        (javalang 是纯 Python 解析, 线程受 GIL 限制, 因此使用进程池)
+
+        Args:
+            java_codes: Java 源代码列表
+            validate: 是否执行验证
+            workers: 进程数, 默认为 CPU 核数
+
+        Returns:
+            与 java_codes 顺序一致的结果字典列表
+        """
+        workers = min(workers or os.cpu_count() or 1, len(java_codes))
+        if workers <= 1:
+            return [_migrate_worker(code, self.config, validate) for code in java_codes]
+
+        if self.logger:
+            self.logger.info(f"使用 {workers} 个进程并行迁移 {len(java_codes)} 个文件")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_migrate_worker, java_codes,
+                                     repeat(self.config), repeat(validate)))
+
     def _build_success_response(self) -> Dict[str, Any]:
         """构建成功响应"""
         return {
@@ -470,9 +540,14 @@ class MigrationOrchestrator:
 
     def get_agent_statuses(self) -> Dict[str, str]:
         """获取所有 Agent 的状态"""
-        return {
-            'parser': self.parser_agent.status.value,
-            'mapper': self.mapper_agent.status.value,
-            'generator': self.generator_agent.status.value,
-            'validator': self.validator_agent.status.value
-        }
+        statuses = {}
+        for name in self._AGENT_NAMES:
+            # 未创建的 Agent 视为空闲, 不为查询状态而创建
+            agent = self.__dict__.get(name)
+            statuses[name[:-len('_agent')]] = (agent.status if agent else _IDLE).name.lower()
+        return statuses
+
+
+def _migrate_worker(java_code: str, config: Dict[str, Any], validate: bool) -> Dict[str, Any]:
+    """进程池任务: 用新的编排器迁移单个文件 (模块级函数, 便于 pickle)"""
+    return MigrationOrchestrator(config).orchestrate_migration(java_code, validate=validate)
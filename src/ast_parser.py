@@ -2,18 +2,62 @@
 Java AST 解析器模块
 使用 javalang 库解析 Java 代码并提取语法结构
 """
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
 import javalang
-from typing import Dict, List, Any, Optional
+from typing import Collection, Dict, List, Any, Optional
 from logger import get_logger
+from ast_structs import ClassInfo, ConstructorInfo, FieldInfo, MethodInfo, ParameterInfo
+
+# 提取时共享的空序列, 没有修饰符/接口/参数的节点不再各自分配空列表 (to_dict 时转为新列表)
+_EMPTY: tuple = ()
+# getattr 的缺省标记, 与值为 None 的属性区分
+_MISSING = object()
+
+
+def default_cache_dir() -> str:
+    """当前用户的持久化 AST 缓存目录 (不放在工作目录, 避免读入他人检出中附带的缓存)"""
+    base = os.environ.get('XDG_CACHE_HOME')
+    if not base and sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA')
+    if not base:
+        base = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'j2p_migration')
+
+
+# 持久化缓存条目的格式版本; 修改提取逻辑或结构字段时递增, 旧条目随之失效
+_CACHE_FORMAT = '2'
 
 
 class JavaASTParser:
     """Java 代码 AST 解析器"""
 
-    def __init__(self):
-        self.ast_tree = None
-        self.parsed_structure = {}
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: 持久化 AST 缓存目录, 默认不启用; 通常传 default_cache_dir()
+        """
+        self.ast_tree: Optional[javalang.tree.CompilationUnit] = None
+        self.parsed_structure: Dict[str, Any] = {}
         self.logger = get_logger()
+        self._cache_db = self._open_cache(cache_dir)
+
+    def _open_cache(self, cache_dir: Optional[str]) -> Optional[sqlite3.Connection]:
+        """打开 (或创建) 持久化 AST 缓存, 失败时退化为不缓存"""
+        if not cache_dir:
+            return None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            conn = sqlite3.connect(os.path.join(cache_dir, 'ast.db'), check_same_thread=False)
+            conn.execute('CREATE TABLE IF NOT EXISTS ast_cache(key TEXT PRIMARY KEY, blob BLOB)')
+            conn.commit()
+            return conn
+        except (OSError, sqlite3.Error) as e:
+            self.logger.debug(f"AST 缓存不可用, 将直接解析: {e}")
+            return None
 
     def parse_java_code(self, java_code: str) -> Optional[javalang.tree.CompilationUnit]:
         """
@@ -44,7 +88,7 @@ class JavaASTParser:
 
     def extract_imports(self) -> List[str]:
         """提取所有导入语句"""
-        imports = []
+        imports: List[str] = []
         if self.ast_tree and self.ast_tree.imports:
             for imp in self.ast_tree.imports:
                 imports.append(imp.path)
@@ -57,23 +101,21 @@ class JavaASTParser:
         Returns:
             类信息列表,包含类名、修饰符、父类、接口等
         """
-        classes = []
         if not self.ast_tree:
-            return classes
-
-        for path, node in self.ast_tree.filter(javalang.tree.ClassDeclaration):
-            class_info = {
-                'name': node.name,
-                'modifiers': node.modifiers or [],
-                'extends': node.extends.name if node.extends else None,
-                'implements': [impl.name for impl in node.implements] if node.implements else [],
-                'fields': self._extract_fields(node),
-                'methods': self._extract_methods(node),
-                'constructors': self._extract_constructors(node)
-            }
-            classes.append(class_info)
-
-        return classes
+            return []
+        return [self._extract_class(node).to_dict() for node in _iter_class_declarations(self.ast_tree)]
+
+    def _extract_class(self, node) -> ClassInfo:
+        """提取单个类声明的信息"""
+        return ClassInfo(
+            name=node.name,
+            modifiers=_modifiers(node.modifiers),
+            extends=node.extends.name if node.extends else None,
+            implements=[impl.name for impl in node.implements] if node.implements else _EMPTY,
+            fields=self._extract_fields(node),
+            methods=self._extract_methods(node),
+            constructors=self._extract_constructors(node)
+        )
 
     def _extract_literal_value(self, initializer):
         """
@@ -85,93 +127,158 @@ class JavaASTParser:
         Returns:
             提取的值（保留原始类型）
         """
-        if not initializer:
+        if initializer is None:
             return None
 
-        # 如果是 Literal 对象,提取 value 属性
-        if hasattr(initializer, 'value'):
-            return initializer.value
+        # 如果是 Literal 对象,提取 value 属性 (一次 getattr, 不再 hasattr 后重复查找)
+        value = getattr(initializer, 'value', _MISSING)
+        if value is not _MISSING:
+            return value
 
         # 其他表达式暂时返回字符串表示
         return str(initializer)
 
-    def _extract_fields(self, class_node) -> List[Dict[str, Any]]:
+    def _extract_fields(self, class_node) -> List[FieldInfo]:
         """提取类的字段信息"""
-        fields = []
+        fields: List[FieldInfo] = []
+        append = fields.append
+        extract_value = self._extract_literal_value
         for field in class_node.fields:
+            # 同一声明中的多个变量共享类型和修饰符
+            field_type = field.type.name
+            modifiers = _modifiers(field.modifiers)
             for declarator in field.declarators:
-                field_info = {
-                    'name': declarator.name,
-                    'type': field.type.name,
-                    'modifiers': field.modifiers or [],
-                    'initializer': self._extract_literal_value(declarator.initializer)
-                }
-                fields.append(field_info)
+                append(FieldInfo(declarator.name, field_type, modifiers,
+                                 extract_value(declarator.initializer)))
         return fields
 
-    def _extract_methods(self, class_node) -> List[Dict[str, Any]]:
+    def _extract_methods(self, class_node) -> List[MethodInfo]:
         """提取类的方法信息"""
-        methods = []
-        for method in class_node.methods:
-            method_info = {
-                'name': method.name,
-                'modifiers': method.modifiers or [],
-                'return_type': method.return_type.name if method.return_type else 'void',
-                'parameters': self._extract_parameters(method.parameters),
-                'body': method.body
-            }
-            methods.append(method_info)
-        return methods
-
-    def _extract_constructors(self, class_node) -> List[Dict[str, Any]]:
+        extract_parameters = self._extract_parameters
+        return [MethodInfo(
+            name=method.name,
+            modifiers=_modifiers(method.modifiers),
+            return_type=method.return_type.name if method.return_type else 'void',
+            parameters=extract_parameters(method.parameters),
+            body=method.body
+        ) for method in class_node.methods]
+
+    def _extract_constructors(self, class_node) -> List[ConstructorInfo]:
         """提取构造函数信息"""
-        constructors = []
-        for constructor in class_node.constructors:
-            constructor_info = {
-                'name': constructor.name,
-                'modifiers': constructor.modifiers or [],
-                'parameters': self._extract_parameters(constructor.parameters),
-                'body': constructor.body
-            }
-            constructors.append(constructor_info)
-        return constructors
-
-    def _extract_parameters(self, parameters) -> List[Dict[str, str]]:
+        extract_parameters = self._extract_parameters
+        return [ConstructorInfo(
+            name=constructor.name,
+            modifiers=_modifiers(constructor.modifiers),
+            parameters=extract_parameters(constructor.parameters),
+            body=constructor.body
+        ) for constructor in class_node.constructors]
+
+    def _extract_parameters(self, parameters) -> Collection[ParameterInfo]:
         """提取方法或构造函数的参数信息"""
-        params = []
-        if parameters:
-            for param in parameters:
-                param_info = {
-                    'name': param.name,
-                    'type': param.type.name
-                }
-                params.append(param_info)
-        return params
+        if not parameters:
+            return _EMPTY
+        return [ParameterInfo(param.name, param.type.name) for param in parameters]
+
+    def _walk_once(self, tree) -> Dict[str, Any]:
+        """一次遍历 AST, 同时收集包名、导入和所有类 (对外为普通字典和列表)"""
+        extract_class = self._extract_class
+        return {
+            'package': tree.package.name if tree.package else None,
+            'imports': [imp.path for imp in tree.imports or ()],
+            'classes': [extract_class(node).to_dict() for node in _iter_class_declarations(tree)]
+        }
 
     def get_full_structure(self, java_code: str) -> Dict[str, Any]:
         """
         获取 Java 代码的完整结构信息
 
+        启用持久化缓存且命中时不解析源码, ast_tree 置为 None,
+        此时 extract_* 方法不会读到上一个文件的 AST
+
         Args:
             java_code: Java 源代码
 
         Returns:
             包含包名、导入、类等完整信息的字典
         """
-        self.parse_java_code(java_code)
-
-        if not self.ast_tree:
+        key: Optional[str] = None
+        if self._cache_db is not None:
+            key = self._cache_key(java_code)
+            structure = self._load_cached(key)
+            if structure is not None:
+                self.ast_tree = None
+                self.parsed_structure = structure
+                return structure
+
+        if not self.parse_java_code(java_code):
             return {}
 
-        structure = {
-            'package': self.extract_package(),
-            'imports': self.extract_imports(),
-            'classes': self.extract_classes()
-        }
-
+        structure = self._walk_once(self.ast_tree)
+        if key is not None:
+            # 解析失败的源码不会走到这里, 不写入缓存
+            self._store_cached(key, structure)
         self.parsed_structure = structure
         return structure
 
+    @staticmethod
+    def _cache_key(java_code: str) -> str:
+        """缓存键: 源码 SHA-256、javalang 版本与缓存格式版本"""
+        return (hashlib.sha256(java_code.encode('utf-8')).hexdigest()
+                + ':' + javalang.__version__ + ':' + _CACHE_FORMAT)
+
+    def _load_cached(self, key: str) -> Optional[Dict[str, Any]]:
+        """读取持久化缓存中的结构 (方法体为 javalang 节点, 因此用 pickle 保存)"""
+        if self._cache_db is None:
+            return None
+        try:
+            row = self._cache_db.execute('SELECT blob FROM ast_cache WHERE key=?', (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        self.logger.debug("AST 缓存命中")
+        return pickle.loads(row[0])
+
+    def _store_cached(self, key: str, structure: Dict[str, Any]) -> None:
+        """写入持久化缓存 (只存提取后的结构, 不存完整 AST)"""
+        if self._cache_db is None:
+            return
+        blob = pickle.dumps(structure, pickle.HIGHEST_PROTOCOL)
+        try:
+            with self._cache_db:
+                self._cache_db.execute('INSERT OR REPLACE INTO ast_cache(key, blob) VALUES (?, ?)', (key, blob))
+        except sqlite3.Error as e:
+            self.logger.debug(f"写入 AST 缓存失败: {e}")
+
+
+def _modifiers(modifiers) -> Collection[str]:
+    """javalang 的修饰符是 set, 排序成确定的顺序 (to_dict 时统一转为列表)"""
+    return sorted(modifiers) if modifiers else _EMPTY
+
+
+def _iter_class_declarations(tree):
+    """
+    先序遍历 AST, 依次产出所有 ClassDeclaration (含内部类和局部类)
+
+    与 tree.filter(ClassDeclaration) 顺序一致, 但用显式栈代替递归生成器,
+    也不为每个节点拼接 path 元组
+    """
+    class_type = javalang.tree.ClassDeclaration
+    node_type = javalang.ast.Node
+    stack = [tree]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        item = pop()
+        if isinstance(item, node_type):
+            if isinstance(item, class_type):
+                yield item
+            children = [getattr(item, attr) for attr in item.attrs]
+        else:
+            children = item
+        extend(child for child in reversed(children)
+               if isinstance(child, (node_type, list, tuple)))
+
 
 # 向后兼容的函数接口
 def parse_java_code(java_code: str) -> Optional[javalang.tree.CompilationUnit]:
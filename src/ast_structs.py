@@ -0,0 +1,77 @@
+"""
+Java 解析结果的数据结构
+提取过程中用 __slots__ 记录类代替逐节点的字典, 对外返回前由 to_dict 转为普通字典;
+不参与 mypyc 编译 (见 setup_mypyc.py): mypyc 会把 dataclass 上显式声明的
+__slots__ 当成字段处理, 这些记录类需要保持为普通 Python 类以保留 __slots__
+"""
+from dataclasses import dataclass
+from typing import Any, ClassVar, Collection, Dict, List, Optional
+
+
+class _StructInfo:
+    """解析结果记录的基类"""
+    __slots__ = ()
+    # 由 @dataclass 在子类上生成, 这里只声明类型
+    __dataclass_fields__: ClassVar[Dict[str, Any]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为普通字典: 嵌套的记录转为字典, 序列字段一律转为新列表 (下游可修改、可 JSON 序列化)"""
+        result: Dict[str, Any] = {}
+        for name in self.__dataclass_fields__:
+            value = getattr(self, name)
+            if isinstance(value, (list, tuple)):
+                value = [item.to_dict() if isinstance(item, _StructInfo) else item for item in value]
+            result[name] = value
+        return result
+
+
+@dataclass
+class ParameterInfo(_StructInfo):
+    """方法或构造函数参数"""
+    __slots__ = ('name', 'type')
+    name: str
+    type: str
+
+
+@dataclass
+class FieldInfo(_StructInfo):
+    """字段信息 (同一声明中的每个变量各一项)"""
+    __slots__ = ('name', 'type', 'modifiers', 'initializer')
+    name: str
+    type: str
+    modifiers: Collection[str]
+    initializer: Any
+
+
+@dataclass
+class MethodInfo(_StructInfo):
+    """方法信息, body 为 javalang 语句节点列表"""
+    __slots__ = ('name', 'modifiers', 'return_type', 'parameters', 'body')
+    name: str
+    modifiers: Collection[str]
+    return_type: str
+    parameters: Collection[ParameterInfo]
+    body: Any
+
+
+@dataclass
+class ConstructorInfo(_StructInfo):
+    """构造函数信息"""
+    __slots__ = ('name', 'modifiers', 'parameters', 'body')
+    name: str
+    modifiers: Collection[str]
+    parameters: Collection[ParameterInfo]
+    body: Any
+
+
+@dataclass
+class ClassInfo(_StructInfo):
+    """类信息"""
+    __slots__ = ('name', 'modifiers', 'extends', 'implements', 'fields', 'methods', 'constructors')
+    name: str
+    modifiers: Collection[str]
+    extends: Optional[str]
+    implements: Collection[str]
+    fields: List[FieldInfo]
+    methods: List[MethodInfo]
+    constructors: List[ConstructorInfo]
@@ -1,12 +1,33 @@
 """Python 代码生成模块"""
-from typing import Dict, List, Any, Optional
-import textwrap
-
-
+import functools
+import io
+from typing import Dict, List, Any, Final, Optional, Tuple
+
+import javalang
+
+# mypy_extensions 随 mypy 安装, 仅用于 mypyc 编译时的类属性声明; 未安装时按无操作处理
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:
+    def mypyc_attr(*attrs, **kwattrs):  # type: ignore[misc, no-redef]
+        return lambda cls: cls
+
+# 按 javalang 节点类型分派到对应的 _translate_* 方法 (子类可覆盖);
+# 类型常量声明为 Final, mypyc 编译后比较的是类型对象本身, 方法调用也是原生调用
+_LITERAL: Final = javalang.tree.Literal
+_MEMBER_REFERENCE: Final = javalang.tree.MemberReference
+_BINARY_OPERATION: Final = javalang.tree.BinaryOperation
+_METHOD_INVOCATION: Final = javalang.tree.MethodInvocation
+_RETURN_STATEMENT: Final = javalang.tree.ReturnStatement
+_STATEMENT_EXPRESSION: Final = javalang.tree.StatementExpression
+
+
+# 编译后仍允许在 Python 中继承并覆盖 _translate_* 方法
+@mypyc_attr(allow_interpreted_subclasses=True)
 class JavaASTTranslator:
     """将 Java AST 节点转换为 Python 代码"""
 
-    def __init__(self, class_name: str = None, is_static_context: bool = False):
+    def __init__(self, class_name: Optional[str] = None, is_static_context: bool = False):
         """
         初始化转换器
 
@@ -19,52 +40,65 @@ class JavaASTTranslator:
 
     def translate_expression(self, expr) -> str:
         """转换表达式"""
-        expr_type = type(expr).__name__
-
-        if expr_type == 'Literal':
-            return str(expr.value)
-
-        if expr_type == 'MemberReference':
-            member = expr.member
-            if member and member.isupper():
-                if self.is_static_context and self.class_name:
-                    return f"{self.class_name}._{member}"
-                else:
-                    return f"self._{member}" if not self.is_static_context else f"_{member}"
-            return member
-
-        elif expr_type == 'BinaryOperation':
-            left = self.translate_expression(expr.operandl)
-            right = self.translate_expression(expr.operandr)
-            operator = expr.operator
-            return f"{left} {operator} {right}"
-
-        elif expr_type == 'MethodInvocation':
-            method_name = expr.member
-            args = [self.translate_expression(arg) for arg in (expr.arguments or [])]
-            args_str = ", ".join(args)
-            return f"{method_name}({args_str})"
-
-        else:
-            return f"# TODO: translate {expr_type}"
+        node_type = type(expr)
+        if node_type is _LITERAL:
+            return self._translate_literal(expr)
+        if node_type is _MEMBER_REFERENCE:
+            return self._translate_member_reference(expr)
+        if node_type is _BINARY_OPERATION:
+            return self._translate_binary_operation(expr)
+        if node_type is _METHOD_INVOCATION:
+            return self._translate_method_invocation(expr)
+        return f"# TODO: translate {node_type.__name__}"
 
     def translate_statement(self, stmt) -> str:
         """转换语句"""
-        stmt_type = type(stmt).__name__
-
-        if stmt_type == 'ReturnStatement':
-            if stmt.expression:
-                expr = self.translate_expression(stmt.expression)
-                return f"return {expr}"
+        node_type = type(stmt)
+        if node_type is _RETURN_STATEMENT:
+            return self._translate_return_statement(stmt)
+        if node_type is _STATEMENT_EXPRESSION:
+            return self._translate_statement_expression(stmt)
+        return f"# TODO: translate {node_type.__name__}"
+
+    def _translate_literal(self, expr) -> str:
+        """字面量"""
+        return str(expr.value)
+
+    def _translate_member_reference(self, expr) -> str:
+        """成员引用 (常量按类变量访问)"""
+        member = expr.member
+        if member and member.isupper():
+            if self.is_static_context and self.class_name:
+                return f"{self.class_name}._{member}"
             else:
-                return "return"
-
-        elif stmt_type == 'StatementExpression':
+                return f"self._{member}" if not self.is_static_context else f"_{member}"
+        return member
+
+    def _translate_binary_operation(self, expr) -> str:
+        """二元运算"""
+        left = self.translate_expression(expr.operandl)
+        right = self.translate_expression(expr.operandr)
+        operator = expr.operator
+        return f"{left} {operator} {right}"
+
+    def _translate_method_invocation(self, expr) -> str:
+        """方法调用"""
+        method_name = expr.member
+        args = [self.translate_expression(arg) for arg in (expr.arguments or [])]
+        args_str = ", ".join(args)
+        return f"{method_name}({args_str})"
+
+    def _translate_return_statement(self, stmt) -> str:
+        """return 语句"""
+        if stmt.expression:
             expr = self.translate_expression(stmt.expression)
-            return expr
-
+            return f"return {expr}"
         else:
-            return f"# TODO: translate {stmt_type}"
+            return "return"
+
+    def _translate_statement_expression(self, stmt) -> str:
+        """表达式语句"""
+        return self.translate_expression(stmt.expression)
 
     def translate_body(self, body_statements: List) -> List[str]:
         """转换方法体"""
@@ -79,30 +113,124 @@ class JavaASTTranslator:
         return lines if lines else ["pass"]
 
 
+_STANDARD_IMPORTS = ("from typing import Dict, List, Any, Optional",)
+
+
+@functools.lru_cache(maxsize=256)
+def _sorted_unique_imports(imports: Tuple[str, ...]) -> Tuple[str, ...]:
+    """去重排序后的导入语句行; 同一项目中的文件导入多有重复, 按导入元组缓存"""
+    return tuple(sorted(set(_STANDARD_IMPORTS + imports)))
+
+
+# .get() 的只读默认值, 避免每次调用都分配空列表
+_EMPTY: tuple = ()
+
+def _is_instance_field(field: Dict[str, Any]) -> bool:
+    """是否为需要在 __init__ 中初始化的实例字段"""
+    return not field.get('is_class_variable') and not field.get('is_constant')
+
+
+# 可以交给 numba nopython 模式编译的基本类型
+NUMBA_PRIMITIVE_TYPES = frozenset({'int', 'float', 'bool'})
+
+
+class _LineWriter:
+    """
+    一次生成调用的按行输出目标
+
+    合并连续空行的状态只属于本次调用, 生成器本身不保存输出状态
+    """
+
+    def __init__(self, buf: io.StringIO, collapse_blanks: bool = False):
+        self.buf = buf
+        self.collapse_blanks = collapse_blanks
+        self.prev_blank = False  # 上一行是否为空白行
+
+    def emit(self, line: str) -> None:
+        """写入一行 (不含换行符), 合并模式下与上一行都是空白行时跳过 (即 format_code 的规则)"""
+        is_blank = not line.strip()
+        if is_blank and self.prev_blank and self.collapse_blanks:
+            return
+        self.buf.write(line)
+        self.buf.write('\n')
+        self.prev_blank = is_blank
+
+    def write(self, text: str) -> None:
+        """原样写入以非空白行结尾的整段代码 (含结尾换行)"""
+        self.buf.write(text)
+        self.prev_blank = False
+
+
 class PythonCodeGenerator:
     """Python 代码生成器"""
 
-    def __init__(self, indent_size: int = 4):
+    def __init__(self, indent_size: int = 4, enable_numba: bool = False):
+        """
+        Args:
+            indent_size: 缩进空格数
+            enable_numba: 是否为纯数值的静态方法加上 @numba.njit(cache=True)
+        """
         self.indent_size = indent_size
-        self.generated_code = []
-        self.current_class_name = None  # 当前处理的类名
-
-    def _indent(self, code: str, level: int = 1) -> str:
-        """添加缩进"""
-        indent = ' ' * (self.indent_size * level)
-        return textwrap.indent(code, indent)
+        self.enable_numba = enable_numba
+        # 常用缩进层级的前缀
+        self._indent_cache = {level: ' ' * (indent_size * level) for level in range(8)}
+        # 无参数、无实例字段的 __init__ 形状固定, 按缩进层级缓存整段代码
+        self._empty_init_cache: Dict[int, str] = {}
+        self.generated_code: List[str] = []
+        self.current_class_name: Optional[str] = None  # 当前处理的类名
+
+    def _is_numba_compatible(self, method: Dict[str, Any]) -> bool:
+        """判断方法能否用 numba 编译: 静态、非抽象, 参数和返回值都是基本数值类型"""
+        if not self.enable_numba or not method.get('is_static') or method.get('is_abstract'):
+            return False
+        if method.get('return_type') not in NUMBA_PRIMITIVE_TYPES:
+            return False
+        return all(param.get('type') in NUMBA_PRIMITIVE_TYPES
+                   for param in method.get('parameters', _EMPTY))
+
+    def _prefix(self, level: int) -> str:
+        """获取指定层级的缩进前缀"""
+        prefix = self._indent_cache.get(level)
+        if prefix is None:
+            prefix = ' ' * (self.indent_size * level)
+        return prefix
+
+    def _empty_init(self, level: int) -> str:
+        """无参数、无实例字段的 __init__ 代码 (含结尾换行)"""
+        code = self._empty_init_cache.get(level)
+        if code is None:
+            code = f'{self._prefix(level)}def __init__(self):\n{self._prefix(level + 1)}pass\n'
+            self._empty_init_cache[level] = code
+        return code
+
+    def _write_line(self, out: _LineWriter, text: str, level: int = 0) -> None:
+        """按缩进层级写入一行 (与 textwrap.indent 一致, 空白行不加缩进)"""
+        prefix = self._prefix(level)
+
+        # 换行类字符都不可打印, 可打印的文本必然是单行, 无需 splitlines
+        if text.isprintable():
+            out.emit(prefix + text if prefix and text.strip() else text)
+            return
+
+        # 多行文本: 逐行加前缀后直接按 '\n' 切分输出, 不再先 join 成整段再 split;
+        # 以 \r 等其他换行符结尾的片段与后续片段拼成同一行, 与按 '\n' 切分的结果一致
+        emit = out.emit
+        pending = ''
+        for line in text.splitlines(True):
+            if prefix and line.strip():
+                line = prefix + line
+            if line[-1] == '\n':
+                emit(pending + line[:-1])
+                pending = ''
+            else:
+                pending += line
+        emit(pending)
 
     def generate_imports(self, imports: List[str]) -> str:
         """生成导入语句"""
         if not imports:
             return ""
-
-        standard_imports = ["from typing import Dict, List, Any, Optional"]
-        all_imports = standard_imports + imports
-
-        unique_imports = sorted(set(all_imports))
-
-        return "\n".join(unique_imports) + "\n\n"
+        return "\n".join(_sorted_unique_imports(tuple(imports))) + "\n\n"
 
     def generate_field(self, field: Dict[str, Any], is_class_level: bool = False) -> str:
         """生成字段/属性代码"""
@@ -130,31 +258,43 @@ class PythonCodeGenerator:
             params.append("self")
 
         for param in parameters:
-            annotation = param.get('annotation', param['name'])
+            annotation = param.get('annotation') or param['name']
             params.append(annotation)
 
         return ", ".join(params)
 
-    def generate_method(self, method: Dict[str, Any]) -> str:
-        """生成方法代码"""
-        lines = []
-
-        for decorator in method.get('decorators', []):
-            lines.append(decorator)
+    def generate_method(self, method: Dict[str, Any], buf: Optional[io.StringIO] = None,
+                        indent_level: int = 0) -> Optional[str]:
+        """生成方法代码; 传入 buf 时直接写入 buf, 否则返回代码字符串"""
+        if buf is not None:
+            self._write_method(_LineWriter(buf), method, indent_level)
+            return None
+        out = _LineWriter(io.StringIO())
+        self._write_method(out, method, indent_level)
+        return out.buf.getvalue()[:-1]
+
+    def _write_method(self, out: _LineWriter, method: Dict[str, Any], indent_level: int) -> None:
+        """将方法代码写入 out"""
+        write_line = self._write_line
+        for decorator in method.get('decorators', _EMPTY):
+            write_line(out, decorator, indent_level)
+
+        # 放在 @staticmethod 之下, 先编译再包装成静态方法; cache=True 让后续运行跳过 LLVM 编译
+        if self._is_numba_compatible(method):
+            write_line(out, '@numba.njit(cache=True)', indent_level)
 
         method_name = method.get('python_name', method['name'])
         is_static = method.get('is_static', False)
 
         params = self.generate_parameter_list(
-            method.get('parameters', []),
+            method.get('parameters', _EMPTY),
             include_self=not is_static and method_name != '__init__'
         )
 
         return_type = method.get('return_type', 'None')
-        signature = f"def {method_name}({params}) -> {return_type}:"
-
-        lines.append(signature)
+        out.emit(f"{self._prefix(indent_level)}def {method_name}({params}) -> {return_type}:")
 
+        body_level = indent_level + 1
         body = method.get('body')
         if body and isinstance(body, list):
             try:
@@ -163,141 +303,164 @@ class PythonCodeGenerator:
                     is_static_context=is_static
                 )
                 body_lines = translator.translate_body(body)
-                for line in body_lines:
-                    lines.append(self._indent(line))
             except Exception as e:
-                lines.append(self._indent(f'# 方法体转换失败: {e}'))
-                lines.append(self._indent('pass'))
+                write_line(out, f'# 方法体转换失败: {e}', body_level)
+                write_line(out, 'pass', body_level)
+            else:
+                for line in body_lines:
+                    write_line(out, line, body_level)
         else:
-            lines.append(self._indent('"""TODO: 实现方法体"""'))
-            lines.append(self._indent('pass'))
-
-        return "\n".join(lines)
+            body_indent = self._prefix(body_level)
+            out.emit(f'{body_indent}"""TODO: 实现方法体"""')
+            out.emit(f'{body_indent}pass')
 
     def generate_constructor(self, constructor: Dict[str, Any],
-                            fields: List[Dict[str, Any]]) -> str:
-        """生成构造函数 (__init__)"""
-        lines = []
+                            fields: List[Dict[str, Any]],
+                            buf: Optional[io.StringIO] = None,
+                            indent_level: int = 0) -> Optional[str]:
+        """生成构造函数 (__init__); 传入 buf 时直接写入 buf, 否则返回代码字符串"""
+        if buf is not None:
+            self._write_constructor(_LineWriter(buf), constructor, fields, indent_level)
+            return None
+        out = _LineWriter(io.StringIO())
+        self._write_constructor(out, constructor, fields, indent_level)
+        return out.buf.getvalue()[:-1]
+
+    def _write_constructor(self, out: _LineWriter, constructor: Dict[str, Any],
+                           fields: List[Dict[str, Any]], indent_level: int) -> None:
+        """将构造函数代码写入 out"""
+        # 工具类、常量类大多是这种空构造函数, 直接使用缓存的代码
+        if not constructor.get('parameters') and not any(map(_is_instance_field, fields)):
+            out.write(self._empty_init(indent_level))
+            return
 
         params = ["self"]
-        for param in constructor.get('parameters', []):
-            params.append(param.get('annotation', param['name']))
+        for param in constructor.get('parameters', _EMPTY):
+            params.append(param.get('annotation') or param['name'])
 
-        signature = f"def __init__({', '.join(params)}):"
-        lines.append(signature)
+        out.emit(f"{self._prefix(indent_level)}def __init__({', '.join(params)}):")
 
+        body_level = indent_level + 1
         has_body = False
         for field in fields:
-            if not field.get('is_class_variable') and not field.get('is_constant'):
+            if _is_instance_field(field):
                 field_init = self.generate_field(field, is_class_level=False)
-                lines.append(self._indent(field_init))
+                self._write_line(out, field_init, body_level)
                 has_body = True
 
         if not has_body:
-            lines.append(self._indent('pass'))
-
-        return "\n".join(lines)
-
-    def generate_class(self, class_info: Dict[str, Any]) -> str:
-        """生成类代码"""
-        lines = []
-
+            self._write_line(out, 'pass', body_level)
+
+    def generate_class(self, class_info: Dict[str, Any], buf: Optional[io.StringIO] = None,
+                       indent_level: int = 0) -> Optional[str]:
+        """生成类代码; 传入 buf 时直接写入 buf, 否则返回代码字符串"""
+        if buf is not None:
+            self._write_class(_LineWriter(buf), class_info, indent_level)
+            return None
+        out = _LineWriter(io.StringIO())
+        self._write_class(out, class_info, indent_level)
+        return out.buf.getvalue()[:-1]
+
+    def _write_class(self, out: _LineWriter, class_info: Dict[str, Any], indent_level: int) -> None:
+        """将类代码写入 out"""
+        write_line = self._write_line
+        member_level = indent_level + 1
         class_name = class_info['name']
-        base_classes = class_info.get('base_classes', [])
-
-        if base_classes:
-            class_def = f"class {class_name}({', '.join(base_classes)}):"
-        else:
-            class_def = f"class {class_name}:"
+        base_classes = class_info.get('base_classes', _EMPTY)
 
-        lines.append(class_def)
+        bases = f"({', '.join(base_classes)})" if base_classes else ''
 
-        lines.append(self._indent(f'"""Java 类 {class_name} 的 Python 实现"""'))
-        lines.append("")
+        # 类头、方法签名等形状固定的单行片段直接 emit,
+        # 只有内容不定的行 (装饰器、字段、方法体) 才走 _write_line
+        emit = out.emit
+        emit(f'{self._prefix(indent_level)}class {class_name}{bases}:')
+        emit(f'{self._prefix(member_level)}"""Java 类 {class_name} 的 Python 实现"""')
+        emit('')
+        has_members = False
 
-        class_vars = [f for f in class_info.get('fields', [])
+        class_vars = [f for f in class_info.get('fields', _EMPTY)
                      if f.get('is_class_variable') or f.get('is_constant')]
 
         for field in class_vars:
             field_code = self.generate_field(field, is_class_level=True)
-            lines.append(self._indent(field_code))
+            write_line(out, field_code, member_level)
 
         if class_vars:
-            lines.append("")
+            emit('')
+            has_members = True
 
-        constructors = class_info.get('constructors', [])
-        instance_fields = [f for f in class_info.get('fields', [])
-                          if not f.get('is_class_variable') and not f.get('is_constant')]
+        constructors = class_info.get('constructors', _EMPTY)
+        instance_fields = list(filter(_is_instance_field, class_info.get('fields', _EMPTY)))
 
         if constructors:
-            constructor_code = self.generate_constructor(
-                constructors[0],
-                instance_fields
-            )
-            lines.append(self._indent(constructor_code))
-            lines.append("")
+            self._write_constructor(out, constructors[0], instance_fields, member_level)
+            emit('')
+            has_members = True
         elif instance_fields:
-            default_constructor = {'parameters': []}
-            constructor_code = self.generate_constructor(
-                default_constructor,
-                instance_fields
-            )
-            lines.append(self._indent(constructor_code))
-            lines.append("")
+            default_constructor: Dict[str, Any] = {'parameters': []}
+            self._write_constructor(out, default_constructor, instance_fields, member_level)
+            emit('')
+            has_members = True
 
-        for method in class_info.get('methods', []):
-            method_code = self.generate_method(method)
-            lines.append(self._indent(method_code))
-            lines.append("")
+        for method in class_info.get('methods', _EMPTY):
+            self._write_method(out, method, member_level)
+            emit('')
+            has_members = True
 
-        if len(lines) == 3:
-            lines.append(self._indent('pass'))
-
-        return "\n".join(lines)
+        if not has_members:
+            write_line(out, 'pass', member_level)
 
     def generate_code(self, python_structure: Dict[str, Any]) -> str:
-        """生成完整的 Python 代码"""
-        code_parts = []
-
-        code_parts.append('"""')
-        code_parts.append('自动从 Java 代码迁移生成')
-        code_parts.append('Generated by Java to Python Migration Tool')
-        code_parts.append('"""')
-        code_parts.append('')
-
-        imports = self.generate_imports(python_structure.get('imports', []))
-        if imports:
-            code_parts.append(imports)
-
-        for i, class_info in enumerate(python_structure.get('classes', [])):
-            class_code = self.generate_class(class_info)
-            code_parts.append(class_code)
-            if i < len(python_structure.get('classes', [])) - 1:
-                code_parts.append('\n')
-
-        code_parts.append('\n')
-        code_parts.append('if __name__ == "__main__":')
-        code_parts.append('    # TODO: 添加主程序入口')
-        code_parts.append('    pass')
-
-        return "\n".join(code_parts)
+        """生成完整的 Python 代码 (已合并连续空行并以换行结尾, 与 format_code 的结果一致)"""
+        # 合并状态放在本次调用的 writer 上, 中途抛出异常也不会影响之后的调用
+        out = _LineWriter(io.StringIO(), collapse_blanks=True)
+        emit = out.emit
+
+        # 整个文件按行直接写入 buf, 导入语句等不再先拼成整段再由 _write_line 切分
+        emit('"""')
+        emit('自动从 Java 代码迁移生成')
+        emit('Generated by Java to Python Migration Tool')
+        emit('"""')
+        emit('')
+
+        classes = python_structure.get('classes', _EMPTY)
+        import_list = list(python_structure.get('imports', _EMPTY))
+        if self.enable_numba and any(self._is_numba_compatible(method)
+                                     for class_info in classes
+                                     for method in class_info.get('methods', _EMPTY)):
+            import_list.append('import numba')
+
+        if import_list:
+            for line in _sorted_unique_imports(tuple(import_list)):
+                self._write_line(out, line)
+            emit('')
+
+        # 连续空行在输出时合并, 类之间只需一个空行
+        for class_info in classes:
+            self._write_class(out, class_info, 0)
+            emit('')
+
+        emit('')
+        emit('if __name__ == "__main__":')
+        emit('    # TODO: 添加主程序入口')
+        emit('    pass')
+
+        return out.buf.getvalue()
 
     def format_code(self, code: str) -> str:
-        """格式化代码"""
-        lines = code.split('\n')
-        formatted_lines = []
+        """格式化代码: 合并连续空行, 并保证以换行结尾"""
+        # split/join 在 C 层完成, 只在 Python 层判断每行是否为空白行
+        lines: List[str] = []
+        append = lines.append
         prev_blank = False
-
-        for line in lines:
-            is_blank = line.strip() == ''
-
+        for line in code.split('\n'):
+            is_blank = not line.strip()
             if is_blank and prev_blank:
                 continue
-
-            formatted_lines.append(line)
+            append(line)
             prev_blank = is_blank
 
-        result = '\n'.join(formatted_lines)
+        result = '\n'.join(lines)
         if not result.endswith('\n'):
             result += '\n'
 
@@ -20,6 +20,7 @@ class MigrationConfig:
     # 解析配置
     skip_errors: bool = False
     strict_mode: bool = True
+    ast_cache: bool = False  # 持久化 AST 缓存 (用户缓存目录)
 
     # 代码生成配置
     indent_size: int = 4
@@ -73,6 +74,7 @@ class MigrationConfig:
             'log_file': self.log_file,
             'skip_errors': self.skip_errors,
             'strict_mode': self.strict_mode,
+            'ast_cache': self.ast_cache,
             'indent_size': self.indent_size,
             'max_line_length': self.max_line_length,
             'add_type_hints': self.add_type_hints,
@@ -7,10 +7,68 @@ Costrict 风格的智能 Agent 系统
 """
 from typing import Dict, List, Any, Optional
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from llm_providers import LLMProvider
 from logger import get_logger
+import copy
 import json
+import re
+
+# orjson 可选: 安装后提示词中的 JSON 序列化和响应解析走 C 实现, 否则使用标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# LLM 响应解析用的正则, 模块加载时编译一次
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+_PY_CODE_RE = re.compile(r'```python\s*\n(.*?)\n```', re.DOTALL)
+_ANY_CODE_RE = re.compile(r'```\s*\n(.*?)\n```', re.DOTALL)
+
+# 评审结果无法解析时的默认值
+_UNKNOWN_REVIEW = {"overall_score": 0, "approval_status": "未知"}
+
+
+def _dumps(obj: Any) -> str:
+    """序列化为带 2 空格缩进、保留非 ASCII 字符的 JSON 文本, 用于嵌入提示词"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            # 超出 64 位的整数等 orjson 不支持的值, 交给标准库处理
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _loads(text: str) -> Any:
+    """解析 JSON 文本"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _parse_json_response(text: str, default: Optional[Dict] = None) -> Dict:
+    """解析 JSON 响应; 整体不是 JSON 时提取其中的 {...} 部分, 都失败时返回 default 的副本"""
+    try:
+        return _loads(text.strip())
+    except:
+        match = _JSON_RE.search(text)
+        if match:
+            return _loads(match.group())
+        return dict(default) if default else {}
+
+
+def _extract_code_block(text: str, any_fence: bool = True) -> str:
+    """提取 ```python 代码块; any_fence 为真时也接受不带语言标记的代码块"""
+    match = _PY_CODE_RE.search(text)
+    if match:
+        return match.group(1).strip()
+    if any_fence:
+        match = _ANY_CODE_RE.search(text)
+        if match:
+            return match.group(1).strip()
+    return text.strip()
 
 
 class AgentPhase(Enum):
@@ -57,6 +115,27 @@ class AgentContext:
         if self.warnings is None:
             self.warnings = []
 
+    def clone_for_branch(self) -> 'AgentContext':
+        """
+        为并发执行的 Agent 复制一份上下文
+
+        浅拷贝即可: 各 Agent 只整体替换自己负责的字段; errors/warnings 换成新的空列表,
+        只收集该分支新增的条目, 由 merge_branch 按顺序合并回来
+        """
+        branch = copy.copy(self)
+        branch.errors = []
+        branch.warnings = []
+        return branch
+
+    def merge_branch(self, base: 'AgentContext', branch: 'AgentContext') -> None:
+        """将 clone_for_branch 得到的分支中相对 base 有变化的字段及新增的错误/警告合并进来"""
+        for f in fields(self):
+            name = f.name
+            if name == 'errors' or name == 'warnings':
+                getattr(self, name).extend(getattr(branch, name))
+            elif getattr(branch, name) is not getattr(base, name):
+                setattr(self, name, getattr(branch, name))
+
 
 class BaseStrictAgent:
     """严格模式 Agent 基类"""
@@ -153,7 +232,7 @@ class RequirementsAnalysisAgent(BaseStrictAgent):
             temperature=0.1
         )
 
-        requirements = self._parse_json(response)
+        requirements = _parse_json_response(response)
         context.requirements = requirements
 
         self.logger.info(f"  业务领域: {requirements.get('business_domain', '未知')}")
@@ -165,17 +244,6 @@ class RequirementsAnalysisAgent(BaseStrictAgent):
         """验证需求分析结果"""
         return context.requirements is not None
 
-    def _parse_json(self, text: str) -> Dict:
-        """解析 JSON 响应"""
-        import re
-        try:
-            return json.loads(text.strip())
-        except:
-            match = re.search(r'\{.*\}', text, re.DOTALL)
-            if match:
-                return json.loads(match.group())
-            return {}
-
 
 class ArchitectureDesignAgent(BaseStrictAgent):
     """架构设计 Agent - 设计 Python 代码架构"""
@@ -198,7 +266,7 @@ class ArchitectureDesignAgent(BaseStrictAgent):
 基于以下需求,设计 Python 代码的架构:
 
 需求分析:
-{json.dumps(requirements, indent=2, ensure_ascii=False)}
+{_dumps(requirements)}
 
 原始 Java 代码:
 ```java
@@ -227,7 +295,7 @@ class ArchitectureDesignAgent(BaseStrictAgent):
             temperature=0.2
         )
 
-        architecture = self._parse_json(response)
+        architecture = _parse_json_response(response)
         context.architecture = architecture
 
         patterns = architecture.get('class_structure', {}).get('patterns', [])
@@ -240,16 +308,6 @@ class ArchitectureDesignAgent(BaseStrictAgent):
         """验证架构设计"""
         return context.architecture is not None
 
-    def _parse_json(self, text: str) -> Dict:
-        import re
-        try:
-            return json.loads(text.strip())
-        except:
-            match = re.search(r'\{.*\}', text, re.DOTALL)
-            if match:
-                return json.loads(match.group())
-            return {}
-
 
 class TaskPlanningAgent(BaseStrictAgent):
     """任务规划 Agent - 制定详细的实现计划"""
@@ -270,10 +328,10 @@ class TaskPlanningAgent(BaseStrictAgent):
 基于以下信息制定详细的实现计划:
 
 需求:
-{json.dumps(context.requirements, indent=2, ensure_ascii=False)}
+{_dumps(context.requirements)}
 
 架构:
-{json.dumps(context.architecture, indent=2, ensure_ascii=False)}
+{_dumps(context.architecture)}
 
 请制定实现计划,以 JSON 返回:
 {{
@@ -302,7 +360,7 @@ class TaskPlanningAgent(BaseStrictAgent):
             temperature=0.1
         )
 
-        plan = self._parse_json(response)
+        plan = _parse_json_response(response)
         context.plan = plan
 
         steps = plan.get('implementation_steps', [])
@@ -313,16 +371,6 @@ class TaskPlanningAgent(BaseStrictAgent):
     def validate_output(self, context: AgentContext) -> bool:
         return context.plan is not None
 
-    def _parse_json(self, text: str) -> Dict:
-        import re
-        try:
-            return json.loads(text.strip())
-        except:
-            match = re.search(r'\{.*\}', text, re.DOTALL)
-            if match:
-                return json.loads(match.group())
-            return {}
-
 
 class CodeGenerationAgent(BaseStrictAgent):
     """代码生成 Agent - 生成高质量 Python 代码"""
@@ -349,7 +397,7 @@ class CodeGenerationAgent(BaseStrictAgent):
             "```",
             "",
             "需求分析:",
-            json.dumps(context.requirements, indent=2, ensure_ascii=False),
+            _dumps(context.requirements),
             ""
         ]
 
@@ -357,7 +405,7 @@ class CodeGenerationAgent(BaseStrictAgent):
         if context.architecture:
             prompt_parts.extend([
                 "架构设计:",
-                json.dumps(context.architecture, indent=2, ensure_ascii=False),
+                _dumps(context.architecture),
                 ""
             ])
 
@@ -365,7 +413,7 @@ class CodeGenerationAgent(BaseStrictAgent):
         if context.plan:
             prompt_parts.extend([
                 "实现计划:",
-                json.dumps(context.plan, indent=2, ensure_ascii=False),
+                _dumps(context.plan),
                 ""
             ])
 
@@ -391,7 +439,7 @@ class CodeGenerationAgent(BaseStrictAgent):
             max_tokens=4096
         )
 
-        python_code = self._extract_code(response)
+        python_code = _extract_code_block(response)
         context.python_code = python_code
 
         lines = python_code.count('\n')
@@ -413,16 +461,6 @@ class CodeGenerationAgent(BaseStrictAgent):
 
         return True
 
-    def _extract_code(self, text: str) -> str:
-        import re
-        match = re.search(r'```python\s*\n(.*?)\n```', text, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-        match = re.search(r'```\s*\n(.*?)\n```', text, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-        return text.strip()
-
 
 class TestGenerationAgent(BaseStrictAgent):
     """测试生成 Agent - 生成单元测试"""
@@ -464,7 +502,7 @@ class TestGenerationAgent(BaseStrictAgent):
             temperature=0.2
         )
 
-        test_code = self._extract_code(response)
+        test_code = _extract_code_block(response, any_fence=False)
         context.test_code = test_code
 
         # 统计测试数量
@@ -473,13 +511,6 @@ class TestGenerationAgent(BaseStrictAgent):
 
         return context
 
-    def _extract_code(self, text: str) -> str:
-        import re
-        match = re.search(r'```python\s*\n(.*?)\n```', text, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-        return text.strip()
-
 
 class CodeReviewAgent(BaseStrictAgent):
     """代码审查 Agent - 严格的质量审查"""
@@ -550,7 +581,7 @@ class CodeReviewAgent(BaseStrictAgent):
             temperature=0.1
         )
 
-        review = self._parse_json(response)
+        review = _parse_json_response(response, _UNKNOWN_REVIEW)
         context.review_report = review
 
         score = review.get('overall_score', 0)
@@ -565,15 +596,5 @@ class CodeReviewAgent(BaseStrictAgent):
 
         return context
 
-    def _parse_json(self, text: str) -> Dict:
-        import re
-        try:
-            return json.loads(text.strip())
-        except:
-            match = re.search(r'\{.*\}', text, re.DOTALL)
-            if match:
-                return json.loads(match.group())
-            return {"overall_score": 0, "approval_status": "未知"}
-
 
 # 使用示例在下一个文件
@@ -16,6 +16,8 @@ from costrict_agents import (
 )
 from llm_providers import LLMProvider
 from logger import get_logger
+from concurrent.futures import ThreadPoolExecutor
+import ast
 import json
 from datetime import datetime
 
@@ -23,6 +25,9 @@ from datetime import datetime
 class StrictModeOrchestrator:
     """严格模式编排器 - 质量优先"""
 
+    # 只依赖已生成代码、彼此互不依赖的阶段; 耗时在 LLM 网络请求上, 相邻时用线程并发执行
+    CONCURRENT_PHASES = frozenset({AgentPhase.TEST_GENERATION, AgentPhase.CODE_REVIEW})
+
     def __init__(self, llm: LLMProvider, enable_all_phases: bool = True):
         """
         初始化严格模式编排器
@@ -77,15 +82,12 @@ class StrictModeOrchestrator:
         start_time = datetime.now()
 
         # 执行工作流
-        for phase in self.workflow:
-            # 可选跳过测试生成
-            if skip_tests and phase == AgentPhase.TEST_GENERATION:
-                self.logger.info(f"⏭️ 跳过阶段: {phase.value}")
-                continue
-
-            # 执行 Agent
-            agent = self.agents[phase]
-            context = agent.execute(context)
+        for phases in self._group_phases(skip_tests):
+            if len(phases) == 1:
+                # 执行 Agent
+                context = self.agents[phases[0]].execute(context)
+            else:
+                context = self._execute_concurrently(phases, context)
 
             # 检查是否有严重错误
             if context.errors and self._has_critical_error(context):
@@ -104,6 +106,43 @@ class StrictModeOrchestrator:
 
         return results
 
+    def _group_phases(self, skip_tests: bool) -> List[List[AgentPhase]]:
+        """将工作流分组: 相邻的可并发阶段归为一组, 其余阶段各自一组"""
+        groups: List[List[AgentPhase]] = []
+        for phase in self.workflow:
+            # 可选跳过测试生成
+            if skip_tests and phase == AgentPhase.TEST_GENERATION:
+                self.logger.info(f"⏭️ 跳过阶段: {phase.value}")
+                continue
+
+            if groups and phase in self.CONCURRENT_PHASES and groups[-1][-1] in self.CONCURRENT_PHASES:
+                groups[-1].append(phase)
+            else:
+                groups.append([phase])
+        return groups
+
+    def _execute_concurrently(self, phases: List[AgentPhase],
+                              context: AgentContext) -> AgentContext:
+        """
+        并发执行一组互不依赖的阶段, 每个 Agent 使用独立的上下文副本
+
+        结果按工作流顺序合并, 与顺序执行一致: 某阶段出现严重错误时,
+        其后阶段的结果不再合并
+        """
+        base = context.clone_for_branch()
+        branches = [context.clone_for_branch() for _ in phases]
+
+        with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+            futures = [executor.submit(self.agents[phase].execute, branch)
+                       for phase, branch in zip(phases, branches)]
+            results = [future.result() for future in futures]
+
+        for result in results:
+            context.merge_branch(base, result)
+            if context.errors and self._has_critical_error(context):
+                break
+        return context
+
     def migrate_fast(self, java_code: str) -> Dict[str, Any]:
         """
         快速模式(跳过部分阶段)
@@ -160,6 +199,7 @@ class StrictModeOrchestrator:
             'architecture': context.architecture,
             'plan': context.plan,
             'python_code': context.python_code,
+            'python_structure': self._extract_python_structure(context.python_code),
             'test_code': context.test_code,
             'review_report': context.review_report,
 
@@ -176,6 +216,41 @@ class StrictModeOrchestrator:
 
         return results
 
+    def _extract_python_structure(self, python_code: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        从生成的 Python 代码中提取类/函数结构
+
+        与按文本统计 'class ' / 'def ' 的口径一致: 包含嵌套类和嵌套函数,
+        不在类体中直接定义的函数 (模块级函数、嵌套函数) 计入 functions
+
+        Args:
+            python_code: 生成的 Python 代码
+
+        Returns:
+            {'classes': [{'name', 'methods'}], 'functions': [...]} 结构, 代码为空或无法解析时返回 None
+        """
+        if not python_code:
+            return None
+
+        try:
+            tree = ast.parse(python_code)
+        except SyntaxError:
+            return None
+
+        function_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+        classes = []
+        methods = set()
+        functions = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                members = [item for item in node.body if isinstance(item, function_types)]
+                methods.update(map(id, members))
+                classes.append({'name': node.name, 'methods': [item.name for item in members]})
+            elif isinstance(node, function_types) and id(node) not in methods:
+                functions.append(node.name)
+
+        return {'classes': classes, 'functions': functions}
+
     def _calculate_quality_metrics(self, context: AgentContext) -> Dict[str, Any]:
         """计算质量指标"""
         metrics = {
@@ -265,8 +340,9 @@ class StrictModeOrchestrator:
 
         print("\n" + "="*80)
 
-    def export_report(self, results: Dict[str, Any], output_file: str):
-        """导出完整报告"""
+    @staticmethod
+    def export_report(results: Dict[str, Any], output_file: str):
+        """导出完整报告 (不依赖实例状态, 可直接通过类调用)"""
         report = {
             'metadata': {
                 'tool': 'Costrict-style Java to Python Migrator',
@@ -294,7 +370,7 @@ class StrictModeOrchestrator:
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(report, f, indent=2, ensure_ascii=False)
 
-        self.logger.info(f"📄 报告已导出: {output_file}")
+        get_logger().info(f"📄 报告已导出: {output_file}")
 
 
 def demo():
@@ -0,0 +1,29 @@
+"""演示脚本共用的输出工具: 横幅分隔线、整块写出与并行运行演示"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# 横幅分隔线, 导入时构造一次 (各演示脚本使用的宽度不同)
+BAR70 = "=" * 70
+BAR80 = "=" * 80
+BAR100 = "=" * 100
+
+
+def emit(*lines):
+    """一次写出多行文本, 避免逐行 print 的编码与写入开销"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def run_demos_parallel(*demos):
+    """
+    并行运行相互独立的演示, 再按原顺序输出各自的结果
+
+    sys.stdout 需已替换为 thread_output.ThreadBufferedStream
+    """
+    stdout = sys.stdout
+    with ThreadPoolExecutor(max_workers=len(demos)) as executor:
+        futures = [executor.submit(stdout.capture, demo) for demo in demos]
+    for future in futures:
+        output, _, error = future.result()
+        stdout.write(output)
+        if error is not None:
+            raise error
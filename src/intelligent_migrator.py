@@ -193,7 +193,6 @@ class IntelligentMigrator:
 
         # 生成
         python_code = self.code_generator.generate_code(python_structure)
-        python_code = self.code_generator.format_code(python_code)
 
         return python_code
 
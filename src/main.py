@@ -9,7 +9,7 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace', line_buffering=True)
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace', line_buffering=True)
 
-from ast_parser import JavaASTParser
+from ast_parser import JavaASTParser, default_cache_dir
 from semantic_mapper import SemanticMapper
 from migration_planner import MigrationPlanner
 from code_generater import PythonCodeGenerator
@@ -20,10 +20,10 @@ from logger import get_logger, set_verbose
 class JavaToPythonMigrator:
     """Java to Python 迁移器"""
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, ast_cache: bool = False):
         self.verbose = verbose
         self.logger = get_logger(verbose=verbose)
-        self.parser = JavaASTParser()
+        self.parser = JavaASTParser(cache_dir=default_cache_dir() if ast_cache else None)
         self.mapper = SemanticMapper()
         self.planner = MigrationPlanner()
         self.generator = PythonCodeGenerator()
@@ -93,7 +93,6 @@ class JavaToPythonMigrator:
             # 步骤 4: 生成 Python 代码
             self.logger.section("步骤 4/5: 生成 Python 代码")
             python_code = self.generator.generate_code(python_structure)
-            python_code = self.generator.format_code(python_code)
             results['python_code'] = python_code
             self.logger.success("代码生成完成")
 
@@ -240,6 +239,12 @@ def main():
         help='导出迁移计划到文件 (支持 .json 和 .md 格式)'
     )
 
+    parser.add_argument(
+        '--ast-cache',
+        action='store_true',
+        help='启用持久化 AST 缓存 (位于用户缓存目录, 重复迁移相同源码时跳过解析)'
+    )
+
     parser.add_argument(
         '--version',
         action='version',
@@ -281,7 +286,7 @@ def main():
         from logger import get_logger
 
         logger = get_logger(verbose=args.verbose, use_color=not args.no_color)
-        orchestrator = MigrationOrchestrator()
+        orchestrator = MigrationOrchestrator({'ast_cache': args.ast_cache})
         orchestrator.set_logger(logger)
 
         with open(args.input, 'r', encoding='utf-8') as f:
@@ -310,7 +315,7 @@ def main():
 
         sys.exit(0)
 
-    migrator = JavaToPythonMigrator(verbose=args.verbose)
+    migrator = JavaToPythonMigrator(verbose=args.verbose, ast_cache=args.ast_cache)
 
     if args.export_plan:
         from visualizer import MigrationVisualizer
@@ -2,7 +2,7 @@
 迁移策略规划模块
 分析 Java 代码结构并生成迁移计划
 """
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from dataclasses import dataclass
 
 
@@ -177,12 +177,14 @@ class MigrationPlanner:
 
         return steps
 
-    def plan_migration(self, java_structure: Dict[str, Any]) -> Dict[str, Any]:
+    def plan_migration(self, java_structure: Dict[str, Any],
+                       on_class: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         生成完整的迁移计划
 
         Args:
             java_structure: Java 代码结构
+            on_class: 每规划完一个类后以该类的信息调用, 便于调用方在同一轮遍历中处理各个类
 
         Returns:
             完整的迁移计划
@@ -202,6 +204,8 @@ class MigrationPlanner:
         for class_info in java_structure.get('classes', []):
             class_steps = self.plan_class_migration(class_info, import_step_id)
             self.migration_plan.extend(class_steps)
+            if on_class is not None:
+                on_class(class_info)
 
         # 生成迁移计划报告
         plan_report = {
@@ -208,14 +208,15 @@ class SemanticMapper:
         # 提取初始化值
         initializer = self._extract_initializer_value(field_info.get('initializer'))
 
+        python_type = self.map_type(field_info['type'])
         python_field = {
             'name': field_info['name'],
-            'type': self.map_type(field_info['type']),
+            'type': python_type,
             'is_class_variable': modifiers['is_static'],
             'is_constant': modifiers['is_final'] and modifiers['is_static'],
             'is_private': modifiers['is_private'],
             'initializer': initializer,
-            'annotation': f": {self.map_type(field_info['type'])}"
+            'annotation': f": {python_type}"
         }
 
         # Python 命名约定
@@ -228,6 +229,15 @@ class SemanticMapper:
 
         return python_field
 
+    def _map_parameter(self, param: Dict[str, Any]) -> Dict[str, Any]:
+        """映射方法或构造函数的参数, 类型只映射一次"""
+        python_type = self.map_type(param['type'])
+        return {
+            'name': param['name'],
+            'type': python_type,
+            'annotation': f"{param['name']}: {python_type}"
+        }
+
     def map_method(self, method_info: Dict[str, Any]) -> Dict[str, Any]:
         """
         映射 Java 方法到 Python 方法
@@ -241,13 +251,7 @@ class SemanticMapper:
         modifiers = self.map_modifiers(method_info.get('modifiers', []))
 
         # 映射参数
-        params = []
-        for param in method_info.get('parameters', []):
-            params.append({
-                'name': param['name'],
-                'type': self.map_type(param['type']),
-                'annotation': f"{param['name']}: {self.map_type(param['type'])}"
-            })
+        params = [self._map_parameter(param) for param in method_info.get('parameters', [])]
 
         # 映射返回类型
         return_type = self.map_type(method_info.get('return_type', 'void'))
@@ -330,13 +334,7 @@ class SemanticMapper:
         Returns:
             Python __init__ 方法信息
         """
-        params = []
-        for param in constructor_info.get('parameters', []):
-            params.append({
-                'name': param['name'],
-                'type': self.map_type(param['type']),
-                'annotation': f"{param['name']}: {self.map_type(param['type'])}"
-            })
+        params = [self._map_parameter(param) for param in constructor_info.get('parameters', [])]
 
         return {
             'name': '__init__',
@@ -352,7 +350,9 @@ class SemanticMapper:
             java_structure: Java 代码结构(来自 ast_parser)
 
         Returns:
-            Python 代码结构
+            Python 代码结构; 生成器读取的键总是齐全: 字段含 python_name/type/
+            initializer/is_class_variable/is_constant, 方法含 python_name/parameters/
+            return_type/decorators/is_static/body, 参数含 annotation
         """
         python_structure = {
             'imports': self.map_imports(java_structure.get('imports', [])),
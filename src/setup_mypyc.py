@@ -0,0 +1,22 @@
+"""
+可选: 用 mypyc 把 Java 解析器和 Python 代码生成器编译为 C 扩展
+
+    pip install mypy
+    cd src && python setup_mypyc.py build_ext --inplace
+
+编译产物 (*.so / *.pyd) 与源文件放在同一目录, 导入时优先于同名 .py 加载;
+删除编译产物即恢复纯 Python 实现
+"""
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name='j2p-migration-compiled',
+    ext_modules=mypycify([
+        '--ignore-missing-imports',
+        # src 既是包又被脚本直接加入 sys.path, 按顶层模块名 (ast_parser) 编译
+        '--explicit-package-bases',
+        'ast_parser.py',
+        'code_generater.py',
+    ]),
+)
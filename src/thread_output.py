@@ -0,0 +1,43 @@
+"""按线程缓冲输出的工具, 供并行运行的演示与迁移脚本使用"""
+import io
+import threading
+
+
+class ThreadBufferedStream:
+    """
+    按线程缓冲的输出流, 让并行任务的输出互不交错
+
+    在 capture 中运行的线程写入各自的缓冲区, 其余线程直接写入底层流;
+    调用方在任务结束后按原顺序输出各缓冲区的内容
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    def capture(self, func, *args):
+        """
+        在当前线程运行 func(*args), 期间的输出写入本线程的缓冲区
+
+        Returns:
+            (输出文本, 返回值, 异常或 None); 出错时也返回已产生的输出
+        """
+        self._local.buffer = io.StringIO()
+        try:
+            result = func(*args)
+            return self._local.buffer.getvalue(), result, None
+        except Exception as e:
+            return self._local.buffer.getvalue(), None, e
+        finally:
+            self._local.buffer = None
@@ -3,12 +3,19 @@
 验证迁移后的 Python 代码质量和功能等价性
 """
 import ast
+import functools
 import subprocess
 import tempfile
 import os
 from typing import Dict, List, Any, Optional, Tuple
 
 
+@functools.lru_cache(maxsize=16)
+def _parse_python(python_code: str) -> ast.Module:
+    """解析 Python 代码; 各项检查共享同一棵 AST, 同一份代码只解析一次 (检查只读不改)"""
+    return ast.parse(python_code)
+
+
 class MigrationValidator:
     """迁移验证器"""
 
@@ -30,7 +37,7 @@ class MigrationValidator:
         errors = []
 
         try:
-            ast.parse(python_code)
+            _parse_python(python_code)
             return True, []
         except SyntaxError as e:
             errors.append(f"语法错误 (行 {e.lineno}): {e.msg}")
@@ -85,7 +92,7 @@ class MigrationValidator:
         warnings = []
 
         try:
-            tree = ast.parse(python_code)
+            tree = _parse_python(python_code)
 
             # 检查类名 (应该是 PascalCase)
             for node in ast.walk(tree):
@@ -120,7 +127,7 @@ class MigrationValidator:
         warnings = []
 
         try:
-            tree = ast.parse(python_code)
+            tree = _parse_python(python_code)
 
             imports = []
             for node in ast.walk(tree):
@@ -152,7 +159,7 @@ class MigrationValidator:
         warnings = []
 
         try:
-            tree = ast.parse(python_code)
+            tree = _parse_python(python_code)
 
             for node in ast.walk(tree):
                 if isinstance(node, ast.FunctionDef):
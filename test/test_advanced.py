@@ -510,6 +510,61 @@ class TestIntegration:
         assert is_valid is True
         assert 'class ComplexClass(BaseClass, Interface1):' in python_code
 
+    def test_orchestrate_migration_batch(self):
+        """测试多进程批量迁移保持输入顺序"""
+        from agents import MigrationOrchestrator
+
+        java_codes = [f"public class Batch{i} {{ private int value; }}" for i in range(3)]
+        java_codes.append("public class Broken {")
+
+        results = MigrationOrchestrator().orchestrate_migration_batch(java_codes, workers=2)
+
+        assert [r['success'] for r in results] == [True, True, True, False]
+        for i, result in enumerate(results[:3]):
+            assert f'class Batch{i}:' in result['python_code']
+
+    def test_orchestrator_result_json_serializable(self):
+        """测试编排结果中的 Java 结构是普通字典/列表, 可直接 JSON 序列化 (方法体仍为 javalang 节点, 示例不含方法)"""
+        import json
+        from agents import MigrationOrchestrator
+
+        java_code = """
+        public class Point implements Shape {
+            private static final String NAME = "p";
+            protected int x = 1;
+        }
+        """
+
+        result = MigrationOrchestrator().orchestrate_migration(java_code)
+        restored = json.loads(json.dumps(result, ensure_ascii=False))
+
+        point = restored['java_structure']['classes'][0]
+        assert point['implements'] == ['Shape']
+        assert point['fields'][0]['modifiers'] == ['final', 'private', 'static']
+
+        class_info = result['java_structure']['classes'][0]
+        assert isinstance(class_info, dict)
+        assert isinstance(class_info['modifiers'], list)
+        assert isinstance(class_info['constructors'], list)
+
+    def test_agent_result_pickle_and_deepcopy(self):
+        """测试 AgentResult 可以 pickle 往返和深拷贝"""
+        import copy
+        import pickle
+        from agents import AgentResult, AgentStatus
+
+        result = AgentResult(
+            status=AgentStatus.SUCCESS,
+            output={'classes': [{'name': 'A'}]},
+            errors=('e',),
+            warnings=(),
+            metadata={'agent': 'parser'}
+        )
+
+        for restored in (pickle.loads(pickle.dumps(result)), copy.deepcopy(result)):
+            assert restored == result
+            assert restored.output is not result.output
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--tb=short'])
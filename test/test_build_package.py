@@ -0,0 +1,43 @@
+"""
+emoji-python 打包脚本测试用例
+"""
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+
+# 添加 emoji_migration 目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / 'emoji_migration'))
+
+from build_package import EmojiPackageBuilder
+
+
+class TestEmojiPackageBuilder:
+    """测试 emoji-python 包构建"""
+
+    def test_build_ships_cython_source(self, tmp_path):
+        """测试重建的包目录带有 setup.py 引用的 _emoji_trie.pyx, 且 setup.py 可以执行"""
+        builder = EmojiPackageBuilder()
+        builder.output_dir = tmp_path / 'output'
+        builder.package_dir = tmp_path / 'emoji_python'
+        builder.build_package()
+
+        assert (builder.package_dir / '_emoji_trie.pyx').is_file()
+        result = subprocess.run([sys.executable, 'setup.py', '--name'], cwd=builder.package_dir,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().endswith('emoji-python')
+
+    def test_setup_without_cython_source(self, tmp_path):
+        """测试缺少 .pyx 时 setup.py 退化为不构建扩展, 而不是报错"""
+        builder = EmojiPackageBuilder()
+        builder.package_dir = tmp_path
+        builder.create_setup()
+
+        result = subprocess.run([sys.executable, 'setup.py', '--name'], cwd=tmp_path,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
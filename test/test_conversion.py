@@ -5,13 +5,15 @@ import pytest
 import sys
 from pathlib import Path
 
+import javalang
+
 # 添加 src 目录到路径
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from ast_parser import JavaASTParser
 from semantic_mapper import SemanticMapper
 from migration_planner import MigrationPlanner
-from code_generater import PythonCodeGenerator
+from code_generater import JavaASTTranslator, PythonCodeGenerator
 from validator import MigrationValidator
 
 
@@ -63,6 +65,39 @@ class TestJavaParser:
         assert len(person_class['constructors']) == 1
         assert len(person_class['methods']) == 1
 
+    def test_structure_cache_persists(self, tmp_path, monkeypatch):
+        """测试 AST 结构缓存跨实例命中"""
+        java_code = "public class Cached { private int x = 1; }"
+
+        first = JavaASTParser(cache_dir=str(tmp_path)).get_full_structure(java_code)
+
+        monkeypatch.setattr(javalang.parse, 'parse', lambda code: pytest.fail("缓存未命中"))
+        second = JavaASTParser(cache_dir=str(tmp_path)).get_full_structure(java_code)
+
+        assert second == first
+        assert second is not first
+        assert second['classes'][0]['name'] == 'Cached'
+
+    def test_structure_cache_hit_clears_ast_tree(self, tmp_path):
+        """测试缓存命中时不保留上一个文件的 AST"""
+        JavaASTParser(cache_dir=str(tmp_path)).get_full_structure("public class Cached {}")
+
+        parser = JavaASTParser(cache_dir=str(tmp_path))
+        parser.get_full_structure("public class Parsed {}")
+        assert parser.extract_classes()[0]['name'] == 'Parsed'
+
+        parser.get_full_structure("public class Cached {}")
+        assert parser.ast_tree is None
+        assert parser.extract_classes() == []
+
+    def test_structure_cache_disabled_by_default(self, tmp_path, monkeypatch):
+        """测试默认不启用持久化缓存, 不在工作目录留下缓存文件"""
+        monkeypatch.chdir(tmp_path)
+        structure = JavaASTParser().get_full_structure("public class Plain {}")
+
+        assert structure['classes'][0]['name'] == 'Plain'
+        assert list(tmp_path.iterdir()) == []
+
 
 class TestSemanticMapper:
     """测试语义映射器"""
@@ -156,6 +191,24 @@ class TestMigrationPlanner:
         assert 'estimated_difficulty' in plan
         assert len(plan['steps']) > 0
 
+    def test_plan_migration_on_class(self):
+        """测试 on_class 回调按顺序收到每个类, 且不影响迁移计划"""
+        java_structure = {
+            'imports': [],
+            'classes': [
+                {'name': name, 'fields': [], 'methods': [], 'constructors': [],
+                 'extends': None, 'implements': []}
+                for name in ('First', 'Second')
+            ]
+        }
+
+        seen = []
+        plan = MigrationPlanner().plan_migration(
+            java_structure, on_class=lambda class_info: seen.append(class_info['name']))
+
+        assert seen == ['First', 'Second']
+        assert plan['total_steps'] == MigrationPlanner().plan_migration(java_structure)['total_steps']
+
 
 class TestCodeGenerator:
     """测试代码生成器"""
@@ -233,6 +286,66 @@ class TestCodeGenerator:
         assert 'def __init__' in code
         assert 'self.name' in code
 
+    def test_generate_numba_static_method(self):
+        """测试为数值静态方法生成 numba 装饰器"""
+        def method(name, param_type):
+            return {
+                'name': name,
+                'python_name': name,
+                'parameters': [{'name': 'x', 'type': param_type, 'annotation': f'x: {param_type}'}],
+                'return_type': 'int',
+                'decorators': ['@staticmethod'],
+                'is_static': True,
+                'body': None
+            }
+
+        python_structure = {
+            'imports': [],
+            'classes': [
+                {
+                    'name': 'MathUtil',
+                    'base_classes': [],
+                    'fields': [],
+                    'methods': [method('square', 'int'), method('parse', 'str')],
+                    'constructors': []
+                }
+            ]
+        }
+
+        code = PythonCodeGenerator(enable_numba=True).generate_code(python_structure)
+
+        assert 'import numba' in code
+        assert '@staticmethod\n    @numba.njit(cache=True)\n    def square(x: int)' in code
+        assert code.count('@numba.njit') == 1
+        assert 'numba' not in PythonCodeGenerator().generate_code(python_structure)
+
+    def test_translator_subclass_override(self):
+        """测试 JavaASTTranslator 子类覆盖的 _translate_* 方法会被调用"""
+        class QuotedLiterals(JavaASTTranslator):
+            def _translate_literal(self, expr):
+                return f"<{expr.value}>"
+
+        tree = javalang.parse.parse("class A { int f() { return 1 + x; } }")
+        body = next(tree.filter(javalang.tree.MethodDeclaration))[1].body
+
+        assert JavaASTTranslator().translate_body(body) == ['return 1 + x']
+        assert QuotedLiterals().translate_body(body) == ['return <1> + x']
+
+    def test_generate_class_after_failed_generate_code(self):
+        """测试 generate_code 中途出错后, 再生成单个类不会沿用合并空行的状态"""
+        class_info = {
+            'name': 'Blank',
+            'methods': [{'name': 'run', 'decorators': ['', '']}],
+        }
+        expected = PythonCodeGenerator().generate_class(class_info)
+
+        generator = PythonCodeGenerator()
+        with pytest.raises(KeyError):
+            generator.generate_code({'classes': [{'name': 'Broken', 'methods': [{}]}]})
+
+        assert generator.generate_class(class_info) == expected
+        assert '\n\n\n' in expected
+
 
 class TestValidator:
     """测试验证器"""
@@ -0,0 +1,166 @@
+"""
+Costrict 严格模式编排测试用例 (使用桩 LLM, 不访问网络)
+"""
+import pytest
+import sys
+import threading
+from pathlib import Path
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from llm_providers import LLMProvider
+from costrict_agents import AgentContext, AgentPhase
+from costrict_orchestrator import StrictModeOrchestrator
+
+
+class StubLLM(LLMProvider):
+    """按系统提示中的关键词返回预设响应; 响应为可调用对象时调用它 (可在其中抛出异常)"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def complete(self, prompt, system=None, temperature=0.2, max_tokens=4096):
+        for keyword, response in self.responses.items():
+            if keyword in (system or ''):
+                with self._lock:
+                    self.calls.append(keyword)
+                return response() if callable(response) else response
+        raise AssertionError(f"未预设的系统提示: {system}")
+
+
+PYTHON_CODE = "```python\nclass Calculator:\n    def add(self, a, b):\n        return a + b\n```"
+
+BASE_RESPONSES = {
+    '需求分析师': '{"business_domain": "计算", "priority": "中"}',
+    '架构师': '{"modules": []}',
+    '项目管理': '{"tasks": []}',
+    'Python 开发工程师': PYTHON_CODE,
+    '测试工程师': "```python\ndef test_add():\n    assert True\n```",
+    '代码审查专家': '{"overall_score": 90, "approval_status": "通过", "critical_issues": []}',
+}
+
+
+def raise_error(message):
+    def response():
+        raise RuntimeError(message)
+    return response
+
+
+def code_context():
+    """已完成代码生成阶段的上下文"""
+    return AgentContext(java_code="public class Calculator {}",
+                        python_code="class Calculator:\n    pass\n")
+
+
+class TestStrictModeOrchestrator:
+    """测试严格模式编排器"""
+
+    def test_group_phases(self):
+        """测试测试生成与代码审查归为一组并发执行, skip_tests 时只剩代码审查"""
+        orchestrator = StrictModeOrchestrator(StubLLM(BASE_RESPONSES))
+        sequential = [[AgentPhase.REQUIREMENTS_ANALYSIS], [AgentPhase.ARCHITECTURE_DESIGN],
+                      [AgentPhase.TASK_PLANNING], [AgentPhase.CODE_GENERATION]]
+
+        assert orchestrator._group_phases(skip_tests=False) == sequential + [
+            [AgentPhase.TEST_GENERATION, AgentPhase.CODE_REVIEW]]
+        assert orchestrator._group_phases(skip_tests=True) == sequential + [
+            [AgentPhase.CODE_REVIEW]]
+
+    def test_migrate_strict_skip_tests(self):
+        """测试 skip_tests 时不调用测试生成, 其余阶段照常执行"""
+        llm = StubLLM(BASE_RESPONSES)
+        results = StrictModeOrchestrator(llm).migrate_strict("public class Calculator {}",
+                                                             skip_tests=True)
+
+        assert '测试工程师' not in llm.calls
+        assert results['success'] is True
+        assert results['python_code'].startswith('class Calculator:')
+        assert results['test_code'] is None
+
+    def test_branches_merge_in_workflow_order(self):
+        """测试分支结果按工作流顺序合并, 与各分支完成的先后无关"""
+        review_done = threading.Event()
+
+        def review():
+            review_done.set()
+            raise RuntimeError("review timeout")
+
+        def tests():
+            # 等代码审查先完成, 再以错误结束测试生成
+            assert review_done.wait(5)
+            raise RuntimeError("test timeout")
+
+        llm = StubLLM(dict(BASE_RESPONSES, 测试工程师=tests, 代码审查专家=review))
+        orchestrator = StrictModeOrchestrator(llm)
+        context = code_context()
+        context.errors.append("earlier error")
+
+        context = orchestrator._execute_concurrently(
+            [AgentPhase.TEST_GENERATION, AgentPhase.CODE_REVIEW], context)
+
+        assert context.errors == ["earlier error",
+                                  "TestGeneration: test timeout",
+                                  "CodeReview: review timeout"]
+
+    def test_merge_stops_after_critical_error(self):
+        """测试第一个分支出现严重错误时, 不再合并之后分支的结果"""
+        review = '{"overall_score": 50, "critical_issues": ["unsafe"]}'
+        llm = StubLLM(dict(BASE_RESPONSES, 测试工程师=raise_error("critical: no tests"),
+                           代码审查专家=review))
+        orchestrator = StrictModeOrchestrator(llm)
+
+        context = orchestrator._execute_concurrently(
+            [AgentPhase.TEST_GENERATION, AgentPhase.CODE_REVIEW], code_context())
+
+        assert '代码审查专家' in llm.calls
+        assert context.errors == ["TestGeneration: critical: no tests"]
+        assert context.review_report is None
+        assert context.warnings == []
+
+    def test_python_structure_counts_match_text_scan(self):
+        """测试结构统计与按文本统计 'class ' / 'def ' 的口径一致 (含嵌套类和模块级函数)"""
+        code = ("class Outer:\n"
+                "    def run(self):\n"
+                "        def helper():\n"
+                "            pass\n"
+                "    class Inner:\n"
+                "        async def wait(self):\n"
+                "            pass\n"
+                "def main():\n"
+                "    pass\n")
+        structure = StrictModeOrchestrator(StubLLM(BASE_RESPONSES))._extract_python_structure(code)
+
+        assert [c['name'] for c in structure['classes']] == ['Outer', 'Inner']
+        assert structure['functions'] == ['main', 'helper']
+        assert (sum(len(c['methods']) for c in structure['classes'])
+                + len(structure['functions'])) == code.count('def ')
+
+
+class TestAgentContext:
+    """测试 AgentContext 的分支复制与合并"""
+
+    def test_clone_and_merge_branch(self):
+        """测试只合并分支替换过的字段, 错误/警告追加在原有条目之后"""
+        context = code_context()
+        context.warnings.append("existing")
+        base = context.clone_for_branch()
+        branch = context.clone_for_branch()
+
+        assert branch.errors == [] and branch.warnings == []
+        assert branch.python_code is context.python_code
+
+        branch.test_code = "def test_x():\n    pass\n"
+        branch.warnings.append("from branch")
+        context.merge_branch(base, branch)
+
+        assert context.test_code == "def test_x():\n    pass\n"
+        assert context.python_code == "class Calculator:\n    pass\n"
+        assert context.review_report is None
+        assert context.warnings == ["existing", "from branch"]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
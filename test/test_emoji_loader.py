@@ -0,0 +1,66 @@
+"""
+迁移后的 EmojiLoader 测试用例
+"""
+import io
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# emoji_python 包的 __init__ 目前无法导入, 把包目录加入路径后按顶层模块导入
+sys.path.insert(0, str(Path(__file__).parent.parent / 'emoji_migration' / 'emoji_python'))
+
+import EmojiLoader as emoji_loader_module
+from Emoji import Emoji
+from EmojiLoader import EmojiLoader
+
+EMOJIS_JSON = json.dumps([
+    {"emoji": "😄", "description": "smiling face with open mouth and smiling eyes",
+     "supports_fitzpatrick": False, "aliases": ["smile"], "tags": ["happy", "joy"]},
+    {"emoji": "👍", "description": "thumbs up sign",
+     "supports_fitzpatrick": True, "aliases": ["+1", "thumbsup"], "tags": []},
+    {"description": "entry without an emoji is skipped", "aliases": ["none"]},
+], ensure_ascii=False).encode('utf-8')
+
+
+def _fields(emojis):
+    return [(e.unicode, e.description, e.supports_fitzpatrick, e.aliases, e.tags) for e in emojis]
+
+
+class TestEmojiLoader:
+    """测试 EmojiLoader"""
+
+    def test_load_emojis_with_json(self, monkeypatch):
+        """测试未安装 ijson 时用标准库 json 整体解析"""
+        monkeypatch.setattr(emoji_loader_module, 'ijson', None)
+        emojis = EmojiLoader().load_emojis(io.BytesIO(EMOJIS_JSON))
+
+        assert _fields(emojis) == [
+            ("😄", "smiling face with open mouth and smiling eyes", False, ["smile"], ["happy", "joy"]),
+            ("👍", "thumbs up sign", True, ["+1", "thumbsup"], []),
+        ]
+
+    def test_build_emoji_from_json(self):
+        """测试加载器按 str 传入 unicode 构造 Emoji, 与 Emoji.from_bytes 的结果一致"""
+        emoji = EmojiLoader().build_emoji_from_json(json.loads(EMOJIS_JSON)[0])
+        from_bytes = Emoji.from_bytes(emoji.description, False, ["smile"], ["happy", "joy"],
+                                      "😄".encode('utf-8'))
+
+        assert isinstance(emoji, Emoji)
+        assert emoji.unicode == from_bytes.unicode == "😄"
+        assert emoji.html_decimal == "&#128516;"
+        assert emoji.html_hexadecimal == "&#x1F604;"
+        assert EmojiLoader().build_emoji_from_json({"emoji": ""}) is None
+
+    def test_load_emojis_with_ijson(self, monkeypatch):
+        """测试 ijson 增量解析的结果与标准库 json 一致 (未安装 ijson 时跳过)"""
+        ijson = pytest.importorskip('ijson')
+        monkeypatch.setattr(emoji_loader_module, 'ijson', ijson)
+        streamed = EmojiLoader().load_emojis(io.BytesIO(EMOJIS_JSON))
+
+        monkeypatch.setattr(emoji_loader_module, 'ijson', None)
+        assert _fields(streamed) == _fields(EmojiLoader().load_emojis(io.BytesIO(EMOJIS_JSON)))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
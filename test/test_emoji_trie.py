@@ -0,0 +1,119 @@
+"""
+迁移后的 EmojiTrie 测试用例
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# emoji_python 包的 __init__ 目前无法导入 (EmojiManager 缺少 Emoji 的导入),
+# EmojiTrie.py 本身只依赖标准库, 按路径单独加载
+_spec = importlib.util.spec_from_file_location(
+    'emoji_trie_module',
+    Path(__file__).parent.parent / 'emoji_migration' / 'emoji_python' / 'EmojiTrie.py'
+)
+emoji_trie_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(emoji_trie_module)
+
+EmojiTrie = emoji_trie_module.EmojiTrie
+Emoji = emoji_trie_module.Emoji
+
+# EmojiTrie 按模块级名称选择的可选加速后端
+_BACKENDS = ('marisa_trie', '_c_trie_lookup', 'njit', 'ahocorasick')
+
+_SAMPLE_TEXTS = ["👨", "👨‍👩", "👨‍", "❤", "❤x", "x", "a👨‍👩b❤👨‍c", ""]
+
+
+def _sample_emojis():
+    return [Emoji("👨"), Emoji("👨‍👩"), Emoji("❤"), Emoji("👩")]
+
+
+def _trie_results(emojis):
+    """用当前启用的后端构建 trie, 返回样例文本的 get_emoji 与 find_all 结果"""
+    emoji_trie = EmojiTrie(emojis)
+    return ([emoji_trie.get_emoji(text) for text in _SAMPLE_TEXTS],
+            [emoji_trie.find_all(text) for text in _SAMPLE_TEXTS])
+
+
+def assert_backend_matches_pure(monkeypatch, backend):
+    """只启用 backend 时的结果与纯 Python 实现一致"""
+    module_value = getattr(emoji_trie_module, backend)
+    assert module_value is not None
+    for name in _BACKENDS:
+        monkeypatch.setattr(emoji_trie_module, name, None)
+    emojis = _sample_emojis()
+    expected = _trie_results(emojis)
+
+    monkeypatch.setattr(emoji_trie_module, backend, module_value)
+    assert _trie_results(emojis) == expected
+
+
+class TestEmojiTrie:
+    """测试 EmojiTrie"""
+
+    def test_scan_longest_match(self):
+        """测试 scan 取从指定位置开始的最长 emoji"""
+        man = Emoji("👨")
+        family = Emoji("👨‍👩")
+        emoji_trie = EmojiTrie([man, family])
+
+        assert emoji_trie.scan("a👨‍👩b", 1) == (4, family)
+        assert emoji_trie.scan("a👨‍b", 1) == (2, man)
+        assert emoji_trie.scan("a👨‍👩b", 0) is None
+
+    def test_node_tree_dropped_after_freeze(self):
+        """测试构建完成后不再保留 Node 树, 查找只依赖冻结的数组"""
+        emoji_trie = EmojiTrie(_sample_emojis())
+
+        assert not any(isinstance(value, emoji_trie_module.Node) for value in vars(emoji_trie).values())
+        assert emoji_trie.get_emoji("👨‍👩").unicode == "👨‍👩"
+
+    def test_save_load_round_trip(self, tmp_path):
+        """测试 save 写出 JSON, load 按 unicode 对应回原有的 emoji 对象"""
+        emojis = _sample_emojis() + [Emoji("👍\ud83c\udffb"), Emoji("😀")]
+        path = tmp_path / 'trie.json'
+        EmojiTrie(emojis).save(str(path))
+
+        loaded = EmojiTrie.load(str(path), emojis)
+        assert [loaded.get_emoji(text) for text in _SAMPLE_TEXTS] == _trie_results(emojis)[0]
+        assert loaded.get_emoji("👍\ud83c\udffb") is emojis[4]
+        assert loaded.find_all("x😀") == [(1, 2, emojis[5])]
+
+        with pytest.raises(ValueError):
+            EmojiTrie.load(str(path), emojis[:2])
+
+    def test_cython_lookup_matches_pure_walk(self, tmp_path, monkeypatch):
+        """测试 Cython 扩展的查找结果与纯 Python 遍历一致 (未安装 Cython 时跳过)"""
+        pyximport = pytest.importorskip('pyximport')
+        monkeypatch.syspath_prepend(str(Path(__file__).parent.parent / 'emoji_migration'))
+        pyximport.install(build_dir=str(tmp_path), language_level=3)
+        from _emoji_trie import trie_lookup
+
+        man = Emoji("👨")
+        family = Emoji("👨‍👩")
+        heart = Emoji("❤")
+        emoji_trie = EmojiTrie([man, family, heart])
+        monkeypatch.setattr(emoji_trie_module, 'marisa_trie', None)
+        monkeypatch.setattr(emoji_trie_module, '_c_trie_lookup', None)
+        monkeypatch.setattr(emoji_trie_module, 'njit', None)
+        sequences = ["👨", "👨‍👩", "👨‍", "❤", "❤x", "x"]
+        expected = [emoji_trie._lookup(s) for s in sequences]
+
+        monkeypatch.setattr(emoji_trie_module, '_c_trie_lookup', trie_lookup)
+        assert [emoji_trie._lookup(s) for s in sequences] == expected
+        assert [i >= 0 for i in expected] == [True, True, False, True, False, False]
+
+    def test_numba_backend_matches_pure_walk(self, monkeypatch):
+        """测试 numba 内核的查找与扫描结果与纯 Python 实现一致 (未安装 numba 时跳过)"""
+        pytest.importorskip('numba')
+        assert_backend_matches_pure(monkeypatch, 'njit')
+
+    def test_marisa_backend_matches_pure_walk(self, monkeypatch):
+        """测试 marisa-trie 的精确查找结果与纯 Python 实现一致 (未安装 marisa-trie 时跳过)"""
+        pytest.importorskip('marisa_trie')
+        assert_backend_matches_pure(monkeypatch, 'marisa_trie')
+
+    def test_ahocorasick_backend_matches_pure_walk(self, monkeypatch):
+        """测试 pyahocorasick 自动机的 find_all 结果与纯 Python 实现一致 (未安装时跳过)"""
+        pytest.importorskip('ahocorasick')
+        assert_backend_matches_pure(monkeypatch, 'ahocorasick')